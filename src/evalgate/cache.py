@@ -1,46 +1,237 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Optional
-
-CACHE_PATH = Path('.evalgate/cache.json')
-_cache: Dict[str, str] | None = None
-
-def _load() -> Dict[str, str]:
-    global _cache
-    if _cache is None:
-        if CACHE_PATH.exists():
-            try:
-                _cache = json.loads(CACHE_PATH.read_text(encoding='utf-8'))
-            except Exception:
-                _cache = {}
-        else:
-            _cache = {}
-    return _cache
-
-def _save() -> None:
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+CACHE_PATH = Path('.evalgate/cache.db')
+LEGACY_PATH = Path('.evalgate/cache.json')  # v1 cache from earlier releases; its keys never match, only cleared
+FLUSH_EVERY = 500  # pending writes kept in memory before an intermediate flush
+KEY_VERSION = 2  # v1 hashed only model and prompt
+
+_conn: sqlite3.Connection | None = None
+_conn_path: Path | None = None
+_pending: Dict[str, str] = {}
+_touched: set[str] = set()  # keys read since the last flush, for LRU bookkeeping
+_lock = threading.RLock()  # judge calls may run on a thread pool
+
+_UPSERT = (
+    'INSERT INTO responses (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?) '
+    'ON CONFLICT(key) DO UPDATE SET accessed_at = excluded.accessed_at '
+    'WHERE excluded.accessed_at > responses.accessed_at'
+)
+
+def _init_schema(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS responses ('
+        'key TEXT PRIMARY KEY, response TEXT NOT NULL, '
+        'created_at REAL NOT NULL DEFAULT 0, accessed_at REAL NOT NULL DEFAULT 0)'
+    )
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(responses)')}
+    now = time.time()
+    for column in ('created_at', 'accessed_at'):
+        if column not in columns:
+            conn.execute(f'ALTER TABLE responses ADD COLUMN {column} REAL NOT NULL DEFAULT 0')
+            conn.execute(f'UPDATE responses SET {column} = ?', (now,))
+    conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)')
+    conn.execute('CREATE INDEX IF NOT EXISTS responses_created ON responses (created_at)')
+    conn.commit()
+
+def _connect() -> sqlite3.Connection:
+    """Open (or reuse) the SQLite cache."""
+    global _conn, _conn_path
+    if _conn is not None and _conn_path == CACHE_PATH:
+        return _conn
+    if _conn is not None:
+        close()
     CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    CACHE_PATH.write_text(json.dumps(_load(), indent=2), encoding='utf-8')
+    conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    _init_schema(conn)
+    _conn, _conn_path = conn, CACHE_PATH
+    return conn
+
+def _read_rows(path: Path) -> Iterator[Tuple[str, str, float, float]]:
+    """Yield ``(key, response, created_at, accessed_at)`` from any cache file.
+
+    Accepts SQLite caches and JSONL exports.
+    """
+    now = time.time()
+    if path.suffix == '.jsonl':
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    rec = json.loads(line)
+                    yield (rec['key'], rec['response'],
+                           rec.get('created_at', now), rec.get('accessed_at', now))
+        return
+    src = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        columns = {row[1] for row in src.execute('PRAGMA table_info(responses)')}
+        created = 'created_at' if 'created_at' in columns else str(now)
+        accessed = 'accessed_at' if 'accessed_at' in columns else str(now)
+        yield from src.execute(f'SELECT key, response, {created}, {accessed} FROM responses')
+    finally:
+        src.close()
+
+def _key(model: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Hash every request parameter that can change the judge response.
+
+    Bump ``KEY_VERSION`` whenever the key layout changes so stale entries
+    are never matched.
+    """
+    payload = {'v': KEY_VERSION, 'model': model, 'prompt': prompt, 'params': params or {}}
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    ).hexdigest()
 
-def _key(model: str, prompt: str) -> str:
-    h = hashlib.sha256()
-    h.update(model.encode('utf-8'))
-    h.update(b'\x00')
-    h.update(prompt.encode('utf-8'))
-    return h.hexdigest()
+def get(model: str, prompt: str, **params: Any) -> Optional[str]:
+    key = _key(model, prompt, params)
+    with _lock:
+        if key in _pending:
+            return _pending[key]
+        row = _connect().execute('SELECT response FROM responses WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        _touched.add(key)
+        return row[0]
 
-def get(model: str, prompt: str) -> Optional[str]:
-    return _load().get(_key(model, prompt))
+def set(model: str, prompt: str, response: str, **params: Any) -> None:
+    with _lock:
+        _pending[_key(model, prompt, params)] = response
+        if len(_pending) >= FLUSH_EVERY:
+            flush()
 
-def set(model: str, prompt: str, response: str) -> None:
-    cache = _load()
-    cache[_key(model, prompt)] = response
-    _save()
+def _write_pending(conn: sqlite3.Connection) -> None:
+    now = time.time()
+    with conn:
+        conn.executemany(
+            'INSERT OR REPLACE INTO responses (key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+            ((k, v, now, now) for k, v in _pending.items()),
+        )
+        conn.executemany(
+            'UPDATE responses SET accessed_at = ? WHERE key = ?',
+            ((now, k) for k in _touched),
+        )
+    _pending.clear()
+    _touched.clear()
+
+def flush() -> None:
+    """Write pending responses and access times in a single transaction."""
+    with _lock:
+        if _pending or _touched:
+            _write_pending(_connect())
+
+def close() -> None:
+    """Flush, fold the WAL back into the database file and close it."""
+    global _conn, _conn_path
+    with _lock:
+        if _pending or _touched:
+            _write_pending(_conn if _conn is not None else _connect())
+        if _conn is None:
+            return
+        _conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        _conn.close()
+        _conn = _conn_path = None
 
 def clear() -> None:
-    global _cache
-    _cache = {}
-    if CACHE_PATH.exists():
-        CACHE_PATH.unlink()
+    global _conn, _conn_path
+    with _lock:
+        _pending.clear()
+        _touched.clear()
+        if _conn is not None:
+            _conn.close()
+            _conn = _conn_path = None
+        for path in (CACHE_PATH, Path(f'{CACHE_PATH}-wal'), Path(f'{CACHE_PATH}-shm'), LEGACY_PATH):
+            if path.exists():
+                path.unlink()
+
+def prune(max_entries: Optional[int] = None, max_age_days: Optional[float] = None) -> int:
+    """Evict expired entries, then least recently used ones above ``max_entries``.
+
+    Returns the number of entries removed.
+    """
+    with _lock:
+        flush()
+        conn = _connect()
+        before = conn.total_changes
+        with conn:
+            if max_age_days is not None:
+                cutoff = time.time() - max_age_days * 86400
+                conn.execute('DELETE FROM responses WHERE created_at < ?', (cutoff,))
+            if max_entries is not None:
+                conn.execute(
+                    'DELETE FROM responses WHERE key IN ('
+                    'SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                    (max_entries,),
+                )
+        removed = conn.total_changes - before
+        if removed:
+            conn.execute('VACUUM')
+        return removed
+
+def merge(sources: Iterable[str | Path]) -> int:
+    """Merge other caches (e.g. from parallel CI jobs) into this one.
+
+    Existing entries keep their stored response; only their access time moves
+    forward when the source saw them more recently. Returns the number of
+    entries added.
+    """
+    with _lock:
+        flush()
+        conn = _connect()
+        before = conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        for source in sources:
+            with conn:
+                conn.executemany(_UPSERT, _read_rows(Path(source)))
+        return conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0] - before
+
+def export(dest: str | Path) -> int:
+    """Write every entry to ``dest`` as JSON lines and return the count."""
+    with _lock:
+        flush()
+        rows = _connect().execute(
+            'SELECT key, response, created_at, accessed_at FROM responses ORDER BY key'
+        )
+        count = 0
+        path = Path(dest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for key, response, created_at, accessed_at in rows:
+                f.write(json.dumps({
+                    'key': key,
+                    'response': response,
+                    'created_at': created_at,
+                    'accessed_at': accessed_at,
+                }, ensure_ascii=False) + '\n')
+                count += 1
+        return count
+
+def stats() -> Dict[str, Any]:
+    """Return entry count, on-disk size and age range of the cache."""
+    with _lock:
+        flush()
+        entries, oldest, newest, last_used = _connect().execute(
+            'SELECT COUNT(*), MIN(created_at), MAX(created_at), MAX(accessed_at) FROM responses'
+        ).fetchone()
+        size = sum(
+            p.stat().st_size
+            for p in (CACHE_PATH, Path(f'{CACHE_PATH}-wal'))
+            if p.exists()
+        )
+        return {
+            'path': str(CACHE_PATH),
+            'entries': entries,
+            'size_bytes': size,
+            'oldest': oldest,
+            'newest': newest,
+            'last_used': last_used,
+        }
+
+atexit.register(close)
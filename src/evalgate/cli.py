@@ -6,32 +6,40 @@ import os
 import pathlib
 import random
 import subprocess
+import time
 import urllib.error
+from functools import partial
 import urllib.request
 import yaml
 import typer
 from pydantic import ValidationError
 from rich import print as rprint
 
-from .config import Config
-from .evaluators.base import registry
+from .config import Config, EvaluatorType
+from .evaluators.base import ITEM_PASS_SCORE, ItemResult, collect_results, registry
 from .evaluators import (
     category_match as _category_match,  # noqa: F401
     embedding_similarity as _embedding_similarity,  # noqa: F401
     json_schema as _json_schema,  # noqa: F401
     latency_cost as _latency_cost,  # noqa: F401
-    llm_judge as _llm_judge,  # noqa: F401
+    llm_judge as _llm_judge,
     regex_match as _regex_match,  # noqa: F401
     rouge_bleu as _rouge_bleu,  # noqa: F401
     required_fields as _required_fields,  # noqa: F401
     classification_metrics as _classification_metrics,  # noqa: F401
     conversation_flow as _conversation_flow,  # noqa: F401
+    tool_usage as _tool_usage,  # noqa: F401
+    workflow_dag as _workflow_dag,  # noqa: F401
 )
-from .util import list_paths, read_json, write_json
+from .util import read_json, write_json
+from . import item_store
 from .fixture_generator import generate_suite
-from .store import load_baseline
+from .store import commit_baseline, index_scores, item_flips, load_baseline, resolve_ref
 from .report import render_markdown
-from . import cache
+from .scheduler import run_evaluators
+from .shard import merge_partials, parse_shard, select_shard
+from .sources import load_pairs
+from . import cache, history, ledger, stats
 from .templates import (
     load_default_config,
     load_schema_example, 
@@ -86,35 +94,48 @@ def generate_fixtures(
         write_json(outdir / f"fixture_{i:03}.json", fx)
     rprint(f"[green]Generated {count} fixture(s) in {outdir}[/green]")
 
+def _load_config(config: str) -> Config:
+    try:
+        return Config.model_validate(yaml.safe_load(pathlib.Path(config).read_text(encoding="utf-8")))
+    except ValidationError as e:
+        rprint("[red]Invalid config:[/red]", e)
+        raise typer.Exit(2)
+
 @app.command()
 def run(config: str = typer.Option(..., help="Path to evalgate YAML"),
         output: str = typer.Option(".evalgate/results.json", help="Where to write results JSON"),
-        clear_cache: bool = typer.Option(False, "--clear-cache", help="Clear cached LLM responses before run")):
+        clear_cache: bool = typer.Option(False, "--clear-cache", help="Clear cached LLM responses before run"),
+        jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Run up to N evaluators concurrently"),
+        shard: str | None = typer.Option(None, "--shard", help="Evaluate only shard i of N (e.g. 3/8) and write partial results"),
+        incremental: bool = typer.Option(False, "--incremental", help="Reuse ledger results for unchanged fixture/output pairs")):
     """Run evals and write a results artifact."""
     if clear_cache:
         cache.clear()
-    try:
-        cfg = Config.model_validate(yaml.safe_load(pathlib.Path(config).read_text(encoding="utf-8")))
-    except ValidationError as e:
-        rprint("[red]Invalid config:[/red]", e)
-        raise typer.Exit(2)
+    cfg = _load_config(config)
+    shard_spec = None
+    if shard:
+        try:
+            shard_spec = parse_shard(shard)
+        except ValueError as e:
+            rprint(f"[red]{e}[/red]")
+            raise typer.Exit(2)
 
-    fixture_paths = list_paths(cfg.fixtures.path)
-    output_paths = list_paths(cfg.outputs.path)
-    fixtures = {pathlib.Path(p).stem: read_json(p) for p in fixture_paths}
-    outputs  = {pathlib.Path(p).stem: read_json(p) for p in output_paths}
+    if cfg.cache.max_age_days is not None:
+        cache.prune(max_age_days=cfg.cache.max_age_days)
 
-    names = sorted(set(fixtures.keys()) & set(outputs.keys()))
-    f_map = {n: fixtures[n] for n in names}
-    o_map = {n: outputs[n] for n in names}
+    select = None
+    if shard_spec is not None:
+        select = partial(select_shard, index=shard_spec[0], count=shard_spec[1])
+    try:
+        f_map, o_map = load_pairs(cfg.fixtures, cfg.outputs, select=select)
+    except ValueError as e:
+        rprint(f"[red]{e}[/red]")
+        raise typer.Exit(2)
 
-    scores = []
-    failures = []
+    records = []
     evaluator_errors = []  # Track configuration/runtime errors separately
-    latency = cost = None
-    tables: list[dict[str, object]] = []
-    plots: list[dict[str, str]] = []
 
+    jobs_to_run = []
     for ev in cfg.evaluators:
         if not ev.enabled:
             continue
@@ -123,12 +144,49 @@ def run(config: str = typer.Option(..., help="Path to evalgate YAML"),
         if func is None:
             rprint(f"[yellow]Unknown evaluator type: {ev.type}[/yellow]")
             continue
-        try:
-            s, v, extra = func(cfg, ev, o_map, f_map)
-        except Exception as e:
-            rprint(f"[red]{ev.type} evaluator {ev.name} failed: {e}[/red]")
-            evaluator_errors.append(f"Evaluator '{ev.name}' failed to run: {str(e)}")
+        if incremental:
+            func = partial(ledger.run_incremental, func)
+        jobs_to_run.append((ev, func))
+
+    outcomes = run_evaluators(cfg, jobs_to_run, o_map, f_map, workers=jobs)
+    for (ev, _), (outcome, error) in zip(jobs_to_run, outcomes):
+        if error is not None:
+            rprint(f"[red]{ev.type} evaluator {ev.name} failed: {error}[/red]")
+            evaluator_errors.append(f"Evaluator '{ev.name}' failed to run: {str(error)}")
             continue
+        s, v, extra = outcome
+        records.append({"name": ev.name, "score": float(s), "failures": v, "extra": extra})
+
+    _llm_judge.close_clients()
+    if incremental:
+        ledger.prune()
+    if cfg.cache.max_entries is not None:
+        cache.prune(max_entries=cfg.cache.max_entries)
+    cache.close()
+
+    if shard_spec is not None:
+        write_json(output, {
+            "shard": {"index": shard_spec[0], "count": shard_spec[1], "items": len(f_map)},
+            "evaluators": records,
+            "evaluator_errors": evaluator_errors,
+        })
+        rprint(f"[green]Wrote partial results for shard {shard} ({len(f_map)} items) to {output}[/green]")
+        return
+
+    _gate(cfg, records, evaluator_errors, output)
+
+def _gate(cfg: Config, records: list[dict], evaluator_errors: list[str], output: str) -> None:
+    """Aggregate evaluator records, compare with the baseline and apply the gate."""
+    by_name = {ev.name: ev for ev in cfg.evaluators}
+    scores = []
+    failures = []
+    latency = cost = None
+    tables: list[dict[str, object]] = []
+    plots: list[dict[str, str]] = []
+    item_results = []
+    for rec in records:
+        ev = by_name[rec["name"]]
+        s, v, extra = rec["score"], rec["failures"], rec["extra"]
         if extra.get("latency") is not None:
             latency = extra["latency"]
         if extra.get("cost") is not None:
@@ -145,28 +203,52 @@ def run(config: str = typer.Option(..., help="Path to evalgate YAML"),
         }
         if extra.get("metrics") is not None:
             score_item["metrics"] = extra["metrics"]
+        items = extra.get("items") or {}
+        if items:
+            score_item["items"] = items
+            if cfg.gate.significance and abs(sum(items.values()) / len(items) - s) <= 1e-9:
+                # the score is the mean item score, so it can be bootstrapped
+                score_item["ci"] = stats.score_ci(items, cfg.gate.confidence, cfg.gate.resamples)
         score_item["passed"] = True if ev.min_score is None else s >= ev.min_score
         scores.append(score_item)
         failures.extend(v)
+        item_results.extend(collect_results(ev.name, items, v, extra.get("results")))
         if not score_item["passed"]:
-            failures.append(
-                f"{ev.name}: score {s:.2f} < min_score {ev.min_score}"
-            )
+            message = f"score {s:.2f} < min_score {ev.min_score}"
+            failures.append(f"{ev.name}: {message}")
+            item_results.append(ItemResult("", float(s), False, message, ev.name))
 
     total_w = sum(x["weight"] for x in scores) or 1.0
     overall = sum(x["score"] * x["weight"] for x in scores) / total_w
 
-    baseline = load_baseline(cfg.baseline.ref, cfg.report.artifact_path) or {}
+    baseline = index_scores(load_baseline(cfg.baseline.ref, cfg.report.artifact_path))
     deltas = {}
-    if baseline.get("scores"):
-        for x in scores:
-            prev = next((s["score"] for s in baseline["scores"] if s["name"] == x["name"]), None)
-            if prev is not None:
-                deltas[x["name"]] = x["score"] - prev
+    delta_cis = {}
+    flips = {}
+    for x in scores:
+        prev = baseline.get(x["name"])
+        if prev is None:
+            continue
+        deltas[x["name"]] = x["score"] - prev["score"]
+        if x.get("items") and prev.get("items"):
+            if x.get("ci") is not None:
+                delta_cis[x["name"]] = stats.delta_ci(
+                    x["items"], prev["items"], cfg.gate.confidence, cfg.gate.resamples
+                )
+            ev = by_name[x["name"]]
+            threshold = ev.threshold if ev.type == EvaluatorType.EMBEDDING else ITEM_PASS_SCORE
+            flips[x["name"]] = item_flips(x["items"], prev["items"], threshold)
 
     regression_ok = True
     if deltas and not cfg.gate.allow_regression:
-        regression_ok = all((d >= -1e-6) for d in deltas.values())
+        for name, d in deltas.items():
+            if d >= -1e-6:
+                continue
+            ci = delta_cis.get(name)
+            if cfg.gate.significance and ci is not None and ci[1] >= 0:
+                rprint(f"[yellow]{name}: drop of {-d:.4f} is within noise (CI {ci[0]:+.4f}..{ci[1]:+.4f})[/yellow]")
+                continue
+            regression_ok = False
 
     # Fail the gate if any evaluators failed to run
     evaluators_ok = len(evaluator_errors) == 0
@@ -188,10 +270,18 @@ def run(config: str = typer.Option(..., help="Path to evalgate YAML"),
             "delta": deltas.get(x["name"]),
             "passed": x["passed"],
         }
+        if x.get("ci") is not None:
+            item["ci"] = x["ci"]
+        if delta_cis.get(x["name"]) is not None:
+            item["delta_ci"] = delta_cis[x["name"]]
+        if x["name"] in flips:
+            item["flips"] = flips[x["name"]]
         if x.get("min_score") is not None:
             item["min_score"] = x["min_score"]
         if "metrics" in x:
             item["metrics"] = x["metrics"]
+        if "items" in x:
+            item["items"] = x["items"]
         score_items.append(item)
     result = {
         "overall": overall,
@@ -203,6 +293,8 @@ def run(config: str = typer.Option(..., help="Path to evalgate YAML"),
         "gate": {
             "min_overall_score": cfg.gate.min_overall_score,
             "allow_regression": cfg.gate.allow_regression,
+            "significance": cfg.gate.significance,
+            "confidence": cfg.gate.confidence,
             "passed": passed,
         },
         "regression_ok": regression_ok,
@@ -212,6 +304,14 @@ def run(config: str = typer.Option(..., help="Path to evalgate YAML"),
         "tables": tables,
         "plots": plots,
     }
+    sidecar = item_store.sidecar_path(output)
+    item_store.write(sidecar, item_results)
+    result["items_path"] = sidecar.name  # relative to the results JSON
+
+    if cfg.report.history:
+        history.record(result, resolve_ref("HEAD"))
+        names = [history.OVERALL] + [x["name"] for x in score_items]
+        plots.extend(history.plots(names, cfg.report.history_window))
 
     write_json(output, result)
     if not passed:
@@ -220,32 +320,120 @@ def run(config: str = typer.Option(..., help="Path to evalgate YAML"),
     else:
         rprint("[green]EvalGate PASSED[/green]")
 
+@app.command()
+def merge(partials: list[str] = typer.Argument(..., help="Partial results written by 'run --shard'"),
+          config: str = typer.Option(..., help="Path to evalgate YAML"),
+          output: str = typer.Option(".evalgate/results.json", help="Where to write results JSON")):
+    """Merge sharded partial results, then apply the gate and baseline comparison."""
+    cfg = _load_config(config)
+    try:
+        records, evaluator_errors = merge_partials(cfg, [read_json(p) for p in partials])
+    except ValueError as e:
+        rprint(f"[red]{e}[/red]")
+        raise typer.Exit(2)
+    _gate(cfg, records, evaluator_errors, output)
+
 baseline_app = typer.Typer(help="Manage baseline results", no_args_is_help=True)
 app.add_typer(baseline_app, name="baseline")
 
 @baseline_app.command("update")
 def baseline_update(config: str = typer.Option(..., help="Path to evalgate YAML"),
-                    message: str = typer.Option("Update EvalGate baseline", help="Commit message")):
+                    message: str = typer.Option("Update EvalGate baseline", help="Commit message"),
+                    allow_failing: bool = typer.Option(
+                        False, "--allow-failing",
+                        help="Record results that fail the gate (never when an evaluator errored)",
+                    )):
     """Run evals and commit results to the baseline ref."""
     try:
         cfg = Config.model_validate(yaml.safe_load(pathlib.Path(config).read_text(encoding="utf-8")))
     except ValidationError as e:
         rprint("[red]Invalid config:[/red]", e)
         raise typer.Exit(2)
-    typer.invoke(run, config=config, output=cfg.report.artifact_path)
-    ref = cfg.baseline.ref
-    artifact = cfg.report.artifact_path
-    remote, branch = (ref.split("/", 1) if "/" in ref else (None, ref))
-    current = subprocess.check_output(["git", "rev-parse", "--abbrev-ref", "HEAD"], text=True).strip()
-    if remote:
-        subprocess.check_call(["git", "fetch", remote, branch])
-    subprocess.check_call(["git", "checkout", branch])
-    subprocess.check_call(["git", "add", artifact])
-    subprocess.check_call(["git", "commit", "-m", message])
-    if remote:
-        subprocess.check_call(["git", "push", remote, branch])
-    subprocess.check_call(["git", "checkout", current])
-    rprint(f"[green]Committed {artifact} to {ref}[/green]")
+    try:
+        run(config=config, output=cfg.report.artifact_path, clear_cache=False, jobs=1, shard=None, incremental=False)
+    except typer.Exit as e:
+        if e.exit_code != 1 or not allow_failing:
+            rprint("[red]Baseline not updated: the evaluation failed[/red]")
+            raise
+        if read_json(cfg.report.artifact_path).get("evaluator_errors"):
+            # a crashed evaluator would drop out of the baseline and never be compared again
+            rprint("[red]Baseline not updated: evaluators failed to run[/red]")
+            raise
+        rprint("[yellow]Recording the failing results as the new baseline[/yellow]")
+    try:
+        commit = commit_baseline(cfg.baseline.ref, cfg.report.artifact_path, message)
+    except subprocess.CalledProcessError as e:
+        rprint(f"[red]git {e.cmd[1]} failed: {e.stderr.decode('utf-8', 'replace').strip()}[/red]")
+        raise typer.Exit(1)
+    rprint(f"[green]Committed {cfg.report.artifact_path} to {cfg.baseline.ref} ({commit[:12]})[/green]")
+
+@app.command("history")
+def history_cmd(evaluator: str = typer.Option(history.OVERALL, "--evaluator", "-e", help="Evaluator name, or 'overall'"),
+                limit: int = typer.Option(20, "--limit", "-n", min=1, help="Number of most recent commits to show")):
+    """Show how a score moved over recent commits recorded in the history store."""
+    points = history.series(evaluator, limit)
+    if not points:
+        rprint(f"[yellow]No history for {evaluator} (enable report.history to record runs)[/yellow]")
+        raise typer.Exit(1)
+    prev = None
+    for commit, score in points:
+        delta = "" if prev is None else f" ({score - prev:+.3f})"
+        rprint(f"{(commit or 'unknown')[:12]:<12}  {score:.3f}{delta}")
+        prev = score
+
+cache_app = typer.Typer(help="Manage the LLM response cache", no_args_is_help=True)
+app.add_typer(cache_app, name="cache")
+
+_cache_path_option = typer.Option(str(cache.CACHE_PATH), "--path", help="Cache database path")
+
+@cache_app.command("stats")
+def cache_stats(path: str = _cache_path_option):
+    """Show entry count, size and age of the cache."""
+    cache.CACHE_PATH = pathlib.Path(path)
+    info = cache.stats()
+    cache.close()
+    rprint(f"{info['path']}: {info['entries']} entries, {info['size_bytes'] / 1024:.1f} KiB")
+    if info["entries"]:
+        now = time.time()
+        rprint(f"- oldest entry: {(now - info['oldest']) / 86400:.1f} days old")
+        rprint(f"- newest entry: {(now - info['newest']) / 86400:.1f} days old")
+        rprint(f"- last used: {(now - info['last_used']) / 86400:.1f} days ago")
+
+@cache_app.command("prune")
+def cache_prune(path: str = _cache_path_option,
+                max_entries: int | None = typer.Option(None, help="Keep at most this many most recently used entries"),
+                max_age_days: float | None = typer.Option(None, help="Drop entries created more than this many days ago"),
+                config: str | None = typer.Option(None, help="Read limits from the cache section of an evalgate YAML")):
+    """Evict expired and least recently used entries."""
+    if config:
+        cfg = Config.model_validate(yaml.safe_load(pathlib.Path(config).read_text(encoding="utf-8")))
+        max_entries = max_entries if max_entries is not None else cfg.cache.max_entries
+        max_age_days = max_age_days if max_age_days is not None else cfg.cache.max_age_days
+    if max_entries is None and max_age_days is None:
+        rprint("[yellow]Nothing to prune: pass --max-entries/--max-age-days or --config[/yellow]")
+        raise typer.Exit(2)
+    cache.CACHE_PATH = pathlib.Path(path)
+    removed = cache.prune(max_entries=max_entries, max_age_days=max_age_days)
+    cache.close()
+    rprint(f"[green]Removed {removed} cache entries[/green]")
+
+@cache_app.command("merge")
+def cache_merge(sources: list[str] = typer.Argument(..., help="Cache files (.db or .jsonl) to merge in"),
+                path: str = _cache_path_option):
+    """Merge caches produced by other jobs into the local cache."""
+    cache.CACHE_PATH = pathlib.Path(path)
+    added = cache.merge(sources)
+    cache.close()
+    rprint(f"[green]Merged {len(sources)} cache(s), {added} new entries[/green]")
+
+@cache_app.command("export")
+def cache_export(dest: str = typer.Argument(..., help="Destination JSONL file"),
+                 path: str = _cache_path_option):
+    """Export all cache entries as JSON lines."""
+    cache.CACHE_PATH = pathlib.Path(path)
+    count = cache.export(dest)
+    cache.close()
+    rprint(f"[green]Exported {count} entries to {dest}[/green]")
 
 @app.command()
 def report(
@@ -261,7 +449,10 @@ def report(
 ):
     """Render a markdown summary from results."""
     data = read_json(artifact)
-    md = render_markdown(data, max_failures=max_failures)
+    sidecar = pathlib.Path(artifact).parent / data.get('items_path', '')
+    has_sidecar = bool(data.get('items_path')) and sidecar.is_file()
+    records = item_store.iterate(sidecar, passed=False) if has_sidecar else None
+    md = render_markdown(data, max_failures=max_failures, records=records)
     if summary and "GITHUB_STEP_SUMMARY" in os.environ:
         pathlib.Path(os.environ["GITHUB_STEP_SUMMARY"]).write_text(md, encoding="utf-8")
     else:
@@ -274,13 +465,18 @@ def report(
             rprint('[yellow]Missing GITHUB_TOKEN, GITHUB_SHA, or GITHUB_REPOSITORY for check run[/yellow]')
         else:
             annotations = []
-            for fail in data.get('failures', [])[:50]:
-                path = ''
-                msg = fail
-                if ':' in fail:
-                    name, msg_part = fail.split(':', 1)
-                    path = f'eval/fixtures/{name}.json'
-                    msg = msg_part.strip()
+            if has_sidecar:
+                failed = [
+                    (r.item.partition('[')[0], r.message)
+                    for r in item_store.query(sidecar, passed=False, limit=50)
+                ]
+            else:
+                failed = [
+                    tuple(part.strip() for part in fail.split(':', 1)) if ':' in fail else ('', fail)
+                    for fail in data.get('failures', [])[:50]
+                ]
+            for name, msg in failed:
+                path = f'eval/fixtures/{name}.json' if name else ''
                 annotations.append({
                     'path': path,
                     'start_line': 1,
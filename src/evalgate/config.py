@@ -8,12 +8,28 @@ from pydantic import BaseModel, Field, field_validator
 class Budgets(BaseModel):
     p95_latency_ms: int = Field(..., ge=1)
     max_cost_usd_per_item: float = Field(..., ge=0)
+    latency_ms: Dict[str, float] = {}  # extra latency percentile budgets, e.g. {"p50": 300, "p99": 2500}
+    cost_usd: Dict[str, float] = {}  # per-item cost percentile budgets, e.g. {"p90": 0.02}
+
+    @field_validator("latency_ms", "cost_usd")
+    @classmethod
+    def _check_percentiles(cls, v):
+        for key in v:
+            try:
+                ok = key.startswith("p") and 0 <= float(key[1:]) <= 100
+            except ValueError:
+                ok = False
+            if not ok:
+                raise ValueError(f"budget keys must be percentiles such as p50 or p99.9, got {key!r}")
+        return v
 
 class Fixtures(BaseModel):
-    path: str  # glob
+    path: str  # glob of JSON files, or of JSONL/NDJSON files (optionally .gz)
+    key_field: str = "id"  # item name field in JSONL records
 
 class Outputs(BaseModel):
-    path: str  # glob
+    path: str  # glob of JSON files, or of JSONL/NDJSON files (optionally .gz)
+    key_field: str = "id"  # item name field in JSONL records
 
 
 class EvaluatorType(str, Enum):
@@ -41,10 +57,21 @@ class EvaluatorCfg(BaseModel):
     expected_final_field: Optional[str] = None
     max_turns: Optional[int] = None
     threshold: Optional[float] = 0.8  # cosine similarity threshold for embedding evaluator
+    batch_size: Optional[int] = Field(64, ge=1)  # texts per encode call for embedding evaluator
+    vector_cache: Optional[bool] = True  # persist embedding vectors under .evalgate/vectors
+    backend: Optional[str] = None  # embedding backend: "torch" (default) | "onnx"
+    quantize: Optional[bool] = False  # int8 dynamic quantization for the onnx backend
+    num_threads: Optional[int] = Field(None, ge=1)  # intra-op CPU threads for embedding inference
     metric: Optional[str] = None  # metric for rouge_bleu evaluator: "bleu" | "rouge1" | "rouge2" | "rougeL"
+    metrics: Optional[List[str]] = None  # several rouge_bleu metrics in one pass; the first drives the score
+    workers: Optional[int] = Field(None, ge=1)  # worker processes for rouge_bleu and schema evaluators
     pattern_field: Optional[str] = None  # name of expected field containing regex
     pattern_path: Optional[str] = None  # path to JSON mapping of name->regex
+    regex_flags: Optional[List[str]] = None  # re flag names for regex evaluator, e.g. ["IGNORECASE", "MULTILINE"]
+    regex_timeout: Optional[float] = Field(None, gt=0)  # per-match time limit (seconds) for regex evaluator
+    regex_engine: Optional[str] = None  # regex evaluator engine: "re" (default) | "re2" (linear time, RE2 semantics)
     multi_label: Optional[bool] = False  # treat field as list of labels
+    top_confusions: int = Field(20, ge=1)  # confused label pairs reported once a taxonomy is too big for a full matrix
     expected_tool_calls: Optional[Dict[str, List[Dict[str, Any]]]] = None  # expected tool call sequence
     # LLM-specific fields
     provider: Optional[str] = None  # "openai" | "anthropic" | "azure" | "local"
@@ -56,6 +83,9 @@ class EvaluatorCfg(BaseModel):
     max_tokens: Optional[int] = 1000  # response length limit
     transcript_field: Optional[str] = None  # field with conversation transcript
     per_turn_scoring: Optional[bool] = False  # score each turn individually
+    concurrency: Optional[int] = Field(1, ge=1)  # max judge calls in flight for llm evaluator
+    timeout: Optional[float] = Field(None, gt=0)  # per-request timeout (seconds) for llm provider calls
+    max_connections: Optional[int] = Field(None, ge=1)  # HTTP pool size of the shared llm provider client
     workflow_path: Optional[str] = None  # path to JSON or YAML workflow DAG spec
     enabled: bool = True
 
@@ -82,14 +112,23 @@ class EvaluatorCfg(BaseModel):
 class Gate(BaseModel):
     min_overall_score: float = 0.9
     allow_regression: bool = False
+    significance: bool = False  # only fail on drops whose bootstrap CI lies entirely below zero
+    confidence: float = Field(0.95, gt=0, lt=1)  # confidence level of score and delta intervals
+    resamples: int = Field(2000, ge=100)  # bootstrap resamples per interval
 
 class ReportCfg(BaseModel):
     pr_comment: bool = True
     artifact_path: str = ".evalgate/results.json"
+    history: bool = False  # append each run to .evalgate/history.db and plot score trends
+    history_window: int = Field(200, ge=2)  # most recent commits shown in trend plots
 
 class BaselineCfg(BaseModel):
     ref: str = "origin/main"
 
+class CacheCfg(BaseModel):
+    max_entries: Optional[int] = Field(None, ge=0)  # LRU cap on cached LLM responses
+    max_age_days: Optional[float] = Field(None, gt=0)  # expire responses older than this
+
 class TelemetryCfg(BaseModel):
     mode: str = "local_only"  # "local_only" | "metrics_only"
 
@@ -102,4 +141,5 @@ class Config(BaseModel):
     report: ReportCfg = ReportCfg()
     baseline: BaselineCfg = BaselineCfg()
     telemetry: TelemetryCfg = TelemetryCfg()
+    cache: CacheCfg = CacheCfg()
 
@@ -0,0 +1,154 @@
+"""Label-encoded confusion counts shared by the label evaluators."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+DENSE_MAX_LABELS = 12  # larger taxonomies render only their most confused pairs
+
+
+class Confusion:
+    """Sparse confusion matrix over integer-encoded labels.
+
+    Each label gets an id on first sight; (expected, predicted) id pairs are
+    aggregated with NumPy on demand, so memory grows with the number of
+    distinct pairs seen rather than with the square of the label count.
+    """
+
+    def __init__(self) -> None:
+        self.labels: List[Hashable] = []
+        self._ids: Dict[Hashable, int] = {}
+        self._exp: List[int] = []
+        self._pred: List[int] = []
+        self._counts: List[int] = []
+
+    def _id(self, label: Hashable) -> int:
+        i = self._ids.get(label)
+        if i is None:
+            i = self._ids[label] = len(self.labels)
+            self.labels.append(label)
+        return i
+
+    def add(self, expected: Hashable, predicted: Hashable, count: int = 1) -> None:
+        self._exp.append(self._id(expected))
+        self._pred.append(self._id(predicted))
+        self._counts.append(count)
+
+    def update(self, nested: Dict[Any, Dict[Any, int]]) -> None:
+        """Add counts in ``{expected: {predicted: count}}`` form."""
+        for exp, preds in nested.items():
+            for pred, count in preds.items():
+                self.add(exp, pred, count)
+
+    @classmethod
+    def from_dict(cls, nested: Dict[Any, Dict[Any, int]]) -> "Confusion":
+        confusion = cls()
+        confusion.update(nested)
+        return confusion
+
+    def cells(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(expected ids, predicted ids, counts)`` of non-empty cells."""
+        n = len(self.labels)
+        if not n:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+        codes = np.asarray(self._exp, dtype=np.int64) * n + np.asarray(self._pred, dtype=np.int64)
+        keys, inverse = np.unique(codes, return_inverse=True)
+        counts = np.bincount(inverse, weights=self._counts, minlength=len(keys)).astype(np.int64)
+        rows, cols = keys // n, keys % n
+        # keep the aggregate so repeated calls do not redo the work
+        self._exp, self._pred, self._counts = rows.tolist(), cols.tolist(), counts.tolist()
+        return rows, cols, counts
+
+    def to_dict(self) -> Dict[Any, Dict[Any, int]]:
+        """Non-zero counts as ``{expected: {predicted: count}}``."""
+        nested: Dict[Any, Dict[Any, int]] = {}
+        for r, c, count in zip(*(a.tolist() for a in self.cells())):
+            nested.setdefault(self.labels[r], {})[self.labels[c]] = count
+        return nested
+
+    def metrics(self, none_label: Optional[Hashable] = None) -> Dict[str, Any]:
+        """Micro, macro, support-weighted and per-class precision/recall/F1.
+
+        ``none_label`` marks a pseudo-label for missing (``expected`` row) or
+        spurious (``predicted`` column) labels in multi-label data; it counts
+        towards the other classes' errors but is not a class itself.
+        """
+        rows, cols, counts = self.cells()
+        n = len(self.labels)
+        # bincount returns integers instead of floats for empty input
+        support = np.bincount(rows, weights=counts, minlength=n).astype(np.float64)
+        predicted = np.bincount(cols, weights=counts, minlength=n).astype(np.float64)
+        diag = rows == cols
+        tp = np.bincount(rows[diag], weights=counts[diag], minlength=n).astype(np.float64)
+
+        keep = (support + predicted) > 0
+        if none_label is not None and none_label in self._ids:
+            keep[self._ids[none_label]] = False
+        classes = [self.labels[i] for i in np.flatnonzero(keep)]
+        tp, support, predicted = tp[keep], support[keep], predicted[keep]
+
+        precision = np.divide(tp, predicted, out=np.zeros_like(tp), where=predicted > 0)
+        recall = np.divide(tp, support, out=np.zeros_like(tp), where=support > 0)
+        denom = precision + recall
+        f1 = np.divide(2 * precision * recall, denom, out=np.zeros_like(tp), where=denom > 0)
+
+        total = support.sum()
+        return {
+            **_prf(int(tp.sum()), int((predicted - tp).sum()), int((support - tp).sum())),
+            "macro": {
+                "precision": float(precision.mean()) if classes else 0.0,
+                "recall": float(recall.mean()) if classes else 0.0,
+                "f1": float(f1.mean()) if classes else 0.0,
+            },
+            "weighted": {
+                "precision": float(precision @ support / total) if total else 0.0,
+                "recall": float(recall @ support / total) if total else 0.0,
+                "f1": float(f1 @ support / total) if total else 0.0,
+            },
+            "per_class": {
+                label: {"precision": p, "recall": r, "f1": f, "support": int(s)}
+                for label, p, r, f, s in zip(classes, precision.tolist(), recall.tolist(), f1.tolist(), support)
+            },
+        }
+
+    def top_confusions(self, k: int) -> List[Tuple[Hashable, Hashable, int]]:
+        """The ``k`` most frequent off-diagonal ``(expected, predicted, count)`` cells."""
+        rows, cols, counts = self.cells()
+        off = rows != cols
+        rows, cols, counts = rows[off], cols[off], counts[off]
+        order = np.lexsort((cols, rows, -counts))[:k]
+        return [(self.labels[rows[i]], self.labels[cols[i]], int(counts[i])) for i in order]
+
+    def table(self, title: str, top_k: int = 20) -> Dict[str, Any]:
+        """Report table: the full matrix for small label sets, else the top confusions."""
+        if len(self.labels) <= DENSE_MAX_LABELS:
+            nested = self.to_dict()
+            labels = sorted(self.labels, key=str)
+            return {
+                "title": f"Confusion Matrix ({title})",
+                "headers": ["exp\\pred"] + [str(label) for label in labels],
+                "rows": [
+                    [str(exp)] + [nested.get(exp, {}).get(pred, 0) for pred in labels]
+                    for exp in labels
+                ],
+            }
+        rows, _, counts = self.cells()
+        support = np.bincount(rows, weights=counts, minlength=len(self.labels))
+        return {
+            "title": f"Top {top_k} Confusions ({title}, {len(self.labels)} labels)",
+            "headers": ["expected", "predicted", "count", "share of expected"],
+            "rows": [
+                [str(exp), str(pred), count, f"{count / support[self._ids[exp]]:.1%}"]
+                for exp, pred, count in self.top_confusions(top_k)
+            ],
+        }
+
+
+def _prf(tp: int, fp: int, fn: int) -> Dict[str, float]:
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+    return {"precision": precision, "recall": recall, "f1": f1}
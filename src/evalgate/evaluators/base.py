@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Protocol, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Protocol, Tuple
 
 from ..config import Config, EvaluatorCfg
 
+ITEM_PASS_SCORE = 0.5  # item scores at or above this count as passing, unless an evaluator has its own threshold
+
+
+class ItemResult(NamedTuple):
+    """Outcome of one item under one evaluator."""
+
+    item: str  # fixture name, or ``name[sub]``; empty for evaluator-level messages
+    score: Optional[float]
+    passed: bool
+    message: str = ""
+    evaluator: str = ""  # filled in by the runner
+
 
 class Evaluator(Protocol):
     """Callable protocol for evaluator implementations."""
@@ -15,11 +27,36 @@ class Evaluator(Protocol):
         outputs: Dict[str, Dict[str, Any]],
         fixtures: Dict[str, Dict[str, Any]],
     ) -> Tuple[float, List[str], Dict[str, Any]]:
-        """Run evaluation and return score, failures and extra data."""
+        """Run evaluation and return score, failures and extra data.
+
+        ``extra`` may carry ``items`` (per-item scores keyed by fixture name,
+        or ``name[sub]`` for finer-grained items) and ``state`` (JSON-safe
+        corpus statistics) so partial results from shards can be merged.
+        It should also carry ``results``, a list of :class:`ItemResult`
+        with one record per item; evaluators without it get records rebuilt
+        from ``items`` and failures (see :func:`collect_results`).
+        """
+        ...
+
+
+class Merger(Protocol):
+    """Combine per-shard partial results of one evaluator."""
+
+    def __call__(
+        self,
+        cfg: Config,
+        ev: EvaluatorCfg,
+        partials: List[Dict[str, Any]],
+    ) -> Tuple[float, List[str], Dict[str, Any]]:
+        """Return merged score, failures and extra data.
+
+        Each partial holds the shard's ``score``, ``failures`` and ``extra``.
+        """
         ...
 
 
 registry: Dict[str, Evaluator] = {}
+mergers: Dict[str, Merger] = {}
 
 
 def register(name: str) -> Callable[[Evaluator], Evaluator]:
@@ -30,3 +67,79 @@ def register(name: str) -> Callable[[Evaluator], Evaluator]:
         return func
 
     return decorator
+
+
+def register_merger(name: str) -> Callable[[Merger], Merger]:
+    """Decorator to register how shard partials of an evaluator type combine.
+
+    Evaluators without a merger are combined by averaging their ``items``.
+    """
+
+    def decorator(func: Merger) -> Merger:
+        mergers[name] = func
+        return func
+
+    return decorator
+
+
+def merge_items(partials: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Union of the per-item scores of all partials."""
+    items: Dict[str, float] = {}
+    for part in partials:
+        items.update(part.get("extra", {}).get("items") or {})
+    return items
+
+
+def mean_score(partials: List[Dict[str, Any]]) -> float:
+    """Mean of merged item scores, or the shards' score when no items exist.
+
+    An evaluator with no scorable items returns the same default score on
+    every shard, so the first partial's score is used in that case.
+    """
+    items = merge_items(partials)
+    if items:
+        return sum(items.values()) / len(items)
+    return float(partials[0]["score"]) if partials else 1.0
+
+
+def merge_results(partials: List[Dict[str, Any]]) -> List[ItemResult]:
+    """Concatenate the ``results`` of all partials in shard order."""
+    return [ItemResult(*r) for part in partials for r in part.get("extra", {}).get("results") or []]
+
+
+def collect_results(evaluator: str, items: Dict[str, float], failures: List[str],
+                    results: Optional[List[Any]] = None) -> List[ItemResult]:
+    """All per-item records of one evaluator run.
+
+    Emitted ``results`` are used as they are. Only for evaluators that emit
+    none (custom ones written before ``ItemResult``) are records rebuilt: each
+    scored item fails with the failures starting with ``"<item>: "``, and
+    other failures become records without an item score."""
+    if results is not None:
+        return [ItemResult(*r)._replace(evaluator=evaluator) for r in results]
+    records: List[ItemResult] = []
+    messages: Dict[str, List[str]] = {}
+    for failure in failures:
+        head, sep, message = failure.partition(": ")
+        if sep and head in items:
+            messages.setdefault(head, []).append(message)
+        else:
+            records.append(ItemResult(head if sep else "", None, False, message if sep else failure, evaluator))
+    for name, score in items.items():
+        found = messages.get(name)
+        records.append(ItemResult(name, score, not found, "; ".join(found or []), evaluator))
+    return records
+
+
+def merge_failures(partials: List[Dict[str, Any]]) -> List[str]:
+    """Concatenate shard failures in shard order."""
+    return [f for part in partials for f in part.get("failures", [])]
+
+
+def default_merge(cfg: Config, ev: EvaluatorCfg,
+                  partials: List[Dict[str, Any]]) -> Tuple[float, List[str], Dict[str, Any]]:
+    """Merge evaluators whose score is the mean of their item scores."""
+    extra: Dict[str, Any] = {"items": merge_items(partials)}
+    if any("results" in part.get("extra", {}) for part in partials):
+        extra["results"] = merge_results(partials)
+    return mean_score(partials), merge_failures(partials), extra
@@ -1,12 +1,21 @@
 
 from __future__ import annotations
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-from .base import register
+from .base import ItemResult, merge_failures, merge_items, merge_results, mean_score, register, register_merger
+from ..confusion import Confusion
 
 def evaluate(outputs: Dict[str, Dict[str, Any]],
              fixtures: Dict[str, Dict[str, Any]],
-             expected_field: str) -> Tuple[float, List[str]]:
+             expected_field: str,
+             item_scores: Optional[Dict[str, float]] = None,
+             confusion: Optional[Confusion] = None,
+             results: Optional[List[ItemResult]] = None) -> Tuple[float, List[str]]:
+    """Return exact-match accuracy of ``expected_field`` and failure strings.
+
+    If ``item_scores`` is given it is filled with 1.0/0.0 per scored fixture;
+    ``confusion`` collects the (expected, predicted) label of each one and
+    ``results`` an :class:`ItemResult` per scored fixture."""
     considered = 0
     hits = 0
     fails: List[str] = []
@@ -18,41 +27,46 @@ def evaluate(outputs: Dict[str, Dict[str, Any]],
             continue
         considered += 1
         got_val = out.get(expected_field)
-        if exp_val == got_val:
+        if confusion is not None:
+            confusion.add(str(exp_val), str(got_val))
+        matched = exp_val == got_val
+        if item_scores is not None:
+            item_scores[name] = 1.0 if matched else 0.0
+        message = "" if matched else f"expected {expected_field}={exp_val!r}, got {got_val!r}"
+        if results is not None:
+            results.append(ItemResult(name, 1.0 if matched else 0.0, matched, message))
+        if matched:
             hits += 1
         else:
-            fails.append(f"{name}: expected {expected_field}={exp_val!r}, got {got_val!r}")
+            fails.append(f"{name}: {message}")
     total = considered or 1
     return hits / total, fails
 
 
 @register("category")
 def run(cfg, ev, outputs, fixtures):
-    score, fails = evaluate(outputs, fixtures, ev.expected_field or "")
-    label_set: set[str] = set()
-    matrix: dict[str, dict[str, int]] = {}
-    names = sorted(set(fixtures.keys()) & set(outputs.keys()))
-    for n in names:
-        exp_val = fixtures.get(n, {}).get("expected", {}).get(ev.expected_field or "")
-        if exp_val is None:
-            continue
-        got_val = outputs.get(n, {}).get(ev.expected_field or "")
-        exp_label = str(exp_val)
-        got_label = str(got_val)
-        label_set.update([exp_label, got_label])
-        matrix.setdefault(exp_label, {}).setdefault(got_label, 0)
-        matrix[exp_label][got_label] += 1
-    labels = sorted(label_set)
-    headers = ["exp\\pred"] + labels
-    rows = []
-    for exp_label in labels:
-        row = [exp_label]
-        for pred_label in labels:
-            row.append(matrix.get(exp_label, {}).get(pred_label, 0))
-        rows.append(row)
-    table = {
-        "title": f"Confusion Matrix ({ev.name})",
-        "headers": headers,
-        "rows": rows,
+    items: Dict[str, float] = {}
+    confusion = Confusion()
+    results: List[ItemResult] = []
+    score, fails = evaluate(outputs, fixtures, ev.expected_field or "", item_scores=items, confusion=confusion,
+                            results=results)
+    return score, fails, {
+        "table": confusion.table(ev.name, ev.top_confusions),
+        "metrics": confusion.metrics(),
+        "items": items,
+        "results": results,
+        "state": {"matrix": confusion.to_dict()},
+    }
+
+
+@register_merger("category")
+def merge(cfg, ev, partials):
+    confusion = Confusion()
+    for part in partials:
+        confusion.update(part["extra"].get("state", {}).get("matrix", {}))
+    return mean_score(partials), merge_failures(partials), {
+        "table": confusion.table(ev.name, ev.top_confusions),
+        "metrics": confusion.metrics(),
+        "items": merge_items(partials),
+        "results": merge_results(partials),
     }
-    return score, fails, {"table": table}
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from .base import register
+from .base import ItemResult, merge_failures, merge_items, merge_results, register, register_merger
+from ..confusion import Confusion
+
+NONE_LABEL = "__none__"  # missing (as predicted) or spurious (as expected) multi-label entries
+
+
+def _metrics(confusion: Confusion) -> Dict[str, Any]:
+    return {**confusion.metrics(none_label=NONE_LABEL), "confusion_matrix": confusion.to_dict()}
 
 
 def evaluate(
@@ -11,6 +17,9 @@ def evaluate(
     fixtures: Dict[str, Dict[str, Any]],
     field: str,
     multi_label: bool = False,
+    item_scores: Optional[Dict[str, float]] = None,
+    confusion: Optional[Confusion] = None,
+    results: Optional[List[ItemResult]] = None,
 ) -> Tuple[float, List[str], Dict[str, Any]]:
     """Compute precision/recall/F1 for classification outputs.
 
@@ -20,18 +29,23 @@ def evaluate(
     fixtures: mapping of fixture name to fixture with ``expected`` values
     field: name of field containing the label(s)
     multi_label: if True, treat labels as lists and compute multi-label metrics
+    item_scores: optional dict filled with 1.0/0.0 per item (exact match)
+    confusion: optional :class:`Confusion` to collect the label counts in
+    results: optional list filled with an :class:`ItemResult` per item
 
     Returns
     -------
-    Tuple containing overall F1 score, list of failures, and metrics dict with
-    precision, recall, F1, and the confusion matrix.
+    Tuple containing overall (micro) F1 score, list of failures, and metrics
+    dict with micro precision, recall and F1, their ``macro`` and
+    support-``weighted`` averages, ``per_class`` scores and the sparse
+    confusion matrix.
     """
     if not outputs:
         return 1.0, [], {"precision": 1.0, "recall": 1.0, "f1": 1.0, "confusion_matrix": {}}
 
-    confusion: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    if confusion is None:
+        confusion = Confusion()
     fails: List[str] = []
-    tp = fp = fn = 0
 
     for name, out in outputs.items():
         exp_val = fixtures.get(name, {}).get("expected", {}).get(field)
@@ -44,51 +58,71 @@ def evaluate(
             exp_set = set(exp_val)
             pred_set = set(pred_val)
             for lbl in exp_set:
-                if lbl in pred_set:
-                    confusion[lbl][lbl] += 1
-                else:
-                    confusion[lbl]["__none__"] += 1
+                confusion.add(lbl, lbl if lbl in pred_set else NONE_LABEL)
             for lbl in pred_set - exp_set:
-                confusion["__none__"][lbl] += 1
-            tp += len(exp_set & pred_set)
-            fp += len(pred_set - exp_set)
-            fn += len(exp_set - pred_set)
-            if exp_set != pred_set:
-                fails.append(
-                    f"{name}: expected {sorted(exp_set)}, got {sorted(pred_set)}"
-                )
+                confusion.add(NONE_LABEL, lbl)
+            matched = exp_set == pred_set
+            message = "" if matched else f"expected {sorted(exp_set)}, got {sorted(pred_set)}"
         else:
-            exp_label = exp_val
-            pred_label = pred_val
-            confusion[exp_label][pred_label] += 1
-            if exp_label != pred_label:
-                fails.append(f"{name}: expected {exp_label!r}, got {pred_label!r}")
-                fp += 1
-                fn += 1
-            else:
-                tp += 1
-
-    precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
-    recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
-    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
-
-    metrics = {
-        "precision": precision,
-        "recall": recall,
-        "f1": f1,
-        "confusion_matrix": {exp: dict(preds) for exp, preds in confusion.items()},
-    }
-    return f1, fails, metrics
+            confusion.add(exp_val, pred_val)
+            matched = exp_val == pred_val
+            message = "" if matched else f"expected {exp_val!r}, got {pred_val!r}"
+        if item_scores is not None:
+            item_scores[name] = 1.0 if matched else 0.0
+        if results is not None:
+            results.append(ItemResult(name, 1.0 if matched else 0.0, matched, message))
+        if not matched:
+            fails.append(f"{name}: {message}")
+
+    metrics = _metrics(confusion)
+    return metrics["f1"], fails, metrics
 
 
 @register("classification")
 def run(cfg, ev, outputs, fixtures):
     if not ev.expected_field:
         raise ValueError("missing required field: expected_field")
+    items: Dict[str, float] = {}
+    confusion = Confusion()
+    results: List[ItemResult] = []
     score, fails, metrics = evaluate(
         outputs=outputs,
         fixtures=fixtures,
         field=ev.expected_field,
         multi_label=ev.multi_label or False,
+        item_scores=items,
+        confusion=confusion,
+        results=results,
     )
-    return score, fails, {"metrics": metrics}
+    state = {"confusion_matrix": metrics["confusion_matrix"], "outputs": len(outputs)}
+    return score, fails, {
+        "metrics": metrics,
+        "table": confusion.table(ev.name, ev.top_confusions),
+        "items": items,
+        "results": results,
+        "state": state,
+    }
+
+
+@register_merger("classification")
+def merge(cfg, ev, partials):
+    """Sum confusion counts of all shards and recompute corpus metrics."""
+    confusion = Confusion()
+    n_outputs = 0
+    for part in partials:
+        state = part["extra"].get("state", {})
+        n_outputs += state.get("outputs", 0)
+        confusion.update(state.get("confusion_matrix", {}))
+    if not n_outputs:
+        return float(partials[0]["score"]), merge_failures(partials), {
+            "metrics": partials[0]["extra"].get("metrics"),
+            "items": {},
+            "results": [],
+        }
+    metrics = _metrics(confusion)
+    return metrics["f1"], merge_failures(partials), {
+        "metrics": metrics,
+        "table": confusion.table(ev.name, ev.top_confusions),
+        "items": merge_items(partials),
+        "results": merge_results(partials),
+    }
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from .base import register
+from .base import ItemResult, register
 
 
 def evaluate(
@@ -10,6 +10,8 @@ def evaluate(
     fixtures: Dict[str, Dict[str, Any]],
     expected_field: str,
     max_turns: int | None = None,
+    item_scores: Optional[Dict[str, float]] = None,
+    results: Optional[List[ItemResult]] = None,
 ) -> Tuple[float, List[str]]:
     """Validate conversation flow and final message content.
 
@@ -23,35 +25,41 @@ def evaluate(
         Field in final message to compare against the expected value.
     max_turns:
         Optional maximum number of allowed messages in the conversation.
+    item_scores:
+        Optional dict filled with 1.0/0.0 per scored conversation.
+    results:
+        Optional list filled with an :class:`ItemResult` per scored or
+        failing conversation.
     """
     considered = 0
     hits = 0
     failures: List[str] = []
     for name, out in outputs.items():
+        problems: List[str] = []
+        score: Optional[float] = None
         msgs = out.get("messages")
         if not isinstance(msgs, list) or not msgs:
-            failures.append(f"{name}: missing messages")
+            problems.append("missing messages")
             considered += 1
-            continue
-        if max_turns is not None and len(msgs) > max_turns:
-            failures.append(
-                f"{name}: expected <= {max_turns} turns, got {len(msgs)}"
-            )
-        exp_val = fixtures.get(name, {}).get("expected", {}).get(expected_field)
-        if exp_val is None:
-            # No ground truth provided; do not include in score
-            continue
-        considered += 1
-        got_val = msgs[-1].get(expected_field)
-        if got_val == exp_val and (
-            max_turns is None or len(msgs) <= max_turns
-        ):
-            hits += 1
+            score = 0.0
         else:
-            if got_val != exp_val:
-                failures.append(
-                    f"{name}: expected final {expected_field}={exp_val!r}, got {got_val!r}"
-                )
+            if max_turns is not None and len(msgs) > max_turns:
+                problems.append(f"expected <= {max_turns} turns, got {len(msgs)}")
+            exp_val = fixtures.get(name, {}).get("expected", {}).get(expected_field)
+            # without ground truth the conversation is not scored
+            if exp_val is not None:
+                considered += 1
+                got_val = msgs[-1].get(expected_field)
+                if got_val != exp_val:
+                    problems.append(f"expected final {expected_field}={exp_val!r}, got {got_val!r}")
+                score = 0.0 if problems else 1.0
+                if not problems:
+                    hits += 1
+        if item_scores is not None and score is not None:
+            item_scores[name] = score
+        if results is not None and (score is not None or problems):
+            results.append(ItemResult(name, score, not problems, "; ".join(problems)))
+        failures.extend(f"{name}: {problem}" for problem in problems)
     total = considered or 1
     return hits / total, failures
 
@@ -60,10 +68,14 @@ def evaluate(
 def run(cfg, ev, outputs, fixtures):
     if ev.expected_final_field is None:
         raise ValueError("expected_final_field is required for conversation evaluator")
+    items: Dict[str, float] = {}
+    results: List[ItemResult] = []
     score, fails = evaluate(
         outputs,
         fixtures,
         expected_field=ev.expected_final_field,
         max_turns=ev.max_turns,
+        item_scores=items,
+        results=results,
     )
-    return score, fails, {}
+    return score, fails, {"items": items, "results": results}
@@ -1,14 +1,27 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-from .base import register
+from .base import ItemResult, register
+from ..vector_store import VectorStore
 
-_model_cache: dict[str, Any] = {}
+_model_cache: dict[tuple, Any] = {}
 
-def _get_model(name: str):
-    """Lazily load and cache a sentence embedding model."""
-    if name in _model_cache:
-        return _model_cache[name]
+def _get_model(name: str, backend: str = "torch", quantize: bool = False,
+               num_threads: Optional[int] = None):
+    """Lazily load and cache a sentence embedding model.
+
+    ``backend="onnx"`` runs an exported ONNX model on onnxruntime instead of
+    PyTorch, optionally int8-quantized."""
+    key = (name, backend, quantize, num_threads)
+    if key in _model_cache:
+        return _model_cache[key]
+    if backend == "onnx":
+        from ..onnx_encoder import OnnxEncoder
+
+        model = _model_cache[key] = OnnxEncoder(name, quantize=quantize, num_threads=num_threads)
+        return model
+    if backend != "torch":
+        raise ValueError(f"Unsupported embedding backend: {backend}")
     try:
         from sentence_transformers import SentenceTransformer
     except ImportError as e:
@@ -16,19 +29,44 @@ def _get_model(name: str):
             "sentence-transformers package required for embedding evaluator."
             " Install with: pip install sentence-transformers"
         ) from e
+    if num_threads:
+        import torch
+
+        torch.set_num_threads(num_threads)
     model = SentenceTransformer(name)
-    _model_cache[name] = model
+    _model_cache[key] = model
     return model
 
 def evaluate(outputs: Dict[str, Dict[str, Any]],
              fixtures: Dict[str, Dict[str, Any]],
              field: str,
              model_name: str,
-             threshold: float) -> Tuple[float, List[str]]:
-    """Evaluate embedding similarity between output and expected text."""
-    if not outputs:
+             threshold: float,
+             item_scores: Optional[Dict[str, float]] = None,
+             batch_size: int = 64,
+             store: Optional[VectorStore] = None,
+             backend: str = "torch",
+             quantize: bool = False,
+             num_threads: Optional[int] = None,
+             results: Optional[List[ItemResult]] = None) -> Tuple[float, List[str]]:
+    """Evaluate embedding similarity between output and expected text.
+
+    Distinct texts are encoded once, in batches of ``batch_size``, and all
+    pairs are compared with a single vectorized dot product. With a
+    ``store``, only texts it has no vector for are encoded and the model is
+    not loaded at all when every text is known. ``backend``, ``quantize``
+    and ``num_threads`` select how the model runs (see ``_get_model``). If
+    ``item_scores`` is given it is filled with the similarity per item, and
+    ``results`` with an :class:`ItemResult` per item passing at ``threshold``."""
+    pairs: List[Tuple[str, Any, Any]] = []  # (name, expected text, output text)
+    for name, out in outputs.items():
+        exp_text = fixtures.get(name, {}).get("expected", {}).get(field)
+        out_text = out.get(field)
+        if exp_text is None or out_text is None:
+            continue
+        pairs.append((name, exp_text, out_text))
+    if not pairs:
         return 1.0, []
-    model = _get_model(model_name)
     try:
         import numpy as np
     except ImportError as e:
@@ -36,32 +74,56 @@ def evaluate(outputs: Dict[str, Dict[str, Any]],
             "numpy package required for embedding evaluator."
             " Install with: pip install numpy"
         ) from e
-    scores: List[float] = []
+    index: Dict[Any, int] = {}
+    for _, exp_text, out_text in pairs:
+        index.setdefault(exp_text, len(index))
+        index.setdefault(out_text, len(index))
+
+    def encode(texts: List[Any]):
+        return _get_model(model_name, backend, quantize, num_threads).encode(texts, batch_size=batch_size, normalize_embeddings=True)
+
+    if store is not None:
+        vectors = store.get(list(index), encode)
+    else:
+        vectors = np.asarray(encode(list(index)), dtype=np.float32)
+    exp_rows = vectors[[index[e] for _, e, _ in pairs]]
+    out_rows = vectors[[index[o] for _, _, o in pairs]]
+    sims = np.einsum("ij,ij->i", exp_rows, out_rows).tolist()
+
     fails: List[str] = []
-    for name, out in outputs.items():
-        exp = fixtures.get(name, {}).get("expected", {})
-        exp_text = exp.get(field)
-        out_text = out.get(field)
-        if exp_text is None or out_text is None:
-            continue
-        vectors = model.encode([exp_text, out_text], normalize_embeddings=True)
-        sim = float(np.dot(vectors[0], vectors[1]))
-        scores.append(sim)
-        if sim < threshold:
-            fails.append(f"{name}: similarity {sim:.2f} below threshold {threshold:.2f}")
-    avg = sum(scores) / len(scores) if scores else 1.0
-    return avg, fails
+    for (name, _, _), sim in zip(pairs, sims):
+        if item_scores is not None:
+            item_scores[name] = sim
+        message = f"similarity {sim:.2f} below threshold {threshold:.2f}" if sim < threshold else ""
+        if results is not None:
+            results.append(ItemResult(name, sim, not message, message))
+        if message:
+            fails.append(f"{name}: {message}")
+    return sum(sims) / len(sims), fails
 
 
 @register("embedding")
 def run(cfg, ev, outputs, fixtures):
     if not ev.expected_field:
         raise ValueError("missing required field: expected_field")
+    items: Dict[str, float] = {}
+    results: List[ItemResult] = []
+    model_name = ev.model or "sentence-transformers/all-MiniLM-L6-v2"
+    backend = ev.backend or "torch"
+    # vectors differ slightly between backends, so each gets its own store
+    store_name = model_name if backend == "torch" else f"{model_name}#{backend}{'-int8' if ev.quantize else ''}"
     score, fails = evaluate(
         outputs=outputs,
         fixtures=fixtures,
         field=ev.expected_field,
-        model_name=ev.model or "sentence-transformers/all-MiniLM-L6-v2",
+        model_name=model_name,
         threshold=ev.threshold or 0.8,
+        item_scores=items,
+        batch_size=ev.batch_size or 64,
+        store=VectorStore(store_name) if ev.vector_cache else None,
+        backend=backend,
+        quantize=bool(ev.quantize),
+        num_threads=ev.num_threads,
+        results=results,
     )
-    return score, fails, {}
+    return score, fails, {"items": items, "results": results}
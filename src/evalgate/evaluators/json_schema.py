@@ -1,23 +1,72 @@
-
 from __future__ import annotations
+import json
+import multiprocessing
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
 from jsonschema import Draft202012Validator
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-from .base import register
+from .base import ItemResult, register
 from ..util import read_json
 
-def evaluate(outputs: Dict[str, Dict[str, Any]], schema: Dict[str, Any]) -> Tuple[float, List[str]]:
-    """Return score in [0,1] and list of violation strings."""
-    validator = Draft202012Validator(schema)
+_validators: Dict[str, Draft202012Validator] = {}  # canonical schema JSON -> validator
+_schemas: Dict[Tuple[str, int], Dict[str, Any]] = {}  # (path, mtime_ns) -> schema
+POOL_MIN_ITEMS = 1000  # below this, process start-up outweighs parallel validation
+
+def _get_validator(schema: Dict[str, Any]) -> Draft202012Validator:
+    """Build a validator once per distinct schema and reuse it for the run."""
+    key = json.dumps(schema, sort_keys=True)
+    validator = _validators.get(key)
+    if validator is None:
+        validator = _validators[key] = Draft202012Validator(schema)
+    return validator
+
+def _load_schema(path: str) -> Dict[str, Any]:
+    key = (str(pathlib.Path(path).resolve()), pathlib.Path(path).stat().st_mtime_ns)
+    if key not in _schemas:
+        _schemas[key] = read_json(path)
+    return _schemas[key]
+
+def _violations(schema: Dict[str, Any], items: List[Tuple[str, Any]]) -> List[Tuple[str, List[str]]]:
+    """Return ``(name, violations)`` per item; valid items skip error collection."""
+    validator = _get_validator(schema)
+    results = []
+    for name, obj in items:
+        if validator.is_valid(obj):
+            results.append((name, []))
+            continue
+        errors = sorted(validator.iter_errors(obj), key=lambda e: e.path)
+        results.append((name, [f"{'/'.join(map(str, e.path))} -> {e.message}" for e in errors]))
+    return results
+
+def evaluate(outputs: Dict[str, Dict[str, Any]], schema: Dict[str, Any],
+             item_scores: Optional[Dict[str, float]] = None,
+             workers: Optional[int] = None,
+             results: Optional[List[ItemResult]] = None) -> Tuple[float, List[str]]:
+    """Return score in [0,1] and list of violation strings.
+
+    With ``workers`` > 1, large corpora are validated in a process pool. If
+    ``item_scores`` is given it is filled with 1.0/0.0 per output, and
+    ``results`` with an :class:`ItemResult` per output."""
+    items = list(outputs.items())
+    if workers and workers > 1 and len(items) >= POOL_MIN_ITEMS:
+        size = -(-len(items) // (workers * 4))
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            checked = [r for part in pool.map(_violations, [schema] * len(chunks), chunks) for r in part]
+    else:
+        checked = _violations(schema, items)
     violations: List[str] = []
     total = len(outputs) or 1
     ok = 0
-    for name, obj in outputs.items():
-        errors = sorted(validator.iter_errors(obj), key=lambda e: e.path)
+    for name, errors in checked:
+        if item_scores is not None:
+            item_scores[name] = 0.0 if errors else 1.0
+        if results is not None:
+            results.append(ItemResult(name, 0.0 if errors else 1.0, not errors, "; ".join(errors)))
         if errors:
-            for e in errors:
-                path = "/".join(map(str, e.path))
-                violations.append(f"{name}: {path} -> {e.message}")
+            violations.extend(f"{name}: {e}" for e in errors)
         else:
             ok += 1
     return ok / total, violations
@@ -25,7 +74,8 @@ def evaluate(outputs: Dict[str, Dict[str, Any]], schema: Dict[str, Any]) -> Tupl
 
 @register("schema")
 def run(cfg, ev, outputs, fixtures):
-    schema = read_json(ev.schema_path) if ev.schema_path else {}
-    score, fails = evaluate(outputs, schema)
-    return score, fails, {}
-
+    schema = _load_schema(ev.schema_path) if ev.schema_path else {}
+    items: Dict[str, float] = {}
+    results: List[ItemResult] = []
+    score, fails = evaluate(outputs, schema, item_scores=items, workers=ev.workers, results=results)
+    return score, fails, {"items": items, "results": results}
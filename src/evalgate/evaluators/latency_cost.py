@@ -1,40 +1,144 @@
-
 from __future__ import annotations
-from typing import Dict, Any, List, Tuple
-from ..util import p95 as p95_fn
+from typing import Dict, Any, List, Optional, Tuple
+
+from .base import ItemResult, merge_failures, merge_items, merge_results, register, register_merger
+from ..sketch import QuantileSketch
+
+def _percentile(key: str) -> float:
+    """``"p99"`` -> 0.99, ``"p99.9"`` -> 0.999."""
+    return float(key[1:]) / 100
+
+
+def _component(value: float, limit: float) -> float:
+    if value <= limit:
+        return 1.0
+    return max(0.0, 1 - (value - limit) / limit) if limit > 0 else 0.0
+
+
+def _limits(budgets: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    return {
+        "latency_ms": {"p95": budgets["p95_latency_ms"], **(budgets.get("latency_ms") or {})},
+        "cost_usd": {"mean": budgets["max_cost_usd_per_item"], **(budgets.get("cost_usd") or {})},
+    }
+
+
+def _slo(latency: QuantileSketch, cost: QuantileSketch,
+         budgets: Dict[str, Any]) -> Tuple[float, Dict[str, Dict[str, float]]]:
+    """Score the percentile budgets; returns (score, observed value per budget).
+
+    Latency and cost each count for half of the score, and each half is set
+    by its worst budget."""
+    sketches = {"latency_ms": latency, "cost_usd": cost}
+    observed: Dict[str, Dict[str, float]] = {}
+    halves = []
+    for kind, limits in _limits(budgets).items():
+        sketch = sketches[kind]
+        observed[kind] = {
+            key: sketch.mean if key == "mean" else sketch.quantile(_percentile(key)) for key in limits
+        }
+        halves.append(min(_component(observed[kind][key], limit) for key, limit in limits.items()))
+    return halves[0] * 0.5 + halves[1] * 0.5, observed
+
+
+def _table(observed: Dict[str, Dict[str, float]], budgets: Dict[str, Any]) -> Dict[str, Any]:
+    rows = [
+        [kind, key, f"{observed[kind][key]:g}", f"{limit:g}", "✅" if observed[kind][key] <= limit else "❌"]
+        for kind, limits in _limits(budgets).items()
+        for key, limit in limits.items()
+    ]
+    return {"title": "Latency/Cost Budgets", "headers": ["metric", "stat", "observed", "budget", "ok"], "rows": rows}
 
-from .base import register
 
 def evaluate(fixtures: Dict[str, Dict[str, Any]],
-             budgets: Dict[str, float]) -> Tuple[float, List[str], float, float]:
-    """Return (score, violations, p95_latency_ms, avg_cost_usd)."""
-    latencies, costs = [], []
+             budgets: Dict[str, Any],
+             item_scores: Optional[Dict[str, float]] = None,
+             sketches: Optional[Dict[str, QuantileSketch]] = None,
+             summary: Optional[Dict[str, Any]] = None,
+             results: Optional[List[ItemResult]] = None) -> Tuple[float, List[str], float, float]:
+    """Return (score, violations, p95_latency_ms, avg_cost_usd).
+
+    ``budgets`` holds ``p95_latency_ms`` and ``max_cost_usd_per_item`` and
+    optionally ``latency_ms``/``cost_usd`` mappings of extra percentile
+    budgets such as ``{"p99": 2500}``. If ``item_scores`` is given it is
+    filled with 1.0/0.0 per fixture within budget; ``sketches`` receives the
+    ``latency`` and ``cost`` quantile sketches, ``summary`` the observed
+    value of every budgeted statistic and ``results`` an :class:`ItemResult`
+    per fixture."""
+    latency, cost = QuantileSketch(), QuantileSketch()
     fails: List[str] = []
     for name, fx in fixtures.items():
         meta = fx.get("meta", {})
         lat = float(meta.get("latency_ms", 0))
-        cost = float(meta.get("cost_usd", 0))
-        latencies.append(lat)
-        costs.append(cost)
-        if lat > budgets["p95_latency_ms"]:
-            fails.append(f"{name}: latency {lat}ms > {budgets['p95_latency_ms']}ms")
-        if cost > budgets["max_cost_usd_per_item"]:
-            fails.append(f"{name}: cost ${cost} > ${budgets['max_cost_usd_per_item']}")
-    p95_latency = p95_fn(latencies)
-    avg_cost = sum(costs) / (len(costs) or 1)
-    lat_score = 1.0 if p95_latency <= budgets["p95_latency_ms"] else max(0.0, 1 - (p95_latency - budgets["p95_latency_ms"]) / budgets["p95_latency_ms"])
-    cost_score = 1.0 if avg_cost <= budgets["max_cost_usd_per_item"] else max(0.0, 1 - (avg_cost - budgets["max_cost_usd_per_item"]) / budgets["max_cost_usd_per_item"])
-    return (lat_score * 0.5 + cost_score * 0.5), fails, p95_latency, avg_cost
+        item_cost = float(meta.get("cost_usd", 0))
+        latency.add(lat)
+        cost.add(item_cost)
+        over_latency = lat > budgets["p95_latency_ms"]
+        over_cost = item_cost > budgets["max_cost_usd_per_item"]
+        if item_scores is not None:
+            item_scores[name] = 0.0 if (over_latency or over_cost) else 1.0
+        problems = []
+        if over_latency:
+            problems.append(f"latency {lat}ms > {budgets['p95_latency_ms']}ms")
+        if over_cost:
+            problems.append(f"cost ${item_cost} > ${budgets['max_cost_usd_per_item']}")
+        if results is not None:
+            results.append(ItemResult(name, 0.0 if problems else 1.0, not problems, "; ".join(problems)))
+        fails.extend(f"{name}: {problem}" for problem in problems)
+    if sketches is not None:
+        sketches["latency"] = latency
+        sketches["cost"] = cost
+    score, observed = _slo(latency, cost, budgets)
+    if summary is not None:
+        summary.update(observed)
+    return score, fails, observed["latency_ms"]["p95"], cost.mean
+
+
+def _budgets(cfg) -> Dict[str, Any]:
+    return {
+        "p95_latency_ms": cfg.budgets.p95_latency_ms,
+        "max_cost_usd_per_item": cfg.budgets.max_cost_usd_per_item,
+        "latency_ms": cfg.budgets.latency_ms,
+        "cost_usd": cfg.budgets.cost_usd,
+    }
 
 
 @register("budgets")
 def run(cfg, ev, outputs, fixtures):
-    score, fails, lat, cost = evaluate(
-        fixtures,
-        {
-            "p95_latency_ms": cfg.budgets.p95_latency_ms,
-            "max_cost_usd_per_item": cfg.budgets.max_cost_usd_per_item,
-        },
-    )
-    return score, fails, {"latency": lat, "cost": cost}
+    items: Dict[str, float] = {}
+    sketches: Dict[str, QuantileSketch] = {}
+    summary: Dict[str, Any] = {}
+    results: List[ItemResult] = []
+    budgets = _budgets(cfg)
+    score, fails, lat, cost = evaluate(fixtures, budgets, item_scores=items, sketches=sketches, summary=summary,
+                                       results=results)
+    return score, fails, {
+        "latency": lat,
+        "cost": cost,
+        "metrics": summary,
+        "table": _table(summary, budgets),
+        "items": items,
+        "results": results,
+        "state": {k: s.to_dict() for k, s in sketches.items()},
+    }
+
 
+@register_merger("budgets")
+def merge(cfg, ev, partials):
+    """Merge the shards' latency and cost sketches and re-check the budgets."""
+    latency, cost = QuantileSketch(), QuantileSketch()
+    for part in partials:
+        state = part["extra"].get("state", {})
+        if state.get("latency"):
+            latency.merge(QuantileSketch.from_dict(state["latency"]))
+        if state.get("cost"):
+            cost.merge(QuantileSketch.from_dict(state["cost"]))
+    budgets = _budgets(cfg)
+    score, observed = _slo(latency, cost, budgets)
+    return score, merge_failures(partials), {
+        "latency": observed["latency_ms"]["p95"],
+        "cost": cost.mean,
+        "metrics": observed,
+        "table": _table(observed, budgets),
+        "items": merge_items(partials),
+        "results": merge_results(partials),
+    }
@@ -2,10 +2,12 @@ from __future__ import annotations
 import os
 import json
 import re
-from typing import Dict, Any, List, Tuple, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Tuple, Optional
 from pathlib import Path
 
-from .base import register
+from .base import ItemResult, register
 from .. import cache
 
 
@@ -95,15 +97,91 @@ def _extract_score_from_response(response: str) -> float:
     return 0.5
 
 
-def _call_openai(model: str, prompt: str, api_key: str, temperature: float = 0.1, 
-                 max_tokens: int = 1000, base_url: Optional[str] = None) -> str:
-    """Call OpenAI API."""
+_client_cache: Dict[Tuple[Any, ...], Any] = {}
+_client_lock = threading.Lock()
+
+
+def _pool_options(timeout: Optional[float], max_connections: Optional[int]) -> Dict[str, Any]:
+    """Build SDK client kwargs for request timeout and connection pool size.
+
+    The pool is a plain ``httpx.Client`` (both SDKs depend on httpx), as
+    ``DefaultHttpxClient`` is missing from early openai 1.x releases."""
+    options: Dict[str, Any] = {}
+    if timeout is not None:
+        options["timeout"] = timeout
+    if max_connections is not None:
+        import httpx
+
+        options["http_client"] = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=timeout if timeout is not None else 600.0,  # the SDKs' default timeout
+            follow_redirects=True,
+        )
+    return options
+
+
+def _new_client(provider: str, api_key: Optional[str], base_url: Optional[str],
+                timeout: Optional[float], max_connections: Optional[int]) -> Any:
+    """Construct the SDK client for ``provider``."""
+    if provider == "anthropic":
+        try:
+            import anthropic
+        except ImportError:
+            raise ImportError("anthropic package required for Anthropic provider. Install with: pip install anthropic")
+        return anthropic.Anthropic(api_key=api_key, **_pool_options(timeout, max_connections))
+
     try:
         import openai
     except ImportError:
-        raise ImportError("openai package required for OpenAI provider. Install with: pip install openai")
-    
-    client = openai.OpenAI(api_key=api_key, base_url=base_url)
+        label = {"openai": "OpenAI", "azure": "Azure"}.get(provider, provider)
+        raise ImportError(f"openai package required for {label} provider. Install with: pip install openai")
+    options = _pool_options(timeout, max_connections)
+    if provider == "azure":
+        return openai.AzureOpenAI(
+            api_key=api_key,
+            azure_endpoint=base_url,
+            api_version="2024-02-15-preview",
+            **options,
+        )
+    return openai.OpenAI(api_key=api_key, base_url=base_url, **options)
+
+
+def _get_client(provider: str, api_key: Optional[str], base_url: Optional[str] = None,
+                timeout: Optional[float] = None, max_connections: Optional[int] = None) -> Any:
+    """Return a provider client shared by every judge call in the run.
+
+    Clients are keyed by provider, endpoint and API key (plus pool settings)
+    so HTTP keep-alive connections and TLS sessions are reused across calls
+    and worker threads.
+    """
+    key = (provider, base_url, api_key, timeout, max_connections)
+    with _client_lock:
+        client = _client_cache.get(key)
+        if client is None:
+            client = _new_client(provider, api_key, base_url, timeout, max_connections)
+            _client_cache[key] = client
+        return client
+
+
+def close_clients() -> None:
+    """Close and forget all pooled provider clients."""
+    with _client_lock:
+        clients = list(_client_cache.values())
+        _client_cache.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if close is not None:
+            close()
+
+
+def _call_openai(model: str, prompt: str, api_key: str, temperature: float = 0.1, 
+                 max_tokens: int = 1000, base_url: Optional[str] = None,
+                 timeout: Optional[float] = None, max_connections: Optional[int] = None) -> str:
+    """Call OpenAI API."""
+    client = _get_client("openai", api_key, base_url, timeout, max_connections)
     
     try:
         response = client.chat.completions.create(
@@ -118,14 +196,10 @@ def _call_openai(model: str, prompt: str, api_key: str, temperature: float = 0.1
 
 
 def _call_anthropic(model: str, prompt: str, api_key: str, temperature: float = 0.1,
-                    max_tokens: int = 1000) -> str:
+                    max_tokens: int = 1000, timeout: Optional[float] = None,
+                    max_connections: Optional[int] = None) -> str:
     """Call Anthropic API."""
-    try:
-        import anthropic
-    except ImportError:
-        raise ImportError("anthropic package required for Anthropic provider. Install with: pip install anthropic")
-    
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _get_client("anthropic", api_key, None, timeout, max_connections)
     
     try:
         response = client.messages.create(
@@ -140,21 +214,13 @@ def _call_anthropic(model: str, prompt: str, api_key: str, temperature: float =
 
 
 def _call_azure(model: str, prompt: str, api_key: str, temperature: float = 0.1,
-                max_tokens: int = 1000, base_url: Optional[str] = None) -> str:
+                max_tokens: int = 1000, base_url: Optional[str] = None,
+                timeout: Optional[float] = None, max_connections: Optional[int] = None) -> str:
     """Call Azure OpenAI API."""
-    try:
-        import openai
-    except ImportError:
-        raise ImportError("openai package required for Azure provider. Install with: pip install openai")
-    
     if not base_url:
         raise ValueError("base_url required for Azure provider")
     
-    client = openai.AzureOpenAI(
-        api_key=api_key,
-        azure_endpoint=base_url,
-        api_version="2024-02-15-preview"
-    )
+    client = _get_client("azure", api_key, base_url, timeout, max_connections)
     
     try:
         response = client.chat.completions.create(
@@ -169,20 +235,14 @@ def _call_azure(model: str, prompt: str, api_key: str, temperature: float = 0.1,
 
 
 def _call_local(model: str, prompt: str, temperature: float = 0.1,
-                max_tokens: int = 1000, base_url: Optional[str] = None) -> str:
+                max_tokens: int = 1000, base_url: Optional[str] = None,
+                timeout: Optional[float] = None, max_connections: Optional[int] = None) -> str:
     """Call local LLM endpoint (OpenAI-compatible)."""
-    try:
-        import openai
-    except ImportError:
-        raise ImportError("openai package required for local provider. Install with: pip install openai")
-    
     if not base_url:
         raise ValueError("base_url required for local provider")
     
-    client = openai.OpenAI(
-        api_key="dummy",  # Local endpoints typically don't need real API keys
-        base_url=base_url
-    )
+    # Local endpoints typically don't need real API keys
+    client = _get_client("local", "dummy", base_url, timeout, max_connections)
     
     try:
         response = client.chat.completions.create(
@@ -207,6 +267,36 @@ def _concat_transcript(transcript: Any) -> str:
     return str(transcript or "")
 
 
+def _call_provider(provider: str, model: str, prompt: str, api_key: Optional[str],
+                   temperature: float, max_tokens: int, base_url: Optional[str],
+                   timeout: Optional[float] = None, max_connections: Optional[int] = None) -> str:
+    """Dispatch a single judge prompt to the configured provider."""
+    pool = {"timeout": timeout, "max_connections": max_connections}
+    if provider == "openai":
+        if not api_key:
+            raise ValueError("API key required for OpenAI provider")
+        return _call_openai(model, prompt, api_key, temperature, max_tokens, base_url, **pool)
+    if provider == "anthropic":
+        if not api_key:
+            raise ValueError("API key required for Anthropic provider")
+        return _call_anthropic(model, prompt, api_key, temperature, max_tokens, **pool)
+    if provider == "azure":
+        if not api_key:
+            raise ValueError("API key required for Azure provider")
+        return _call_azure(model, prompt, api_key, temperature, max_tokens, base_url, **pool)
+    if provider == "local":
+        return _call_local(model, prompt, temperature, max_tokens, base_url, **pool)
+    raise ValueError(f"Unknown provider: {provider}")
+
+
+def _run_jobs(func: Callable[[Any], Any], jobs: List[Any], concurrency: int) -> List[Any]:
+    """Apply ``func`` to every job, preserving input order in the results."""
+    if concurrency <= 1 or len(jobs) <= 1:
+        return [func(job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs))) as pool:
+        return list(pool.map(func, jobs))
+
+
 def evaluate(
     outputs: Dict[str, Dict[str, Any]],
     fixtures: Dict[str, Dict[str, Any]],
@@ -219,6 +309,11 @@ def evaluate(
     max_tokens: int = 1000,
     transcript_field: Optional[str] = None,
     per_turn_scoring: bool = False,
+    concurrency: int = 1,
+    timeout: Optional[float] = None,
+    max_connections: Optional[int] = None,
+    item_scores: Optional[Dict[str, float]] = None,
+    results: Optional[List[ItemResult]] = None,
 ) -> Tuple[float, List[str]]:
     """
     Evaluate outputs using an LLM as judge.
@@ -233,6 +328,13 @@ def evaluate(
         base_url: Base URL for API (required for Azure/local)
         temperature: Sampling temperature
         max_tokens: Maximum response tokens
+        concurrency: Maximum number of judge calls in flight at once
+        timeout: Per-request timeout in seconds for provider calls
+        max_connections: HTTP connection pool size of the shared provider client
+        item_scores: Optional dict filled with the score per fixture (or
+            ``name[turn]`` with per-turn scoring)
+        results: Optional list filled with an :class:`ItemResult` per
+            fixture (or turn)
     
     Returns:
         Tuple of (average_score, list_of_detailed_results)
@@ -249,11 +351,19 @@ def evaluate(
         api_key = os.getenv(api_key_env_var)
         if not api_key and provider not in ["local"]:
             raise ValueError(f"API key not found in environment variable: {api_key_env_var}")
-    
-    scores = []
-    details = []
 
-    # Evaluate each output
+    # Everything besides model and prompt that changes the judge response;
+    # part of the cache key.
+    request = {
+        "provider": provider,
+        "base_url": base_url,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+
+    # Build every judge prompt up front as (label, prompt) so the calls can be
+    # fanned out while results keep the fixture/turn order.
+    jobs: List[Tuple[str, str]] = []
     for name in outputs.keys():
         output_data = outputs[name]
         fixture_data = fixtures.get(name, {})
@@ -269,43 +379,7 @@ def evaluate(
                 formatted_prompt = _format_prompt(
                     prompt_template, input_data, output_data, expected_data, transcript_text
                 )
-                try:
-                    if provider == "openai":
-                        if not api_key:
-                            raise ValueError("API key required for OpenAI provider")
-                        response = _call_openai(
-                            model, formatted_prompt, api_key, temperature, max_tokens, base_url
-                        )
-                    elif provider == "anthropic":
-                        if not api_key:
-                            raise ValueError("API key required for Anthropic provider")
-                        response = _call_anthropic(
-                            model, formatted_prompt, api_key, temperature, max_tokens
-                        )
-                    elif provider == "azure":
-                        if not api_key:
-                            raise ValueError("API key required for Azure provider")
-                        response = _call_azure(
-                            model, formatted_prompt, api_key, temperature, max_tokens, base_url
-                        )
-                    elif provider == "local":
-                        response = _call_local(
-                            model, formatted_prompt, temperature, max_tokens, base_url
-                        )
-                    else:
-                        raise ValueError(f"Unknown provider: {provider}")
-
-                    score = _extract_score_from_response(response)
-                    scores.append(score)
-                    if score < 0.7:
-                        details.append(
-                            f"{name}[{idx}]: Score {score:.2f} - {response[:100]}..."
-                        )
-                except Exception as e:
-                    scores.append(0.0)
-                    details.append(
-                        f"{name}[{idx}]: Evaluation failed - {str(e)}"
-                    )
+                jobs.append((f"{name}[{idx}]", formatted_prompt))
             continue
 
         transcript_text = None
@@ -315,40 +389,39 @@ def evaluate(
         formatted_prompt = _format_prompt(
             prompt_template, input_data, output_data, expected_data, transcript_text
         )
+        jobs.append((name, formatted_prompt))
 
+    def judge(job: Tuple[str, str]) -> Tuple[float, Optional[str]]:
+        label, formatted_prompt = job
         try:
-            cached = cache.get(model, formatted_prompt)
+            cached = cache.get(model, formatted_prompt, **request)
             if cached is not None:
                 response = cached
             else:
-                if provider == "openai":
-                    if not api_key:
-                        raise ValueError("API key required for OpenAI provider")
-                    response = _call_openai(model, formatted_prompt, api_key, temperature, max_tokens, base_url)
-                elif provider == "anthropic":
-                    if not api_key:
-                        raise ValueError("API key required for Anthropic provider")
-                    response = _call_anthropic(model, formatted_prompt, api_key, temperature, max_tokens)
-                elif provider == "azure":
-                    if not api_key:
-                        raise ValueError("API key required for Azure provider")
-                    response = _call_azure(model, formatted_prompt, api_key, temperature, max_tokens, base_url)
-                elif provider == "local":
-                    response = _call_local(model, formatted_prompt, temperature, max_tokens, base_url)
-                else:
-                    raise ValueError(f"Unknown provider: {provider}")
-                cache.set(model, formatted_prompt, response)
-            
+                response = _call_provider(
+                    provider, model, formatted_prompt, api_key, temperature, max_tokens, base_url,
+                    timeout=timeout, max_connections=max_connections,
+                )
+                cache.set(model, formatted_prompt, response, **request)
+
             # Extract score from response
             score = _extract_score_from_response(response)
-            scores.append(score)
-
             if score < 0.7:
-                details.append(f"{name}: Score {score:.2f} - {response[:100]}...")
-
+                return score, f"Score {score:.2f} - {response[:100]}..."
+            return score, None
         except Exception as e:
-            scores.append(0.0)
-            details.append(f"{name}: Evaluation failed - {str(e)}")
+            return 0.0, f"Evaluation failed - {str(e)}"
+
+    scores = []
+    details = []
+    for (label, _), (score, detail) in zip(jobs, _run_jobs(judge, jobs, concurrency)):
+        scores.append(score)
+        if item_scores is not None:
+            item_scores[label] = score
+        if results is not None:
+            results.append(ItemResult(label, score, detail is None, detail or ""))
+        if detail is not None:
+            details.append(f"{label}: {detail}")
     
     # Calculate average score
     average_score = sum(scores) / len(scores) if scores else 0.0
@@ -364,6 +437,8 @@ def run(cfg, ev, outputs, fixtures):
         raise ValueError("missing required field: provider")
     if not ev.model:
         raise ValueError("missing required field: model")
+    items: Dict[str, float] = {}
+    results: List[ItemResult] = []
     score, fails = evaluate(
         outputs=outputs,
         fixtures=fixtures,
@@ -376,5 +451,10 @@ def run(cfg, ev, outputs, fixtures):
         max_tokens=ev.max_tokens or 1000,
         transcript_field=ev.transcript_field,
         per_turn_scoring=ev.per_turn_scoring or False,
+        concurrency=ev.concurrency or 1,
+        timeout=ev.timeout,
+        max_connections=ev.max_connections,
+        item_scores=items,
+        results=results,
     )
-    return score, fails, {}
+    return score, fails, {"items": items, "results": results}
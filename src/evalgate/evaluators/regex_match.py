@@ -1,31 +1,185 @@
 from __future__ import annotations
+import multiprocessing
 import re
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-from .base import register
+from .base import ItemResult, register
 from ..util import read_json
 
+try:  # linear-time engine, immune to catastrophic backtracking; opt-in as it matches differently
+    import re2
+except ImportError:
+    re2 = None
+
+try:  # re-compatible engine with a native match timeout
+    import regex
+except ImportError:
+    regex = None
+
+RE2_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+# ``regex`` uses different values for some flags (e.g. ASCII)
+REGEX_FLAGS = ("IGNORECASE", "MULTILINE", "DOTALL", "VERBOSE", "ASCII", "UNICODE", "LOCALE")
+
+_compiled: Dict[Tuple[str, int], re.Pattern] = {}
+_re2_compiled: Dict[Tuple[str, int], Any] = {}
+_regex_compiled: Dict[Tuple[str, int], Any] = {}
+
+
+def parse_flags(names: Optional[List[str]]) -> int:
+    """Combine flag names such as ``"IGNORECASE"`` or ``"i"`` into ``re`` flags."""
+    flags = 0
+    for name in names or []:
+        try:
+            flags |= re.RegexFlag[name.upper()]
+        except KeyError as exc:
+            raise ValueError(f"unknown regex flag: {name}") from exc
+    return flags
+
+
+def _compile(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile each distinct (pattern, flags) once per process."""
+    key = (pattern, flags)
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = _compiled[key] = re.compile(pattern, flags)
+    return compiled
+
+
+def _compile_re2(pattern: str, flags: int) -> Optional[Any]:
+    """RE2 version of a pattern, or None when RE2 is missing or cannot express it."""
+    if re2 is None or flags & ~sum(RE2_FLAGS):
+        return None
+    key = (pattern, flags)
+    if key not in _re2_compiled:
+        inline = "".join(c for f, c in RE2_FLAGS.items() if flags & f)
+        try:
+            _re2_compiled[key] = re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        except Exception:  # backreferences, lookarounds, ...
+            _re2_compiled[key] = None
+    return _re2_compiled[key]
+
+
+def _compile_regex(pattern: str, flags: int) -> Any:
+    """``regex`` version of a pattern, compiled once per (pattern, flags)."""
+    key = (pattern, flags)
+    compiled = _regex_compiled.get(key)
+    if compiled is None:
+        regex_flags = sum(getattr(regex, f) for f in REGEX_FLAGS if flags & re.RegexFlag[f])
+        compiled = _regex_compiled[key] = regex.compile(pattern, regex_flags)
+    return compiled
+
+
+def _match_worker(conn) -> None:
+    while True:
+        try:
+            pattern, flags, text = conn.recv()
+        except EOFError:
+            return
+        conn.send(_compile(pattern, flags).search(text) is not None)
+
+
+class TimedMatcher:
+    """Run searches with a per-match time limit and ``re`` semantics.
+
+    Uses the ``regex`` package's timeout when installed, and otherwise runs
+    ``re`` in a worker process that is killed and restarted when a match
+    overruns.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._proc = None
+        self._conn = None
+
+    def search(self, pattern: str, flags: int, text: str) -> Optional[bool]:
+        """Return whether ``pattern`` matches, or None if it timed out."""
+        if regex is not None:
+            try:
+                return _compile_regex(pattern, flags).search(text, timeout=self.timeout) is not None
+            except TimeoutError:
+                return None
+        if self._proc is None:
+            ctx = multiprocessing.get_context("spawn")
+            self._conn, child = ctx.Pipe()
+            self._proc = ctx.Process(target=_match_worker, args=(child,), daemon=True)
+            self._proc.start()
+            child.close()
+        self._conn.send((pattern, flags, text))
+        if self._conn.poll(self.timeout):
+            return self._conn.recv()
+        self.close()
+        return None
+
+    def close(self) -> None:
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.join()
+            self._conn.close()
+            self._proc = self._conn = None
+
 
 def evaluate(outputs: Dict[str, Any],
              fixtures: Dict[str, Dict[str, Any]],
-             patterns: Dict[str, str]) -> Tuple[float, List[str]]:
+             patterns: Dict[str, str],
+             item_scores: Optional[Dict[str, float]] = None,
+             flags: int = 0,
+             timeout: Optional[float] = None,
+             results: Optional[List[ItemResult]] = None,
+             engine: str = "re") -> Tuple[float, List[str]]:
     """Check whether each output matches a given regex pattern.
 
-    Returns a tuple of (score, failures)."""
+    Returns a tuple of (score, failures). Patterns are compiled once and
+    shared by every fixture using them. With ``timeout`` (seconds) a match
+    that runs too long counts as a miss instead of stalling the run; it never
+    changes what matches. ``engine="re2"`` runs the patterns RE2 supports on
+    RE2 in linear time, with RE2's matching rules (ASCII-only digit, word
+    and word-boundary classes, ``$`` only at the very end), and the others
+    as ``re`` would. If ``item_scores`` is given it is filled with 1.0/0.0
+    per output that has a pattern, and ``results`` with an
+    :class:`ItemResult` per such output."""
+    if engine not in ("re", "re2"):
+        raise ValueError(f"Unsupported regex engine: {engine}")
+    if engine == "re2" and re2 is None:
+        raise ImportError(
+            "google-re2 package required for regex_engine: re2."
+            " Install with: pip install evalgate[re2]"
+        )
     considered = 0
     hits = 0
     fails: List[str] = []
-    for name, out in outputs.items():
-        pattern = patterns.get(name)
-        if pattern is None:
-            # no pattern for this fixture; skip from scoring
-            continue
-        considered += 1
-        text = out if isinstance(out, str) else out.get("output", "") if isinstance(out, dict) else str(out)
-        if re.search(pattern, text):
-            hits += 1
-        else:
-            fails.append(f"{name}: pattern {pattern!r} not found in output")
+    matcher = TimedMatcher(timeout) if timeout else None
+    try:
+        for name, out in outputs.items():
+            pattern = patterns.get(name)
+            if pattern is None:
+                # no pattern for this fixture; skip from scoring
+                continue
+            considered += 1
+            text = out if isinstance(out, str) else out.get("output", "") if isinstance(out, dict) else str(out)
+            compiled = _compile(pattern, flags)  # invalid patterns fail here on every engine
+            linear = _compile_re2(pattern, flags) if engine == "re2" else None
+            if linear is not None:
+                matched = linear.search(text) is not None
+            elif matcher is None:
+                matched = compiled.search(text) is not None
+            else:
+                matched = matcher.search(pattern, flags, text)
+            if item_scores is not None:
+                item_scores[name] = 1.0 if matched else 0.0
+            message = ""
+            if matched:
+                hits += 1
+            elif matched is None:
+                message = f"pattern {pattern!r} timed out after {timeout}s"
+            else:
+                message = f"pattern {pattern!r} not found in output"
+            if message:
+                fails.append(f"{name}: {message}")
+            if results is not None:
+                results.append(ItemResult(name, 1.0 if matched else 0.0, bool(matched), message))
+    finally:
+        if matcher is not None:
+            matcher.close()
     total = considered or 1
     return hits / total, fails
 
@@ -42,5 +196,14 @@ def run(cfg, ev, outputs, fixtures):
                 patterns[n] = patt
     if not patterns:
         raise ValueError("missing pattern_field or pattern_path")
-    score, fails = evaluate(outputs, fixtures, patterns)
-    return score, fails, {}
+    items: Dict[str, float] = {}
+    results: List[ItemResult] = []
+    score, fails = evaluate(
+        outputs, fixtures, patterns,
+        item_scores=items,
+        flags=parse_flags(ev.regex_flags),
+        timeout=ev.regex_timeout,
+        results=results,
+        engine=ev.regex_engine or "re",
+    )
+    return score, fails, {"items": items, "results": results}
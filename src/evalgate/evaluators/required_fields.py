@@ -1,18 +1,22 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
-from .base import register
+from .base import ItemResult, register
 
 
 def evaluate(outputs: Dict[str, Dict[str, Any]],
-             fixtures: Dict[str, Dict[str, Any]]) -> Tuple[float, List[str]]:
+             fixtures: Dict[str, Dict[str, Any]],
+             item_scores: Optional[Dict[str, float]] = None,
+             results: Optional[List[ItemResult]] = None) -> Tuple[float, List[str]]:
     """Verify required fields are present with non-empty values.
 
     Each fixture may list fields under ``expected``. For every listed field, the
     corresponding output must contain the field with a non-empty value. The
     evaluator returns a tuple of ``(score, failures)`` where ``score`` is the
     fraction of required fields present and ``failures`` details missing or
-    empty fields.
+    empty fields. If ``item_scores`` is given it is filled with 1.0/0.0 per
+    ``name[field]``; ``results`` likewise receives an :class:`ItemResult`
+    per field.
     """
     total = 0
     ok = 0
@@ -24,7 +28,15 @@ def evaluate(outputs: Dict[str, Dict[str, Any]],
         for field in required.keys():
             total += 1
             val = out.get(field)
-            if val is None or val == "" or val == [] or val == {}:
+            missing = val is None or val == "" or val == [] or val == {}
+            if item_scores is not None:
+                item_scores[f"{name}[{field}]"] = 0.0 if missing else 1.0
+            if results is not None:
+                results.append(ItemResult(
+                    f"{name}[{field}]", 0.0 if missing else 1.0, not missing,
+                    "missing or empty field" if missing else "",
+                ))
+            if missing:
                 failures.append(f"{name}: missing or empty field '{field}'")
             else:
                 ok += 1
@@ -34,5 +46,7 @@ def evaluate(outputs: Dict[str, Dict[str, Any]],
 
 @register("required_fields")
 def run(cfg, ev, outputs, fixtures):
-    score, fails = evaluate(outputs, fixtures)
-    return score, fails, {}
+    items: Dict[str, float] = {}
+    results: List[ItemResult] = []
+    score, fails = evaluate(outputs, fixtures, item_scores=items, results=results)
+    return score, fails, {"items": items, "results": results}
@@ -1,12 +1,24 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Tuple
+import functools
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+from .base import ITEM_PASS_SCORE, ItemResult, default_merge, register, register_merger
+
+ROUGE_TYPES = {"rouge1": "rouge1", "rouge2": "rouge2", "rougel": "rougeL"}
 
-from .base import register
 
 def evaluate(outputs: Dict[str, Dict[str, Any]],
              fixtures: Dict[str, Dict[str, Any]],
              field: str,
-             metric: str = "bleu") -> Tuple[float, List[str]]:
+             metric: str = "bleu",
+             item_scores: Optional[Dict[str, float]] = None,
+             metrics: Optional[List[str]] = None,
+             summary: Optional[Dict[str, Any]] = None,
+             workers: Optional[int] = None,
+             results: Optional[List[ItemResult]] = None) -> Tuple[float, List[str]]:
     """Evaluate text quality using BLEU or ROUGE metrics.
 
     Args:
@@ -15,11 +27,25 @@ def evaluate(outputs: Dict[str, Dict[str, Any]],
         field: name of field within each dict that holds the text to compare.
         metric: which metric to compute; ``"bleu"`` or ``"rouge1"``,
             ``"rouge2"`` or ``"rougeL"``.
+        item_scores: optional dict filled with the score of each example.
+        metrics: several metrics to compute in one pass; overrides ``metric``
+            and the first one drives the score.
+        summary: optional dict filled with the mean of each metric, plus
+            ``corpus_bleu`` when BLEU is computed, and the raw sums in
+            ``state`` for merging partial runs.
+        workers: score pairs in this many worker processes.
+        results: optional list filled with an :class:`ItemResult` per
+            example, passing when its score is at least ``ITEM_PASS_SCORE``.
 
     Returns:
-        Average score across examples (between 0 and 1) and a list of per-example
-        scores for debugging.
+        Average score across examples (between 0 and 1) and the metric scores
+        of the examples scoring below ``ITEM_PASS_SCORE``.
     """
+    wanted = [m.lower() for m in (metrics or [metric])]
+    for m in wanted:
+        if m != "bleu" and m not in ROUGE_TYPES:
+            raise ValueError(f"Unsupported metric: {m}")
+
     pairs: List[Tuple[str, str, str]] = []  # (name, reference, hypothesis)
     for name, out in outputs.items():
         exp = fixtures.get(name, {}).get("expected", {})
@@ -32,41 +58,181 @@ def evaluate(outputs: Dict[str, Dict[str, Any]],
     if not pairs:
         return 1.0, []
 
-    metric_lower = metric.lower()
-    scores: List[float] = []
+    _check_dependencies(wanted)
+    texts = [(ref, hyp) for _, ref, hyp in pairs]
+    if workers and workers > 1 and len(texts) >= 2 * workers:
+        size = -(-len(texts) // (workers * 4))  # a few chunks per worker for balance
+        chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            parts = list(pool.map(_score_texts, chunks, [wanted] * len(chunks)))
+    else:
+        parts = [_score_texts(texts, wanted)]
+    scores = {m: [s for part, _ in parts for s in part[m]] for m in wanted}
+    bleu_stats = _sum_bleu_stats([stats for _, stats in parts]) if "bleu" in wanted else None
+
+    primary = scores[wanted[0]]
     fails: List[str] = []
+    for i, (name, _, _) in enumerate(pairs):
+        message = ", ".join(f"{metric_upper(m)}={scores[m][i]:.4f}" for m in wanted)
+        passed = primary[i] >= ITEM_PASS_SCORE
+        if not passed:
+            fails.append(f"{name}: {message}")
+        if results is not None:
+            results.append(ItemResult(name, primary[i], passed, message))
+    if item_scores is not None:
+        item_scores.update(zip((name for name, _, _ in pairs), primary))
+    if summary is not None:
+        state = {"count": len(pairs), "sums": {m: sum(v) for m, v in scores.items()}, "bleu_stats": bleu_stats}
+        summary.update(_summarize(state))
+        summary["state"] = state
+    avg = sum(primary) / len(primary) if primary else 1.0
+    return avg, fails
 
-    if metric_lower == "bleu":
+
+def _check_dependencies(wanted: List[str]) -> None:
+    if "bleu" in wanted:
         try:
-            import sacrebleu
+            import sacrebleu  # noqa: F401
         except ImportError as e:
             raise ImportError(
                 "sacrebleu package required for BLEU evaluator."
                 " Install with: pip install sacrebleu"
             ) from e
-        for name, ref, hyp in pairs:
-            s = sacrebleu.sentence_bleu(hyp, [ref]).score / 100.0
-            scores.append(s)
-            fails.append(f"{name}: BLEU={s:.4f}")
-    elif metric_lower in {"rouge1", "rouge2", "rougel"}:
+    if any(m in ROUGE_TYPES for m in wanted):
         try:
-            from rouge_score import rouge_scorer
+            import rouge_score  # noqa: F401
         except ImportError as e:
             raise ImportError(
                 "rouge-score package required for ROUGE evaluator."
                 " Install with: pip install rouge-score"
             ) from e
-        scorer = rouge_scorer.RougeScorer([metric_lower], use_stemmer=True)
-        for name, ref, hyp in pairs:
-            result = scorer.score(ref, hyp)[metric_lower]
-            s = result.fmeasure
-            scores.append(s)
-            fails.append(f"{name}: {metric_upper(metric_lower)}={s:.4f}")
-    else:
-        raise ValueError(f"Unsupported metric: {metric}")
 
-    avg = sum(scores) / len(scores) if scores else 1.0
-    return avg, fails
+
+class _CachingStemmer:
+    """Porter stemmer that remembers every word it has stemmed."""
+
+    def __init__(self):
+        from nltk.stem import porter
+
+        self._stem = functools.lru_cache(maxsize=None)(porter.PorterStemmer().stem)
+
+    def stem(self, word: str) -> str:
+        return self._stem(word)
+
+
+_stemmer: Optional[_CachingStemmer] = None
+
+
+def _tokenize(text: str) -> List[str]:
+    """Tokenize exactly like ``RougeScorer(use_stemmer=True)``."""
+    global _stemmer
+    from rouge_score import tokenize
+
+    if _stemmer is None:
+        _stemmer = _CachingStemmer()
+    return tokenize.tokenize(text, _stemmer)
+
+
+def lcs_length(a: List[str], b: List[str]) -> int:
+    """Length of the longest common subsequence of two token lists.
+
+    Bit-parallel algorithm (Allison-Dix/Hyyro): each position of the longer
+    sequence is one bit of a Python int, so every token of the shorter one
+    costs a few big-integer operations instead of a row of the DP table.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return 0
+    masks: Dict[str, int] = {}
+    for i, tok in enumerate(a):
+        masks[tok] = masks.get(tok, 0) | (1 << i)
+    full = (1 << len(a)) - 1
+    v = full
+    for tok in b:
+        u = v & masks.get(tok, 0)
+        v = ((v + u) | (v - u)) & full
+    return len(a) - v.bit_count()
+
+
+def _lcs_fmeasure(target: List[str], prediction: List[str]) -> float:
+    """ROUGE-L F-measure, as ``rouge_scorer._score_lcs`` computes it."""
+    from rouge_score import scoring
+
+    if not target or not prediction:
+        return 0.0
+    lcs = lcs_length(target, prediction)
+    return scoring.fmeasure(lcs / len(prediction), lcs / len(target))
+
+
+def _ngram_fmeasure(target: List[str], prediction: List[str], n: int) -> float:
+    """ROUGE-N F-measure, as ``rouge_scorer._score_ngrams`` computes it."""
+    from rouge_score import scoring
+
+    target_ngrams = Counter(tuple(target[i:i + n]) for i in range(len(target) - n + 1))
+    prediction_ngrams = Counter(tuple(prediction[i:i + n]) for i in range(len(prediction) - n + 1))
+    overlap = sum(min(count, prediction_ngrams[g]) for g, count in target_ngrams.items())
+    precision = overlap / max(sum(prediction_ngrams.values()), 1)
+    recall = overlap / max(sum(target_ngrams.values()), 1)
+    return scoring.fmeasure(precision, recall)
+
+
+def _score_texts(texts: List[Tuple[str, str]],
+                 wanted: List[str]) -> Tuple[Dict[str, List[float]], Optional[List[Any]]]:
+    """Score ``(reference, hypothesis)`` pairs; runs in worker processes too.
+
+    Returns per-metric scores in input order and, for BLEU, the summed
+    ``[correct, total, sys_len, ref_len]`` statistics.
+    """
+    scores: Dict[str, List[float]] = {m: [] for m in wanted}
+    bleu_stats: Optional[List[Any]] = None
+    if "bleu" in wanted:
+        from sacrebleu.metrics import BLEU
+
+        bleu = BLEU(effective_order=True)  # same settings as sacrebleu.sentence_bleu
+        per_pair = []
+        for ref, hyp in texts:
+            result = bleu.sentence_score(hyp, [ref])
+            scores["bleu"].append(result.score / 100.0)
+            per_pair.append([result.counts, result.totals, result.sys_len, result.ref_len])
+        bleu_stats = _sum_bleu_stats(per_pair)
+
+    rouge_wanted = [m for m in wanted if m in ROUGE_TYPES]
+    if rouge_wanted:
+        # each pair is tokenized once for all requested ROUGE types
+        for ref, hyp in texts:
+            target, prediction = _tokenize(ref), _tokenize(hyp)
+            for m in rouge_wanted:
+                if m == "rougel":
+                    scores[m].append(_lcs_fmeasure(target, prediction))
+                else:
+                    scores[m].append(_ngram_fmeasure(target, prediction, int(m[5:])))
+    return scores, bleu_stats
+
+
+def _sum_bleu_stats(stats: List[List[Any]]) -> List[Any]:
+    """Add up ``[correct, total, sys_len, ref_len]`` BLEU statistics."""
+    return [
+        [sum(col) for col in zip([0] * 4, *(s[0] for s in stats))],
+        [sum(col) for col in zip([0] * 4, *(s[1] for s in stats))],
+        sum(s[2] for s in stats),
+        sum(s[3] for s in stats),
+    ]
+
+
+def _summarize(state: Dict[str, Any]) -> Dict[str, float]:
+    """Per-metric means and corpus BLEU from summed statistics."""
+    metrics = {m: total / state["count"] for m, total in state["sums"].items()}
+    if state.get("bleu_stats") is not None:
+        from sacrebleu.metrics import BLEU
+
+        correct, total, sys_len, ref_len = state["bleu_stats"]
+        # matches BLEU().corpus_score over the same pairs
+        metrics["corpus_bleu"] = BLEU.compute_bleu(
+            correct, total, sys_len, ref_len, smooth_method="exp"
+        ).score / 100.0
+    return metrics
 
 
 def metric_upper(m: str) -> str:
@@ -78,10 +244,39 @@ def metric_upper(m: str) -> str:
 def run(cfg, ev, outputs, fixtures):
     if not ev.expected_field:
         raise ValueError("missing required field: expected_field")
+    items: Dict[str, float] = {}
+    summary: Dict[str, Any] = {}
+    results: List[ItemResult] = []
     score, fails = evaluate(
         outputs=outputs,
         fixtures=fixtures,
         field=ev.expected_field,
         metric=ev.metric or "bleu",
+        item_scores=items,
+        metrics=ev.metrics,
+        summary=summary,
+        workers=ev.workers,
+        results=results,
     )
-    return score, fails, {}
+    extra: Dict[str, Any] = {"items": items, "results": results}
+    if ev.metrics and summary:
+        extra["state"] = summary.pop("state")
+        extra["metrics"] = summary
+    return score, fails, extra
+
+
+@register_merger("rouge_bleu")
+def merge(cfg, ev, partials):
+    score, failures, extra = default_merge(cfg, ev, partials)
+    states = [p["extra"]["state"] for p in partials if p.get("extra", {}).get("state")]
+    if states:
+        state = {
+            "count": sum(s["count"] for s in states),
+            "sums": {m: sum(s["sums"][m] for s in states) for m in states[0]["sums"]},
+            "bleu_stats": None,
+        }
+        if states[0]["bleu_stats"] is not None:
+            state["bleu_stats"] = _sum_bleu_stats([s["bleu_stats"] for s in states])
+        extra["state"] = state
+        extra["metrics"] = _summarize(state)
+    return score, failures, extra
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from .base import register
+from .base import ItemResult, register
 
 
 def evaluate(
     outputs: Dict[str, Dict[str, Any]],
     expected: Dict[str, List[Dict[str, Any]]],
+    item_scores: Optional[Dict[str, float]] = None,
+    results: Optional[List[ItemResult]] = None,
 ) -> Tuple[float, List[str]]:
-    """Compare logged tool calls against expected sequences."""
+    """Compare logged tool calls against expected sequences.
+
+    If ``item_scores`` is given it is filled with 1.0/0.0 per expected item,
+    and ``results`` with an :class:`ItemResult` per expected item."""
     considered = 0
     hits = 0
     fails: List[str] = []
@@ -19,27 +24,28 @@ def evaluate(
         if not isinstance(calls, list):
             calls = []
         considered += 1
+        call, message = None, ""
         if len(calls) != len(exp_calls):
-            fails.append(
-                f"{name}: expected {len(exp_calls)} calls but got {len(calls)}"
-            )
-            continue
-        mismatch = False
-        for i, (exp, got) in enumerate(zip(exp_calls, calls)):
-            if exp.get("name") != got.get("name"):
-                fails.append(
-                    f"{name}[{i}]: expected tool {exp.get('name')!r} got {got.get('name')!r}"
-                )
-                mismatch = True
-                break
-            if exp.get("args") != got.get("args"):
-                fails.append(
-                    f"{name}[{i}]: expected args {exp.get('args')!r} got {got.get('args')!r}"
-                )
-                mismatch = True
-                break
-        if not mismatch:
+            message = f"expected {len(exp_calls)} calls but got {len(calls)}"
+        else:
+            for i, (exp, got) in enumerate(zip(exp_calls, calls)):
+                if exp.get("name") != got.get("name"):
+                    call, message = i, f"expected tool {exp.get('name')!r} got {got.get('name')!r}"
+                    break
+                if exp.get("args") != got.get("args"):
+                    call, message = i, f"expected args {exp.get('args')!r} got {got.get('args')!r}"
+                    break
+        if item_scores is not None:
+            item_scores[name] = 0.0 if message else 1.0
+        if results is not None:
+            detail = message if call is None else f"call {call}: {message}"
+            results.append(ItemResult(name, 0.0 if message else 1.0, not message, detail))
+        if not message:
             hits += 1
+        elif call is None:
+            fails.append(f"{name}: {message}")
+        else:
+            fails.append(f"{name}[{call}]: {message}")
     total = considered or 1
     return hits / total, fails
 
@@ -49,5 +55,7 @@ def run(cfg, ev, outputs, fixtures):
     expected = ev.expected_tool_calls
     if not expected:
         raise ValueError("expected_tool_calls must be provided")
-    score, fails = evaluate(outputs, expected)
-    return score, fails, {}
+    items: Dict[str, float] = {}
+    results: List[ItemResult] = []
+    score, fails = evaluate(outputs, expected, item_scores=items, results=results)
+    return score, fails, {"items": items, "results": results}
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import yaml
 
-from .base import register
+from .base import ItemResult, merge_items, merge_results, register, register_merger
 
 
 def load_workflow(path: str) -> Dict[str, List[str]]:
@@ -19,30 +19,46 @@ def load_workflow(path: str) -> Dict[str, List[str]]:
     return edges
 
 
-def evaluate(outputs: Dict[str, Any], edges: Dict[str, List[str]]) -> Tuple[float, List[str]]:
+def _steps(out: Any) -> Any:
+    """Return the observed step sequence of an output (may be a non-list)."""
+    if isinstance(out, dict):
+        return out.get("calls") or out.get("states") or []
+    return []
+
+
+def _missing_steps(nodes: Iterable[str], observed: Iterable[str]) -> List[str]:
+    return [f"missing step {step}" for step in sorted(set(nodes) - set(observed))]
+
+
+def evaluate(outputs: Dict[str, Any], edges: Dict[str, List[str]],
+             item_scores: Optional[Dict[str, float]] = None,
+             results: Optional[List[ItemResult]] = None) -> Tuple[float, List[str]]:
     """Verify that observed steps follow DAG edges.
 
-    Returns score and list of failures."""
+    Returns score and list of failures. If ``item_scores`` is given it is
+    filled with 1.0/0.0 per output depending on whether its own sequence is
+    valid. ``results`` receives an :class:`ItemResult` per output plus one
+    without an item per step no output reached."""
     nodes = set(edges.keys()) | {n for dests in edges.values() for n in dests}
     observed_nodes = set()
     fails: List[str] = []
     for name, out in outputs.items():
-        seq: List[str] = []
-        if isinstance(out, dict):
-            seq = out.get("calls") or out.get("states") or []
+        seq = _steps(out)
         if not isinstance(seq, list):
-            fails.append(f"{name}: missing calls/states list")
-            continue
-        for step in seq:
-            if step not in nodes:
-                fails.append(f"{name}: extra step {step}")
-        for a, b in zip(seq, seq[1:]):
-            if b not in edges.get(a, []):
-                fails.append(f"{name}: invalid transition {a}->{b}")
-        observed_nodes.update(seq)
-    missing = nodes - observed_nodes
-    for step in sorted(missing):
-        fails.append(f"missing step {step}")
+            problems = ["missing calls/states list"]
+        else:
+            problems = [f"extra step {step}" for step in seq if step not in nodes]
+            problems += [f"invalid transition {a}->{b}" for a, b in zip(seq, seq[1:]) if b not in edges.get(a, [])]
+            observed_nodes.update(seq)
+        if item_scores is not None:
+            item_scores[name] = 0.0 if problems else 1.0
+        if results is not None:
+            results.append(ItemResult(name, 0.0 if problems else 1.0, not problems, "; ".join(problems)))
+        fails.extend(f"{name}: {problem}" for problem in problems)
+    missing = _missing_steps(nodes, observed_nodes)
+    fails.extend(missing)
+    if results is not None:
+        results.extend(ItemResult("", None, False, step) for step in missing)
     score = 1.0 if not fails else 0.0
     return score, fails
 
@@ -52,5 +68,30 @@ def run(cfg, ev, outputs, fixtures):
     if not ev.workflow_path:
         raise ValueError("workflow_path is required")
     edges = load_workflow(ev.workflow_path)
-    score, fails = evaluate(outputs, edges)
-    return score, fails, {}
+    items: Dict[str, float] = {}
+    results: List[ItemResult] = []
+    score, fails = evaluate(outputs, edges, item_scores=items, results=results)
+    nodes = set(edges.keys()) | {n for dests in edges.values() for n in dests}
+    observed = {step for out in outputs.values() if isinstance(_steps(out), list) for step in _steps(out)}
+    state = {"nodes": sorted(nodes), "observed": sorted(observed & nodes)}
+    return score, fails, {"items": items, "results": results, "state": state}
+
+
+@register_merger("workflow")
+def merge(cfg, ev, partials):
+    """Recompute missing steps over the union of steps seen by all shards."""
+    nodes: set = set()
+    observed: set = set()
+    fails: List[str] = []
+    for part in partials:
+        state = part["extra"].get("state", {})
+        nodes.update(state.get("nodes", []))
+        observed.update(state.get("observed", []))
+        shard_missing = set(_missing_steps(state.get("nodes", []), state.get("observed", [])))
+        fails.extend(f for f in part.get("failures", []) if f not in shard_missing)
+    missing = _missing_steps(nodes, observed)
+    fails.extend(missing)
+    # shard-level missing steps are replaced by the ones over all shards
+    results = [r for r in merge_results(partials) if r.item]
+    results += [ItemResult("", None, False, step) for step in missing]
+    return (1.0 if not fails else 0.0), fails, {"items": merge_items(partials), "results": results}
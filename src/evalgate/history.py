@@ -0,0 +1,115 @@
+"""Append-only history of run scores keyed by commit, with sparkline plots."""
+
+from __future__ import annotations
+
+import base64
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+HISTORY_PATH = Path('.evalgate/history.db')
+OVERALL = 'overall'  # series name of the weighted overall score
+WINDOW = 200  # runs shown in trend plots
+
+
+def _connect() -> sqlite3.Connection:
+    HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(HISTORY_PATH, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS runs ('
+        'id INTEGER PRIMARY KEY AUTOINCREMENT, commit_sha TEXT, recorded_at REAL NOT NULL, '
+        'overall REAL NOT NULL, passed INTEGER NOT NULL)'
+    )
+    conn.execute('CREATE INDEX IF NOT EXISTS runs_commit ON runs (commit_sha, id)')
+    # clustered by evaluator so a trend query reads one contiguous range
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS scores ('
+        'evaluator TEXT NOT NULL, run_id INTEGER NOT NULL, score REAL NOT NULL, '
+        'PRIMARY KEY (evaluator, run_id)) WITHOUT ROWID'
+    )
+    return conn
+
+
+def record(result: Dict[str, Any], commit: Optional[str]) -> int:
+    """Append the scores of ``result`` as a run of ``commit``; returns the run id."""
+    conn = _connect()
+    try:
+        with conn:
+            cur = conn.execute(
+                'INSERT INTO runs (commit_sha, recorded_at, overall, passed) VALUES (?, ?, ?, ?)',
+                (commit, time.time(), result['overall'], int(bool(result['gate']['passed']))),
+            )
+            run_id = cur.lastrowid
+            conn.executemany(
+                'INSERT INTO scores (evaluator, run_id, score) VALUES (?, ?, ?)',
+                ((s['name'], run_id, s['score']) for s in result['scores']),
+            )
+        return run_id
+    finally:
+        conn.close()
+
+
+def series(evaluator: str, limit: int = WINDOW) -> List[Tuple[Optional[str], float]]:
+    """Last ``limit`` ``(commit, score)`` points of ``evaluator``, oldest first.
+
+    A commit that was run several times contributes its latest run.
+    ``evaluator`` may be ``"overall"`` for the weighted overall score."""
+    if not HISTORY_PATH.exists():
+        return []
+    latest = 'SELECT MAX(id) FROM runs GROUP BY commit_sha'
+    conn = _connect()
+    try:
+        if evaluator == OVERALL:
+            rows = conn.execute(
+                f'SELECT commit_sha, overall FROM runs WHERE id IN ({latest}) ORDER BY id DESC LIMIT ?',
+                (limit,),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                'SELECT r.commit_sha, s.score FROM scores s JOIN runs r ON r.id = s.run_id '
+                f'WHERE s.evaluator = ? AND s.run_id IN ({latest}) ORDER BY s.run_id DESC LIMIT ?',
+                (evaluator, limit),
+            ).fetchall()
+    finally:
+        conn.close()
+    return rows[::-1]
+
+
+def sparkline_svg(values: List[float], width: int = 120, height: int = 24) -> str:
+    """Polyline SVG of ``values`` scaled to their own min/max."""
+    lo, hi = min(values), max(values)
+    span = (hi - lo) or 1.0
+    step = width / max(len(values) - 1, 1)
+    points = ' '.join(
+        f'{i * step:.1f},{height - 2 - (v - lo) / span * (height - 4):.1f}' for i, v in enumerate(values)
+    )
+    last_x, last_y = points.rsplit(' ', 1)[-1].split(',')
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">'
+        f'<polyline fill="none" stroke="#0969da" stroke-width="1.5" points="{points}"/>'
+        f'<circle cx="{last_x}" cy="{last_y}" r="2" fill="#0969da"/></svg>'
+    )
+
+
+def plots(names: List[str], limit: int = WINDOW) -> List[Dict[str, str]]:
+    """Sparkline per series with at least two points, as ``plots`` entries.
+
+    The SVG is inlined as a ``data:`` URI so the image renders wherever the
+    markdown report is posted, without a file to host alongside it.
+    """
+    entries = []
+    for name in names:
+        points = series(name, limit)
+        if len(points) < 2:
+            continue
+        values = [score for _, score in points]
+        svg = base64.b64encode(sparkline_svg(values).encode('utf-8')).decode('ascii')
+        entries.append({
+            'title': f'{name}: {values[0]:.2f} → {values[-1]:.2f} over {len(values)} runs',
+            'sparkline': f'data:image/svg+xml;base64,{svg}',
+        })
+    return entries
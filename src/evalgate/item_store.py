@@ -0,0 +1,74 @@
+"""Indexed SQLite sidecar holding the per-item result records of a run."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from .evaluators.base import ItemResult
+
+SUFFIX = '.items.db'
+
+
+def sidecar_path(output: str) -> Path:
+    """Sidecar file written next to the results JSON at ``output``."""
+    path = Path(output)
+    return path.with_name(path.stem + SUFFIX)
+
+
+def write(path: Path, records: Iterable[ItemResult]) -> int:
+    """Replace the sidecar at ``path`` with ``records``; returns the row count."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'{path.name}.tmp{os.getpid()}')
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp)
+    try:
+        with conn:
+            conn.execute(
+                'CREATE TABLE results ('
+                'evaluator TEXT NOT NULL, item TEXT NOT NULL, score REAL, '
+                'passed INTEGER NOT NULL, message TEXT NOT NULL)'
+            )
+            conn.executemany(
+                'INSERT INTO results (evaluator, item, score, passed, message) VALUES (?, ?, ?, ?, ?)',
+                ((r.evaluator, r.item, r.score, int(r.passed), r.message) for r in records),
+            )
+            # indexes are built after the bulk insert, which is cheaper than maintaining them
+            conn.execute('CREATE INDEX results_item ON results (item)')
+            conn.execute('CREATE INDEX results_passed ON results (passed, evaluator)')
+        count = conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+    finally:
+        conn.close()
+    tmp.replace(path)
+    return count
+
+
+def iterate(path: Path, evaluator: Optional[str] = None, item: Optional[str] = None,
+            passed: Optional[bool] = None, limit: Optional[int] = None) -> Iterator[ItemResult]:
+    """Stream the records in ``path`` matching the given filters, in the order they were written."""
+    clauses, params = [], []
+    for column, value in (('evaluator', evaluator), ('item', item), ('passed', passed)):
+        if value is not None:
+            clauses.append(f'{column} = ?')
+            params.append(int(value) if column == 'passed' else value)
+    sql = 'SELECT item, score, passed, message, evaluator FROM results'
+    if clauses:
+        sql += ' WHERE ' + ' AND '.join(clauses)
+    sql += ' ORDER BY rowid'
+    if limit is not None:
+        sql += ' LIMIT ?'
+        params.append(limit)
+    conn = sqlite3.connect(f'{Path(path).resolve().as_uri()}?mode=ro', uri=True)
+    try:
+        for i, s, p, m, e in conn.execute(sql, params):
+            yield ItemResult(i, s, bool(p), m, e)
+    finally:
+        conn.close()
+
+
+def query(path: Path, evaluator: Optional[str] = None, item: Optional[str] = None,
+          passed: Optional[bool] = None, limit: Optional[int] = None) -> List[ItemResult]:
+    """Records in ``path`` matching the given filters, in the order they were written."""
+    return list(iterate(path, evaluator, item, passed, limit))
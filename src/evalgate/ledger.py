@@ -0,0 +1,193 @@
+"""Content-hash ledger of per-item evaluator results for incremental runs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import __version__
+from .config import Config, EvaluatorCfg, EvaluatorType
+from .evaluators.base import Evaluator, ItemResult
+
+LEDGER_PATH = Path('.evalgate/ledger.db')
+LEDGER_VERSION = 2
+MAX_AGE_DAYS = 14  # rows unused for this long are dropped after a run
+
+# Evaluators whose score is the mean of independent per-item scores and whose
+# failures are prefixed with the item name, so items can be scored separately.
+INCREMENTAL = {
+    EvaluatorType.SCHEMA,
+    EvaluatorType.REGEX,
+    EvaluatorType.REQUIRED_FIELDS,
+    EvaluatorType.EMBEDDING,
+    EvaluatorType.ROUGE_BLEU,
+    EvaluatorType.CONVERSATION,
+}
+
+# Settings that do not change how a single item is scored.
+_IGNORED_FIELDS = {
+    'name', 'weight', 'min_score', 'enabled', 'concurrency', 'timeout', 'max_connections', 'vector_cache',
+    'num_threads', 'workers', 'top_confusions',
+}
+_FILE_FIELDS = ('schema_path', 'pattern_path', 'prompt_path', 'workflow_path')
+
+
+def _connect() -> sqlite3.Connection:
+    LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(LEDGER_PATH, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS items ('
+        'key TEXT PRIMARY KEY, result TEXT NOT NULL, accessed_at REAL NOT NULL)'
+    )
+    conn.execute('CREATE INDEX IF NOT EXISTS items_accessed ON items (accessed_at)')
+    return conn
+
+
+def _digest(payload: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+    ).hexdigest()
+
+
+def evaluator_key(ev: EvaluatorCfg) -> str:
+    """Hash the evaluator settings and referenced files that affect item scores."""
+    settings = ev.model_dump(mode='json', exclude=_IGNORED_FIELDS)
+    files = {}
+    for field in _FILE_FIELDS:
+        path = getattr(ev, field)
+        if path and Path(path).is_file():
+            files[field] = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    return _digest({'v': LEDGER_VERSION, 'evalgate': __version__, 'settings': settings, 'files': files})
+
+
+def item_key(ev_key: str, name: str, fixture: Optional[Dict[str, Any]], output: Any) -> str:
+    return _digest({'ev': ev_key, 'name': name, 'fixture': fixture, 'output': output})
+
+
+def _owner(label: str, names: set[str]) -> Optional[str]:
+    """Map an item id or failure message to the fixture name it belongs to."""
+    head = label.partition(': ')[0]
+    if head in names:
+        return head
+    if head.endswith(']') and '[' in head:
+        base = head[:head.rindex('[')]
+        if base in names:
+            return base
+    return None
+
+
+def _split(names: List[str], failures: List[str], items: Dict[str, float],
+           results: Optional[List[Any]] = None) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Attribute a run's items, failures and results to fixtures; None if impossible."""
+    known = set(names)
+    per_item: Dict[str, Dict[str, Any]] = {n: {'items': {}, 'failures': [], 'results': []} for n in names}
+    for item_id, score in items.items():
+        owner = _owner(item_id, known)
+        if owner is None:
+            return None
+        per_item[owner]['items'][item_id] = score
+    for failure in failures:
+        owner = _owner(failure, known)
+        if owner is None:
+            return None
+        per_item[owner]['failures'].append(failure)
+    for row in results or []:
+        owner = _owner(row[0], known)
+        if owner is None:
+            return None
+        per_item[owner]['results'].append(list(row))
+    return per_item
+
+
+def run_incremental(func: Evaluator, cfg: Config, ev: EvaluatorCfg,
+                    outputs: Dict[str, Dict[str, Any]],
+                    fixtures: Dict[str, Dict[str, Any]]) -> Tuple[float, List[str], Dict[str, Any]]:
+    """Run ``func`` only on items whose fixture, output or settings changed.
+
+    Results for unchanged items come from the ledger and the evaluator score
+    is re-aggregated as the mean of all item scores. Falls back to a full run
+    whenever a result cannot be attributed to individual items.
+    """
+    if ev.type not in INCREMENTAL or (ev.type == EvaluatorType.ROUGE_BLEU and ev.metrics):
+        # multi-metric rouge_bleu also reports corpus BLEU, which needs every pair
+        return func(cfg, ev, outputs, fixtures)
+    ev_key = evaluator_key(ev)
+    keys = {n: item_key(ev_key, n, fixtures.get(n), out) for n, out in outputs.items()}
+    conn = _connect()
+    try:
+        cached: Dict[str, Dict[str, Any]] = {}
+        key_list = list(keys.values())
+        for i in range(0, len(key_list), 500):
+            chunk = key_list[i:i + 500]
+            rows = conn.execute(
+                f'SELECT key, result FROM items WHERE key IN ({",".join("?" * len(chunk))})', chunk
+            )
+            cached.update((k, json.loads(v)) for k, v in rows)
+
+        results = {n: cached[k] for n, k in keys.items() if k in cached}
+        stale = [n for n in outputs if n not in results]
+        if stale:
+            try:
+                _, fails, extra = func(
+                    cfg, ev,
+                    {n: outputs[n] for n in stale},
+                    {n: fixtures[n] for n in stale if n in fixtures},
+                )
+            except Exception:
+                return func(cfg, ev, outputs, fixtures)
+            fresh = _split(stale, fails, extra.get('items') or {}, extra.get('results'))
+            if fresh is None:
+                return func(cfg, ev, outputs, fixtures)
+            results.update(fresh)
+
+        items: Dict[str, float] = {}
+        failures: List[str] = []
+        records: List[ItemResult] = []
+        for n in outputs:
+            items.update(results[n]['items'])
+            failures.extend(results[n]['failures'])
+            records.extend(ItemResult(*row) for row in results[n]['results'])
+        if not items:
+            # nothing scorable; let the evaluator apply its own default score
+            return func(cfg, ev, outputs, fixtures)
+
+        now = time.time()
+        with conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO items (key, result, accessed_at) VALUES (?, ?, ?)',
+                ((keys[n], json.dumps(results[n], ensure_ascii=False), now) for n in stale),
+            )
+            conn.executemany(
+                'UPDATE items SET accessed_at = ? WHERE key = ?',
+                ((now, keys[n]) for n in outputs if n not in stale),
+            )
+        return sum(items.values()) / len(items), failures, {'items': items, 'results': records}
+    finally:
+        conn.close()
+
+
+def prune(max_age_days: float = MAX_AGE_DAYS) -> int:
+    """Drop rows not used within ``max_age_days``; returns the number removed."""
+    if not LEDGER_PATH.exists():
+        return 0
+    conn = _connect()
+    try:
+        with conn:
+            cur = conn.execute(
+                'DELETE FROM items WHERE accessed_at < ?', (time.time() - max_age_days * 86400,)
+            )
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+def clear() -> None:
+    for path in (LEDGER_PATH, Path(f'{LEDGER_PATH}-wal'), Path(f'{LEDGER_PATH}-shm')):
+        if path.exists():
+            path.unlink()
@@ -0,0 +1,120 @@
+"""Sentence embeddings from an exported ONNX model on onnxruntime (CPU)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, List, Optional
+
+QUANTIZED_DIR = Path('.evalgate/onnx')
+_ONNX_FILES = ('model.onnx', 'onnx/model.onnx')
+
+
+def _resolve(model: str) -> Path:
+    """Return a local directory with the ONNX model and ``tokenizer.json``."""
+    if Path(model).is_dir():
+        return Path(model)
+    try:
+        from huggingface_hub import snapshot_download
+    except ImportError as e:
+        raise ImportError(
+            "huggingface_hub package required to download ONNX models by name."
+            " Install with: pip install huggingface_hub, or point model at a local directory"
+        ) from e
+    return Path(snapshot_download(model, allow_patterns=['*.json', '*.txt', 'onnx/model.onnx', 'model.onnx']))
+
+
+def _quantized(source: Path) -> Path:
+    """Dynamically quantize ``source`` to int8 once and reuse the result."""
+    stat = source.stat()
+    tag = hashlib.sha256(f'{source.resolve()}:{stat.st_size}:{stat.st_mtime_ns}'.encode()).hexdigest()[:16]
+    target = QUANTIZED_DIR / f'{tag}.int8.onnx'
+    if not target.exists():
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix('.tmp')
+        quantize_dynamic(str(source), str(tmp), weight_type=QuantType.QInt8)
+        tmp.replace(target)
+    return target
+
+
+class OnnxEncoder:
+    """Drop-in for ``SentenceTransformer.encode`` backed by onnxruntime.
+
+    Expects a sentence-transformers style export: ``model.onnx`` (or
+    ``onnx/model.onnx``) producing token embeddings, ``tokenizer.json`` and
+    optionally ``sentence_bert_config.json`` (``max_seq_length``) and
+    ``1_Pooling/config.json`` (CLS or mean pooling, mean by default).
+    """
+
+    def __init__(self, model: str, quantize: bool = False, num_threads: Optional[int] = None):
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError(
+                "onnxruntime and tokenizers packages required for the onnx embedding backend."
+                " Install with: pip install evalgate[onnx]"
+            ) from e
+        root = _resolve(model)
+        source = next((root / f for f in _ONNX_FILES if (root / f).exists()), None)
+        if source is None:
+            raise FileNotFoundError(
+                f"no model.onnx found for {model!r}; export one with"
+                " `optimum-cli export onnx --model <name> <dir>`"
+            )
+        path = _quantized(source) if quantize else source
+
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        opts.inter_op_num_threads = 1
+        if num_threads:
+            opts.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(str(path), opts, providers=['CPUExecutionProvider'])
+        self.inputs = {i.name for i in self.session.get_inputs()}
+
+        max_length = 512
+        st_config = root / 'sentence_bert_config.json'
+        if st_config.exists():
+            max_length = json.loads(st_config.read_text(encoding='utf-8')).get('max_seq_length') or max_length
+        self.tokenizer = Tokenizer.from_file(str(root / 'tokenizer.json'))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        pad_token = self.tokenizer.padding['pad_token'] if self.tokenizer.padding else '[PAD]'
+        self.tokenizer.enable_padding(pad_id=self.tokenizer.token_to_id(pad_token) or 0, pad_token=pad_token)
+
+        self.pooling = 'mean'
+        pooling = root / '1_Pooling' / 'config.json'
+        if pooling.exists() and json.loads(pooling.read_text(encoding='utf-8')).get('pooling_mode_cls_token'):
+            self.pooling = 'cls'
+
+    def encode(self, texts: List[Any], batch_size: int = 32, normalize_embeddings: bool = True):
+        import numpy as np
+
+        texts = [str(t) for t in texts]
+        # batch texts of similar length together to minimise padding
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        out: Optional[Any] = None
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            encodings = self.tokenizer.encode_batch([texts[i] for i in batch])
+            mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+            feed = {'input_ids': np.array([e.ids for e in encodings], dtype=np.int64), 'attention_mask': mask}
+            if 'token_type_ids' in self.inputs:
+                feed['token_type_ids'] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+            hidden = self.session.run(None, {k: v for k, v in feed.items() if k in self.inputs})[0]
+            if hidden.ndim == 3:
+                if self.pooling == 'cls':
+                    hidden = hidden[:, 0]
+                else:
+                    weights = mask[:, :, None].astype(hidden.dtype)
+                    hidden = (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+            if out is None:
+                out = np.empty((len(texts), hidden.shape[-1]), dtype=np.float32)
+            out[batch] = hidden
+        if out is None:
+            return np.empty((0, 0), dtype=np.float32)
+        if normalize_embeddings:
+            out /= np.clip(np.linalg.norm(out, axis=1, keepdims=True), 1e-12, None)
+        return out
@@ -1,8 +1,60 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
+EXAMPLES = 3  # representative failures shown per group
+_QUOTED = re.compile(r"'[^']*'|\"[^\"]*\"")
+# standalone numbers only; digits inside identifiers such as rouge1 are kept
+_NUMBER = re.compile(r"(?<![\w.])[-+]?\d+(?:\.\d+)?(?:e[-+]?\d+)?\b")
 
-def render_markdown(result: Dict[str, Any], max_failures: int = 20) -> str:
+
+def failure_template(message: str) -> str:
+    """``message`` with quoted values and numbers replaced by placeholders."""
+    return _NUMBER.sub("<n>", _QUOTED.sub("<s>", message)).replace("`", "'")
+
+
+def split_failures(failures: Iterable[str], evaluators: Iterable[str] = ()) -> Iterable[Tuple[str, str, str]]:
+    """Yield ``(evaluator, item, message)`` for flat ``"<name>: <message>"`` failures.
+
+    A head naming an evaluator is taken as the evaluator, any other head as the item."""
+    names = set(evaluators)
+    for failure in failures:
+        head, sep, message = failure.partition(": ")
+        if not sep:
+            yield "", "", failure
+        elif head in names:
+            yield head, "", message
+        else:
+            yield "", head, message
+
+
+def group_failures(rows: Iterable[Tuple[str, str, str]],
+                   examples: int = EXAMPLES) -> List[Dict[str, Any]]:
+    """Group ``(evaluator, item, message)`` rows by evaluator and message template.
+
+    One pass over ``rows`` keeps a count and the first ``examples`` failures
+    of each group. Groups are returned largest first, ties in order of
+    first appearance."""
+    groups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for evaluator, item, message in rows:
+        key = (evaluator, failure_template(message))
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {"evaluator": key[0], "template": key[1], "count": 0, "examples": []}
+        group["count"] += 1
+        if len(group["examples"]) < examples:
+            group["examples"].append(f"{item}: {message}" if item else message)
+    return sorted(groups.values(), key=lambda g: -g["count"])
+
+
+def render_markdown(result: Dict[str, Any], max_failures: int = 20,
+                    records: Optional[Iterable[Any]] = None) -> str:
+    """Render ``result`` as markdown.
+
+    Failures are grouped by evaluator and message template and at most
+    ``max_failures`` groups are listed. ``records`` may stream the failing
+    per-item records of the run, which name their evaluator; otherwise
+    the flat ``failures`` list is grouped."""
     # Show evaluator errors prominently in status
     evaluator_errors = result.get("evaluator_errors", [])
     if evaluator_errors:
@@ -27,28 +79,63 @@ def render_markdown(result: Dict[str, Any], max_failures: int = 20) -> str:
     for item in result["scores"]:
         delta = item.get("delta")
         if delta is not None:
-            deltas.append((item["name"], delta))
+            deltas.append((item["name"], delta, item.get("delta_ci")))
         delta_str = f" ({delta:+.2f} vs main)" if delta is not None else ""
+        ci = item.get("ci")
+        ci_str = f" [{ci[0]:.2f}, {ci[1]:.2f}]" if ci else ""
         status = "✅" if item.get("passed", True) else "❌"
         min_str = (
             f" (min {item['min_score']:.2f})" if item.get("min_score") is not None else ""
         )
         lines.append(
-            f"- {item['name']}: {item['score']:.2f}{delta_str} → {status}{min_str}"
+            f"- {item['name']}: {item['score']:.2f}{ci_str}{delta_str} → {status}{min_str}"
         )
     if deltas:
         lines += ["", "**Baseline Deltas**"]
-        lines.append("| Metric | Δ vs baseline |")
-        lines.append("| --- | --- |")
-        for name, delta in deltas:
-            lines.append(f"| {name} | {delta:+.2f} |")
+        if any(ci for _, _, ci in deltas):
+            level = result["gate"].get("confidence", 0.95)
+            lines.append(f"| Metric | Δ vs baseline | {level:.0%} CI |")
+            lines.append("| --- | --- | --- |")
+            for name, delta, ci in deltas:
+                ci_str = f"{ci[0]:+.3f} … {ci[1]:+.3f}" if ci else "–"
+                lines.append(f"| {name} | {delta:+.2f} | {ci_str} |")
+        else:
+            lines.append("| Metric | Δ vs baseline |")
+            lines.append("| --- | --- |")
+            for name, delta, _ in deltas:
+                lines.append(f"| {name} | {delta:+.2f} |")
+    flipped = [
+        (item["name"], item["flips"]) for item in result["scores"]
+        if item.get("flips") and (item["flips"]["to_fail"] or item["flips"]["to_pass"])
+    ]
+    if flipped:
+        lines += ["", "**Items Flipped vs Baseline**"]
+        for name, flips in flipped:
+            lines.append(
+                f"- {name}: {len(flips['to_fail'])} pass → fail, {len(flips['to_pass'])} fail → pass"
+            )
+            for item_name in flips["to_fail"][:max_failures]:
+                lines.append(f"  - ❌ {item_name}")
+            if len(flips["to_fail"]) > max_failures:
+                lines.append(f"  - … +{len(flips['to_fail']) - max_failures} more")
     if result.get("latency") is not None and result.get("cost") is not None:
         lines.append(f"- Latency/Cost: p95 {int(result['latency'])}ms / ${result['cost']:.3f}")
-    lines += ["", f"**Failures ({len(result['failures'])})**"]
-    for f in result["failures"][:max_failures]:
-        lines.append(f"- {f}")
-    if len(result["failures"]) > max_failures:
-        lines.append(f"- … +{len(result['failures'])-max_failures} more")
+    if records is not None:
+        rows: Iterable[Tuple[str, str, str]] = ((r.evaluator, r.item, r.message) for r in records)
+    else:
+        rows = split_failures(result["failures"], (item["name"] for item in result["scores"]))
+    groups = group_failures(rows)
+    lines += ["", f"**Failures ({sum(g['count'] for g in groups)})**"]
+    for group in groups[:max_failures]:
+        label = f"{group['evaluator']}: " if group["evaluator"] else ""
+        if group["count"] == 1:
+            lines.append(f"- {label}{group['examples'][0]}")
+            continue
+        lines.append(f"- {label}`{group['template']}` × {group['count']}")
+        for example in group["examples"]:
+            lines.append(f"  - {example}")
+    if len(groups) > max_failures:
+        lines.append(f"- … +{len(groups) - max_failures} more groups")
     lines += [
         "",
         "**Gate**",
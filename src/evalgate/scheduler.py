@@ -0,0 +1,73 @@
+"""Concurrent scheduling of independent evaluators."""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from .config import Config, EvaluatorCfg, EvaluatorType
+from .evaluators.base import Evaluator
+
+# Evaluators dominated by pure-Python or model CPU work; they run in worker
+# processes so they do not contend for the GIL with everything else.
+CPU_BOUND = {EvaluatorType.ROUGE_BLEU, EvaluatorType.EMBEDDING}
+
+Outcome = Tuple[Tuple[float, List[str], Dict[str, Any]] | None, BaseException | None]
+
+
+def run_evaluators(
+    cfg: Config,
+    jobs: List[Tuple[EvaluatorCfg, Evaluator]],
+    outputs: Dict[str, Dict[str, Any]],
+    fixtures: Dict[str, Dict[str, Any]],
+    workers: int = 1,
+) -> List[Outcome]:
+    """Run evaluator functions and return ``(result, error)`` per job in input order.
+
+    With ``workers <= 1`` every evaluator runs sequentially in the calling
+    thread. Otherwise I/O-bound evaluators share a thread pool and CPU-bound
+    ones (see ``CPU_BOUND``) run in a process pool, both with up to
+    ``workers`` workers.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        return [_outcome_now(func, cfg, ev, outputs, fixtures) for ev, func in jobs]
+
+    cpu = [i for i, (ev, _) in enumerate(jobs) if ev.type in CPU_BOUND]
+    io = [i for i, (ev, _) in enumerate(jobs) if ev.type not in CPU_BOUND]
+    futures: Dict[int, Future] = {}
+    pools: List[Executor] = []
+    try:
+        if cpu:
+            procs = ProcessPoolExecutor(
+                max_workers=min(workers, len(cpu)),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            pools.append(procs)
+            for i in cpu:
+                ev, func = jobs[i]
+                futures[i] = procs.submit(func, cfg, ev, outputs, fixtures)
+        if io:
+            threads = ThreadPoolExecutor(max_workers=min(workers, len(io)))
+            pools.append(threads)
+            for i in io:
+                ev, func = jobs[i]
+                futures[i] = threads.submit(func, cfg, ev, outputs, fixtures)
+        outcomes: List[Outcome] = []
+        for i in range(len(jobs)):
+            try:
+                outcomes.append((futures[i].result(), None))
+            except Exception as e:
+                outcomes.append((None, e))
+        return outcomes
+    finally:
+        for pool in pools:
+            pool.shutdown(wait=True)
+
+
+def _outcome_now(func: Evaluator, cfg: Config, ev: EvaluatorCfg,
+                 outputs: Dict[str, Dict[str, Any]], fixtures: Dict[str, Dict[str, Any]]) -> Outcome:
+    try:
+        return func(cfg, ev, outputs, fixtures), None
+    except Exception as e:
+        return None, e
@@ -0,0 +1,75 @@
+"""Deterministic fixture sharding and merging of per-shard partial results."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, List, Tuple
+
+from .config import Config
+from .evaluators.base import default_merge, mergers
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parse ``"i/N"`` (1-based) into ``(i, N)``."""
+    try:
+        index_s, count_s = spec.split("/", 1)
+        index, count = int(index_s), int(count_s)
+    except ValueError:
+        raise ValueError(f"invalid shard {spec!r}: expected i/N, e.g. 3/8")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"invalid shard {spec!r}: need 1 <= i <= N")
+    return index, count
+
+
+def shard_of(name: str, count: int) -> int:
+    """Return the 1-based shard a fixture name belongs to.
+
+    Uses a content hash rather than list position so adding or removing a
+    fixture never moves other fixtures between shards.
+    """
+    digest = hashlib.sha1(name.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def select_shard(names: List[str], index: int, count: int) -> List[str]:
+    """Return the names assigned to shard ``index`` of ``count``, in order."""
+    return [n for n in names if shard_of(n, count) == index]
+
+
+def merge_partials(
+    cfg: Config, partials: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Combine shard outputs into evaluator records and evaluator errors.
+
+    Evaluator types registered with ``register_merger`` recompute corpus
+    statistics from their shard ``state``; all others average their items.
+    """
+    if not partials:
+        raise ValueError("no partial results to merge")
+    counts = {p.get("shard", {}).get("count") for p in partials}
+    if len(counts) != 1 or None in counts:
+        raise ValueError("partial results come from different shard layouts")
+    count = counts.pop()
+    partials = sorted(partials, key=lambda p: p["shard"]["index"])
+    indices = [p["shard"]["index"] for p in partials]
+    if indices != list(range(1, count + 1)):
+        missing = sorted(set(range(1, count + 1)) - set(indices))
+        if missing:
+            raise ValueError(f"missing shard(s): {', '.join(map(str, missing))} of {count}")
+        raise ValueError("duplicate shard results")
+
+    records: List[Dict[str, Any]] = []
+    for ev in cfg.evaluators:
+        parts = [rec for p in partials for rec in p.get("evaluators", []) if rec["name"] == ev.name]
+        if not parts:
+            continue
+        merger = mergers.get(ev.type, default_merge)
+        score, failures, extra = merger(cfg, ev, parts)
+        records.append({"name": ev.name, "score": float(score), "failures": failures, "extra": extra})
+
+    evaluator_errors: List[str] = []
+    for p in partials:
+        for err in p.get("evaluator_errors", []):
+            if err not in evaluator_errors:
+                evaluator_errors.append(err)
+    return records, evaluator_errors
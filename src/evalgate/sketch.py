@@ -0,0 +1,141 @@
+"""Mergeable quantile sketch for latency and cost distributions."""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+RELATIVE_ACCURACY = 0.01  # quantiles are within 1% of the true value once bucketed
+EXACT_LIMIT = 2048  # up to this many values are kept as-is and quantiles are exact
+MIN_VALUE = 1e-9  # smaller values (including zero and negatives) share one bucket
+
+
+class QuantileSketch:
+    """Log-bucketed quantile sketch with a relative error guarantee (DDSketch).
+
+    Small samples are stored exactly. Past ``EXACT_LIMIT`` values each one is
+    counted in the bucket ``ceil(log_gamma(x))``, so memory depends on the
+    value range rather than the sample size, and two sketches merge by
+    adding bucket counts. Quantiles use the same nearest-rank definition in
+    both modes.
+    """
+
+    def __init__(self, relative_accuracy: float = RELATIVE_ACCURACY, exact_limit: int = EXACT_LIMIT):
+        self.relative_accuracy = relative_accuracy
+        self.exact_limit = exact_limit
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._values: Optional[List[float]] = []
+        self._zeros = 0
+        self._buckets: Dict[int, int] = {}
+
+    @property
+    def exact(self) -> bool:
+        return self._values is not None
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if self._values is not None:
+            self._values.append(value)
+            if len(self._values) > self.exact_limit:
+                self._bucket_values()
+        else:
+            self._bucket(value, 1)
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def _bucket(self, value: float, count: int) -> None:
+        if value < MIN_VALUE:
+            self._zeros += count
+        else:
+            i = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[i] = self._buckets.get(i, 0) + count
+
+    def _bucket_values(self) -> None:
+        values, self._values = self._values or [], None
+        for value in values:
+            self._bucket(value, 1)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the contents of ``other`` to this sketch."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different relative accuracy")
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if (self._values is not None and other._values is not None
+                and len(self._values) + len(other._values) <= self.exact_limit):
+            self._values.extend(other._values)
+            return
+        if self._values is not None:
+            self._bucket_values()
+        if other._values is not None:
+            for value in other._values:
+                self._bucket(value, 1)
+        else:
+            self._zeros += other._zeros
+            for i, count in other._buckets.items():
+                self._buckets[i] = self._buckets.get(i, 0) + count
+
+    def quantile(self, q: float) -> float:
+        """Value at rank ``round(q * (count - 1))`` of the sorted sample; 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = int(round(q * (self.count - 1)))
+        if self._values is not None:
+            return sorted(self._values)[rank]
+        seen = self._zeros
+        if rank < seen:
+            return min(self.min, 0.0)
+        for i in sorted(self._buckets):
+            seen += self._buckets[i]
+            if rank < seen:
+                # midpoint (in relative terms) of (gamma^(i-1), gamma^i]
+                value = 2 * self._gamma ** i / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe form, e.g. for shard partials."""
+        data: Dict[str, Any] = {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+        if self._values is not None:
+            data["values"] = self._values
+        else:
+            data["zeros"] = self._zeros
+            data["buckets"] = {str(i): c for i, c in sorted(self._buckets.items())}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(data.get("relative_accuracy", RELATIVE_ACCURACY))
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        if sketch.count:
+            sketch.min, sketch.max = data["min"], data["max"]
+        if "values" in data:
+            sketch._values = list(data["values"])
+        else:
+            sketch._values = None
+            sketch._zeros = data.get("zeros", 0)
+            sketch._buckets = {int(i): c for i, c in data.get("buckets", {}).items()}
+        return sketch
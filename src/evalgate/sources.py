@@ -0,0 +1,149 @@
+"""Fixture and output sources: one JSON file per item or JSONL corpora."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import pathlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Pattern, Tuple
+
+from .config import Fixtures, Outputs
+from .util import list_paths, loads_json, read_json_files
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson", ".jsonl.gz", ".ndjson.gz")
+
+
+def is_jsonl(path: str) -> bool:
+    return path.lower().endswith(JSONL_SUFFIXES)
+
+
+def _open(path: str) -> IO[bytes]:
+    return gzip.open(path, "rb") if path.lower().endswith(".gz") else open(path, "rb")
+
+
+_DECODER = json.JSONDecoder()
+
+
+def _key_prefix(key_field: str) -> Pattern[bytes]:
+    """Match a record line that opens with ``key_field`` as its first member."""
+    key = json.dumps(key_field, ensure_ascii=False).encode("utf-8")
+    return re.compile(rb"\s*\{\s*" + re.escape(key) + rb"\s*:\s*")
+
+
+def _leading_key(line: bytes, prefix: Pattern[bytes]) -> Optional[str]:
+    """Item name of a record whose first member is the key field, parsing only
+    that value; None when the key is elsewhere and the record must be parsed."""
+    m = prefix.match(line)
+    if m is None:
+        return None
+    try:
+        value, _ = _DECODER.raw_decode(line[m.end():].decode("utf-8"))
+    except ValueError:
+        return None
+    return str(value)
+
+
+def iter_records(path: str, key_field: str,
+                 wanted: Optional[set[str]] = None) -> Iterator[Tuple[str, Any]]:
+    """Stream ``(name, record)`` pairs from a JSONL file.
+
+    The item name is taken from (and removed from) ``key_field`` of each
+    record. With ``wanted``, other records are skipped after reading the key;
+    when the key is the record's first member only the key value is parsed.
+    """
+    prefix = _key_prefix(key_field)
+    with _open(path) as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            if wanted is not None:
+                name = _leading_key(line, prefix)
+                if name is not None and name not in wanted:
+                    continue
+            record = loads_json(line)
+            if not isinstance(record, dict) or key_field not in record:
+                raise ValueError(f"{path}:{lineno}: record has no key field {key_field!r}")
+            name = str(record.pop(key_field))
+            if wanted is None or name in wanted:
+                yield name, record
+
+
+def iter_keys(path: str, key_field: str) -> Iterator[str]:
+    """Stream the item names of a JSONL file.
+
+    Records that open with ``key_field`` have only their key value parsed;
+    others are parsed in full to find it.
+    """
+    prefix = _key_prefix(key_field)
+    with _open(path) as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            name = _leading_key(line, prefix)
+            if name is None:
+                record = loads_json(line)
+                if not isinstance(record, dict) or key_field not in record:
+                    raise ValueError(f"{path}:{lineno}: record has no key field {key_field!r}")
+                name = str(record[key_field])
+            yield name
+
+
+def scan(pattern: str, key_field: str) -> Dict[str, str]:
+    """Map each item name to the file holding it (later files win).
+
+    Per-item JSON files are named by stem without being read; JSONL files are
+    streamed once to collect their keys, leaving the records to ``load``.
+    """
+    index: Dict[str, str] = {}
+    for path in list_paths(pattern):
+        if is_jsonl(path):
+            for name in iter_keys(path, key_field):
+                index[name] = path
+        else:
+            index[pathlib.Path(path).stem] = path
+    return index
+
+
+def load(index: Dict[str, str], names: List[str], key_field: str,
+         workers: int | None = None) -> Dict[str, Any]:
+    """Load the records for ``names`` in that order.
+
+    JSON files are parsed on a thread pool; each JSONL file is streamed once,
+    keeping only the requested records it owns according to ``index``.
+    """
+    files = [n for n in names if not is_jsonl(index[n])]
+    by_corpus: Dict[str, set[str]] = {}
+    for n in names:
+        if is_jsonl(index[n]):
+            by_corpus.setdefault(index[n], set()).add(n)
+
+    records: Dict[str, Any] = dict(zip(files, read_json_files([index[n] for n in files], workers)))
+    if by_corpus:
+        def stream(path: str) -> Dict[str, Any]:
+            return dict(iter_records(path, key_field, by_corpus[path]))
+
+        with ThreadPoolExecutor(max_workers=min(len(by_corpus), workers or 4)) as pool:
+            for part in pool.map(stream, by_corpus):
+                records.update(part)
+    return {n: records[n] for n in names}
+
+
+def load_pairs(fixtures: Fixtures, outputs: Outputs,
+               select: Optional[Callable[[List[str]], List[str]]] = None,
+               workers: int | None = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Load fixtures and outputs joined by item name.
+
+    Only names present in both sources (and kept by ``select``, which gets
+    the sorted common names) are parsed into memory.
+    """
+    fixture_index = scan(fixtures.path, fixtures.key_field)
+    output_index = scan(outputs.path, outputs.key_field)
+    names = sorted(fixture_index.keys() & output_index.keys())
+    if select is not None:
+        names = select(names)
+    return (
+        load(fixture_index, names, fixtures.key_field, workers),
+        load(output_index, names, outputs.key_field, workers),
+    )
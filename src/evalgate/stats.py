@@ -0,0 +1,67 @@
+"""Bootstrap confidence intervals for evaluator scores and baseline deltas."""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+RESAMPLES = 2000
+SEED = 0  # fixed so the same results always produce the same intervals
+MAX_LEVELS = 64  # up to this many distinct values, resample value counts instead of items
+CHUNK = 1 << 24  # resampled item indices held in memory at once
+
+
+def _means(values: np.ndarray, resamples: int, rng: np.random.Generator) -> np.ndarray:
+    """Means of ``resamples`` bootstrap resamples of ``values``."""
+    n = len(values)
+    levels, counts = np.unique(values, return_counts=True)
+    if len(levels) <= MAX_LEVELS:
+        # a resample only changes how often each distinct value is drawn, so
+        # drawing those counts is exact and independent of the number of items
+        draws = rng.multinomial(n, counts / n, size=resamples)
+        return draws @ levels / n
+    out = np.empty(resamples)
+    step = max(1, CHUNK // n)
+    for start in range(0, resamples, step):
+        stop = min(start + step, resamples)
+        idx = rng.integers(0, n, size=(stop - start, n), dtype=np.int32 if n < 2**31 else np.int64)
+        out[start:stop] = values[idx].mean(axis=1)
+    return out
+
+
+def _interval(samples: np.ndarray, confidence: float) -> Tuple[float, float]:
+    alpha = (1 - confidence) / 2
+    lo, hi = np.quantile(samples, [alpha, 1 - alpha])
+    return float(lo), float(hi)
+
+
+def _array(items: Dict[str, float]) -> np.ndarray:
+    return np.fromiter(items.values(), dtype=np.float64, count=len(items))
+
+
+def score_ci(items: Dict[str, float], confidence: float = 0.95,
+             resamples: int = RESAMPLES) -> Optional[Tuple[float, float]]:
+    """Percentile bootstrap interval of the mean item score; None below 2 items."""
+    if len(items) < 2:
+        return None
+    rng = np.random.default_rng(SEED)
+    return _interval(_means(_array(items), resamples, rng), confidence)
+
+
+def delta_ci(current: Dict[str, float], baseline: Dict[str, float], confidence: float = 0.95,
+             resamples: int = RESAMPLES) -> Optional[Tuple[float, float]]:
+    """Bootstrap interval of ``mean(current) - mean(baseline)``; None below 2 items a side.
+
+    When both runs scored the same items, per-item differences are resampled
+    as pairs, which cancels out how hard each item is. Otherwise the two runs
+    are resampled independently.
+    """
+    if len(current) < 2 or len(baseline) < 2:
+        return None
+    rng = np.random.default_rng(SEED)
+    if current.keys() == baseline.keys():
+        diffs = _array(current) - np.fromiter((baseline[k] for k in current), dtype=np.float64, count=len(current))
+        return _interval(_means(diffs, resamples, rng), confidence)
+    samples = _means(_array(current), resamples, rng) - _means(_array(baseline), resamples, rng)
+    return _interval(samples, confidence)
@@ -1,15 +1,136 @@
-
 from __future__ import annotations
+import hashlib
 import json
-from typing import Dict, Any, Optional
-from .util import git_show
+import os
+import pathlib
+import subprocess
+import tempfile
+from typing import Dict, Any, List, Optional, Tuple
+from .evaluators.base import ITEM_PASS_SCORE
+from .util import git_show, loads_json, read_json
+
+CACHE_DIR = pathlib.Path(".evalgate/baselines")
+MAX_CACHED = 32  # baseline snapshots kept locally, most recently used first
+
+
+def resolve_ref(ref: str) -> Optional[str]:
+    """Return the commit SHA ``ref`` points at, or None if it does not resolve."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip() or None
+    except Exception:
+        return None
+
+
+def _git(*args: str, input: Optional[bytes] = None, env: Optional[Dict[str, str]] = None) -> str:
+    return subprocess.run(
+        ["git", *args], input=input, env=env, check=True, capture_output=True
+    ).stdout.decode("utf-8").strip()
+
+
+def split_ref(ref: str) -> Tuple[Optional[str], str]:
+    """Split ``ref`` into (remote, branch); remote is None for a local branch."""
+    head, _, rest = ref.partition("/")
+    if rest and head in _git("remote").split():
+        return head, rest
+    return None, ref
+
+
+def commit_baseline(ref: str, path: str, message: str) -> str:
+    """Commit the file at ``path`` to the branch behind ``ref`` without a checkout.
+
+    The commit is built with plumbing commands in a throwaway index, so the
+    working tree is never touched and uncommitted changes do not matter. For
+    a ``<remote>/<branch>`` ref the branch is fetched first and the commit is
+    pushed to it; a local branch is moved with a compare-and-swap update.
+    Returns the new commit SHA."""
+    remote, branch = split_ref(ref)
+    if remote:
+        _git("fetch", remote, branch)
+        parent = resolve_ref("FETCH_HEAD")
+    else:
+        parent = resolve_ref(f"refs/heads/{branch}")
+    top = pathlib.Path(_git("rev-parse", "--show-toplevel"))
+    repo_path = pathlib.Path(path).resolve().relative_to(top.resolve()).as_posix()
+    blob = _git("hash-object", "-w", "--stdin", input=pathlib.Path(path).read_bytes())
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, "GIT_INDEX_FILE": os.path.join(tmp, "index")}
+        if parent:
+            _git("read-tree", parent, env=env)
+        _git("update-index", "--add", "--cacheinfo", f"100644,{blob},{repo_path}", env=env)
+        tree = _git("write-tree", env=env)
+    commit = _git("commit-tree", tree, "-m", message, *(["-p", parent] if parent else []))
+    if remote:
+        _git("push", remote, f"{commit}:refs/heads/{branch}")
+    else:
+        _git("update-ref", "-m", message, f"refs/heads/{branch}", commit, parent or "")
+        try:
+            head = _git("symbolic-ref", "-q", "HEAD")
+        except subprocess.CalledProcessError:  # detached HEAD
+            head = None
+        if head == f"refs/heads/{branch}":
+            # HEAD moved with the branch; stage the committed file so the
+            # index matches the new commit
+            _git("update-index", "--cacheinfo", f"100644,{blob},{repo_path}")
+    return commit
+
+
+def _cache_path(sha: str, path: str) -> pathlib.Path:
+    return CACHE_DIR / f"{sha}-{hashlib.sha1(path.encode('utf-8')).hexdigest()[:12]}.json"
+
+
+def _prune() -> None:
+    cached = sorted(CACHE_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in cached[MAX_CACHED:]:
+        stale.unlink(missing_ok=True)
+
 
 def load_baseline(ref: str, path: str) -> Optional[Dict[str, Any]]:
-    content = git_show(f"{ref}:{path}")
+    """Load the results at ``path`` as of ``ref``.
+
+    Snapshots are cached under ``.evalgate/baselines`` by resolved commit, so
+    git is only asked for the file once per baseline commit."""
+    sha = resolve_ref(ref)
+    if sha is None:
+        return None
+    cached = _cache_path(sha, path)
+    if cached.exists():
+        try:
+            baseline = read_json(cached)
+            os.utime(cached)
+            return baseline
+        except Exception:
+            pass
+    content = git_show(f"{sha}:{path}")
     if not content:
         return None
     try:
-        return json.loads(content)
+        baseline = loads_json(content.encode("utf-8"))
     except Exception:
         return None
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_suffix(f".tmp{os.getpid()}")
+    tmp.write_text(json.dumps(baseline, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(cached)
+    _prune()
+    return baseline
+
+
+def index_scores(baseline: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map evaluator name to its score entry in ``baseline``."""
+    return {s["name"]: s for s in (baseline or {}).get("scores", [])}
+
 
+def item_flips(current: Dict[str, float], baseline: Dict[str, float],
+               threshold: float = ITEM_PASS_SCORE) -> Dict[str, List[str]]:
+    """Items scored in both runs that changed between passing and failing."""
+    flips: Dict[str, List[str]] = {"to_fail": [], "to_pass": []}
+    for name, score in current.items():
+        prev = baseline.get(name)
+        if prev is None or (prev >= threshold) == (score >= threshold):
+            continue
+        flips["to_fail" if score < threshold else "to_pass"].append(name)
+    return flips
@@ -3,13 +3,41 @@ from __future__ import annotations
 
 import glob
 import json
+import os
 import pathlib
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
+try:  # optional fast parser
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed.
+
+    Falls back to the standard library for input orjson rejects but ``json``
+    accepts (e.g. ``NaN`` or integers beyond 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data.decode("utf-8"))
+
 def read_json(path: str | pathlib.Path) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return loads_json(f.read())
+
+def read_json_files(paths: List[str], workers: int | None = None) -> List[Any]:
+    """Read and parse many JSON files on a thread pool, preserving order."""
+    if len(paths) < 2:
+        return [read_json(p) for p in paths]
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return list(pool.map(read_json, paths))
 
 def write_json(path: str | pathlib.Path, data: Dict[str, Any]) -> None:
     p = pathlib.Path(path)
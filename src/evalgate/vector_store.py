@@ -0,0 +1,133 @@
+"""Persistent embedding vectors keyed by model and text hash."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:  # POSIX advisory locks; appends are unguarded elsewhere
+    import fcntl
+except ImportError:
+    fcntl = None
+
+VECTORS_DIR = Path('.evalgate/vectors')
+KEY_BYTES = 16  # blake2b digest size of a text key
+DTYPE = 'float32'  # stored as produced so cached and fresh scores are identical
+
+
+def text_key(text: Any) -> bytes:
+    data = text if isinstance(text, str) else json.dumps(text, sort_keys=True)
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=KEY_BYTES).digest()
+
+
+class VectorStore:
+    """Append-only matrix of vectors for one model, memory-mapped for reads.
+
+    ``vectors.bin`` holds the rows, ``keys.bin`` the text key of each row in
+    the same order and ``meta.json`` the model name and dimension. Rows are
+    written before their keys, so a torn append only leaves unused rows.
+    """
+
+    def __init__(self, model: str, root: Optional[Path] = None):
+        root = VECTORS_DIR if root is None else Path(root)
+        slug = re.sub(r'[^A-Za-z0-9._-]+', '_', model)[-48:]
+        self.model = model
+        self.dir = root / f"{slug}-{hashlib.sha256(model.encode('utf-8')).hexdigest()[:12]}"
+        self.index: Dict[bytes, int] = {}
+        self.dim: Optional[int] = None
+        self._matrix = None
+        self._load()
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.dir / 'vectors.bin'
+
+    @property
+    def _keys_path(self) -> Path:
+        return self.dir / 'keys.bin'
+
+    @property
+    def _meta_path(self) -> Path:
+        return self.dir / 'meta.json'
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _load(self) -> None:
+        import numpy as np
+
+        self.index, self.dim, self._matrix = {}, None, None
+        if not self._meta_path.exists() or not self._keys_path.exists():
+            return
+        meta = json.loads(self._meta_path.read_text(encoding='utf-8'))
+        if meta.get('model') != self.model or meta.get('dtype') != DTYPE:
+            return
+        self.dim = int(meta['dim'])
+        keys = self._keys_path.read_bytes()
+        row_bytes = self.dim * np.dtype(DTYPE).itemsize
+        size = self._vectors_path.stat().st_size if self._vectors_path.exists() else 0
+        rows = min(len(keys) // KEY_BYTES, size // row_bytes)
+        if rows == 0:
+            return
+        self._matrix = np.memmap(self._vectors_path, dtype=DTYPE, mode='r', shape=(rows, self.dim))
+        for row in range(rows):
+            self.index[keys[row * KEY_BYTES:(row + 1) * KEY_BYTES]] = row
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with open(self.dir / '.lock', 'w') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _append(self, keys: List[bytes], vectors) -> None:
+        with self._locked():
+            self._load()  # another process may have appended meanwhile
+            if self.dim is not None and self.dim != vectors.shape[1]:
+                self.index, self.dim = {}, None  # model changed shape; start over
+            self._matrix = None
+            if self.dim is None:
+                self._meta_path.write_text(json.dumps(
+                    {'model': self.model, 'dim': int(vectors.shape[1]), 'dtype': DTYPE}
+                ), encoding='utf-8')
+            new = [i for i, k in enumerate(keys) if k not in self.index]
+            rows = len(self.index)
+            # rows are written before keys; cut anything a torn append left behind
+            with open(self._vectors_path, 'r+b' if self._vectors_path.exists() else 'wb') as f:
+                f.truncate(rows * vectors.shape[1] * vectors.itemsize)
+                f.seek(0, 2)
+                f.write(vectors[new].tobytes())
+            with open(self._keys_path, 'r+b' if self._keys_path.exists() else 'wb') as f:
+                f.truncate(rows * KEY_BYTES)
+                f.seek(0, 2)
+                f.write(b''.join(keys[i] for i in new))
+            self._load()
+
+    def get(self, texts: List[Any], encode: Callable[[List[Any]], Any]):
+        """Return a float32 matrix with one row per text.
+
+        Texts without a stored vector are passed to ``encode`` in one call and
+        their vectors are appended to the store.
+        """
+        import numpy as np
+
+        keys = [text_key(t) for t in texts]
+        for _ in range(2):  # a second pass only if the store was reset meanwhile
+            missing = [i for i, k in enumerate(keys) if k not in self.index]
+            if not missing:
+                break
+            fresh = np.ascontiguousarray(np.asarray(encode([texts[i] for i in missing]), dtype=DTYPE))
+            self._append([keys[i] for i in missing], fresh)
+        if not keys:
+            return np.empty((0, self.dim or 0), dtype=DTYPE)
+        return np.asarray(self._matrix[[self.index[k] for k in keys]])
+
+    def clear(self) -> None:
+        shutil.rmtree(self.dir, ignore_errors=True)
+        self.index, self.dim, self._matrix = {}, None, None
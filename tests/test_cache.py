@@ -0,0 +1,75 @@
+import json
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate import cache
+
+
+def _use_tmp_cache(monkeypatch, tmp_path):
+    cache.close()
+    monkeypatch.setattr(cache, "CACHE_PATH", tmp_path / "cache.db")
+    monkeypatch.setattr(cache, "LEGACY_PATH", tmp_path / "cache.json")
+
+
+def test_cache_roundtrip_and_flush(monkeypatch, tmp_path):
+    _use_tmp_cache(monkeypatch, tmp_path)
+    cache.set("m", "p", "r1")
+    assert cache.get("m", "p") == "r1"
+    cache.close()
+    assert cache.get("m", "p") == "r1"
+    assert cache.get("m", "other") is None
+    cache.clear()
+    assert not (tmp_path / "cache.db").exists()
+
+
+def test_cache_ignores_legacy_json_until_cleared(monkeypatch, tmp_path):
+    _use_tmp_cache(monkeypatch, tmp_path)
+    legacy = tmp_path / "cache.json"
+    legacy.write_text(json.dumps({"0" * 64: "old"}))
+    assert cache.get("m", "p") is None
+    assert legacy.exists()
+    cache.clear()
+    assert not legacy.exists()
+
+
+def test_cache_prune_lru_and_ttl(monkeypatch, tmp_path):
+    _use_tmp_cache(monkeypatch, tmp_path)
+    clock = {"t": 1000.0}
+    monkeypatch.setattr(cache.time, "time", lambda: clock["t"])
+    for i in range(4):
+        cache.set("m", f"p{i}", f"r{i}")
+        cache.flush()
+        clock["t"] += 10
+    cache.get("m", "p0")  # p0 becomes most recently used
+    cache.flush()
+    assert cache.prune(max_entries=2) == 2
+    assert cache.get("m", "p0") == "r0"
+    assert cache.get("m", "p3") == "r3"
+    assert cache.get("m", "p1") is None
+    clock["t"] = 1020 + 86400
+    assert cache.prune(max_age_days=1) == 1  # p0 is expired by creation age
+    assert cache.stats()["entries"] == 1
+    assert cache.get("m", "p3") == "r3"
+    cache.close()
+
+
+def test_cache_merge_and_export(monkeypatch, tmp_path):
+    _use_tmp_cache(monkeypatch, tmp_path)
+    monkeypatch.setattr(cache, "CACHE_PATH", tmp_path / "job1.db")
+    cache.set("m", "shared", "first")
+    cache.set("m", "a", "ra")
+    cache.close()
+    monkeypatch.setattr(cache, "CACHE_PATH", tmp_path / "job2.db")
+    cache.set("m", "shared", "second")
+    cache.set("m", "b", "rb")
+    cache.close()
+    monkeypatch.setattr(cache, "CACHE_PATH", tmp_path / "merged.db")
+    assert cache.merge([tmp_path / "job1.db", tmp_path / "job2.db"]) == 3
+    assert cache.get("m", "shared") == "first"
+    assert cache.get("m", "b") == "rb"
+    assert cache.export(tmp_path / "out.jsonl") == 3
+    cache.clear()
+    assert cache.merge([tmp_path / "out.jsonl"]) == 3
+    cache.close()
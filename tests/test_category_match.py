@@ -31,3 +31,32 @@ def test_missing_output_field_fails():
     score, fails = cm.evaluate(outputs, fixtures, "category")
     assert score == 0.0
     assert len(fails) == 1
+
+
+def test_large_taxonomy_reports_top_confusions():
+    from evalgate.config import EvaluatorCfg
+
+    outputs, fixtures = {}, {}
+    for i in range(300):
+        label = f"intent_{i % 100}"
+        fixtures[f"f{i}"] = {"expected": {"intent": label}}
+        # intent_7 is mostly mistaken for intent_8, the rest are right
+        outputs[f"f{i}"] = {"intent": "intent_8" if label == "intent_7" and i < 200 else label}
+    ev = EvaluatorCfg(name="intents", type="category", expected_field="intent", top_confusions=5)
+    score, fails, extra = cm.run(None, ev, outputs, fixtures)
+    table = extra["table"]
+    assert table["title"].startswith("Top 5 Confusions")
+    assert table["rows"] == [["intent_7", "intent_8", 2, "66.7%"]]
+    assert extra["metrics"]["per_class"]["intent_8"]["precision"] == 0.6
+    assert extra["state"]["matrix"]["intent_7"] == {"intent_8": 2, "intent_7": 1}
+
+
+def test_metrics_without_any_correct_prediction():
+    from evalgate.confusion import Confusion
+
+    assert Confusion().metrics()["f1"] == 0.0
+    confusion = Confusion()
+    confusion.add("x", "y")
+    metrics = confusion.metrics()
+    assert metrics["f1"] == 0.0
+    assert metrics["per_class"]["x"]["recall"] == 0.0
@@ -55,3 +55,21 @@ def test_empty_outputs_return_perfect_score():
     assert f1 == 1.0
     assert metrics["precision"] == 1.0
     assert fails == []
+
+
+def test_macro_weighted_and_per_class_metrics():
+    outputs = {"a": {"label": "cat"}, "b": {"label": "dog"}, "c": {"label": "cat"}, "d": {"label": "cat"}}
+    fixtures = {
+        "a": {"expected": {"label": "cat"}},
+        "b": {"expected": {"label": "cat"}},
+        "c": {"expected": {"label": "dog"}},
+        "d": {"expected": {"label": "cat"}},
+    }
+    f1, _, metrics = cm.evaluate(outputs, fixtures, field="label")
+    assert f1 == 0.5
+    cat = metrics["per_class"]["cat"]
+    assert (round(cat["precision"], 3), round(cat["recall"], 3), cat["support"]) == (0.667, 0.667, 3)
+    assert metrics["per_class"]["dog"] == {"precision": 0.0, "recall": 0.0, "f1": 0.0, "support": 1}
+    assert round(metrics["macro"]["f1"], 3) == 0.333
+    assert round(metrics["weighted"]["f1"], 3) == 0.5
+    assert metrics["confusion_matrix"] == {"cat": {"cat": 2, "dog": 1}, "dog": {"cat": 1}}
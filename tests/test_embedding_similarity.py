@@ -1,6 +1,5 @@
 import pathlib
 import sys
-from types import SimpleNamespace
 import pytest
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
@@ -9,34 +8,92 @@ from evalgate.evaluators import embedding_similarity as es
 
 
 class DummyModel:
-    def encode(self, texts, normalize_embeddings=True):
-        if texts[1] == "match":
-            return [[1.0, 0.0], [1.0, 0.0]]
-        return [[1.0, 0.0], [0.0, 1.0]]
+    def __init__(self):
+        self.calls = []
 
-
-class DummyNumpy(SimpleNamespace):
-    @staticmethod
-    def dot(a, b):
-        return sum(x * y for x, y in zip(a, b))
+    def encode(self, texts, batch_size=32, normalize_embeddings=True):
+        self.calls.append((list(texts), batch_size))
+        return [[1.0, 0.0] if t == "match" else [0.0, 1.0] for t in texts]
 
 
 def test_embedding_similarity_scoring(monkeypatch):
-    monkeypatch.setattr(es, "_get_model", lambda name: DummyModel())
-    monkeypatch.setitem(sys.modules, "numpy", DummyNumpy())
+    model = DummyModel()
+    monkeypatch.setattr(es, "_get_model", lambda name, *args: model)
     outputs = {"a": {"text": "match"}, "b": {"text": "mismatch"}}
     fixtures = {
         "a": {"expected": {"text": "match"}},
         "b": {"expected": {"text": "match"}},
     }
-    score, fails = es.evaluate(outputs, fixtures, field="text", model_name="dummy", threshold=0.8)
+    items = {}
+    score, fails = es.evaluate(outputs, fixtures, field="text", model_name="dummy", threshold=0.8,
+                               item_scores=items, batch_size=16)
     assert round(score, 2) == 0.5
     assert len(fails) == 1
+    assert items == {"a": 1.0, "b": 0.0}
+    assert model.calls == [(["match", "mismatch"], 16)]
 
 
 def test_embedding_similarity_dependency_error(monkeypatch):
-    def raiser(name):
+    def raiser(name, *args):
         raise ImportError("sentence-transformers package required")
     monkeypatch.setattr(es, "_get_model", raiser)
     with pytest.raises(ImportError):
         es.evaluate({"a": {"text": "x"}}, {"a": {"expected": {"text": "x"}}}, field="text", model_name="dummy", threshold=0.5)
+
+
+def _toy_onnx_model(root):
+    onnx = pytest.importorskip("onnx")
+    tokenizers = pytest.importorskip("tokenizers")
+    pytest.importorskip("onnxruntime")
+    import numpy as np
+    from onnx import TensorProto, helper, numpy_helper
+
+    vocab = {"[PAD]": 0, "[UNK]": 1, "cat": 2, "dog": 3, "sat": 4, "ran": 5, "fast": 6}
+    tok = tokenizers.Tokenizer(tokenizers.models.WordLevel(vocab, unk_token="[UNK]"))
+    tok.pre_tokenizer = tokenizers.pre_tokenizers.Whitespace()
+    tok.save(str(root / "tokenizer.json"))
+
+    rng = np.random.default_rng(0)
+    emb = rng.normal(size=(len(vocab), 16)).astype(np.float32)
+    proj = rng.normal(size=(16, 16)).astype(np.float32)
+    graph = helper.make_graph(
+        [
+            helper.make_node("Gather", ["emb", "input_ids"], ["tok"]),
+            helper.make_node("MatMul", ["tok", "proj"], ["hidden"]),
+            helper.make_node("Cast", ["attention_mask"], ["maskf"], to=TensorProto.FLOAT),
+            helper.make_node("Unsqueeze", ["maskf", "axis"], ["mask3"]),
+            helper.make_node("Mul", ["hidden", "mask3"], ["last_hidden_state"]),
+        ],
+        "toy",
+        [helper.make_tensor_value_info(n, TensorProto.INT64, ["b", "s"]) for n in ("input_ids", "attention_mask")],
+        [helper.make_tensor_value_info("last_hidden_state", TensorProto.FLOAT, ["b", "s", 16])],
+        [numpy_helper.from_array(emb, "emb"), numpy_helper.from_array(proj, "proj"),
+         numpy_helper.from_array(np.array([2], dtype=np.int64), "axis")],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    onnx.save(model, str(root / "model.onnx"))
+
+    def reference(text):
+        ids = [vocab.get(w, 1) for w in text.split()]
+        v = (emb[ids] @ proj).mean(axis=0)
+        return v / np.linalg.norm(v)
+
+    return reference
+
+
+def test_onnx_backend_matches_reference_within_tolerance(tmp_path, monkeypatch):
+    import numpy as np
+    from evalgate import onnx_encoder
+
+    reference = _toy_onnx_model(tmp_path)
+    monkeypatch.setattr(onnx_encoder, "QUANTIZED_DIR", tmp_path / "quantized")
+    texts = ["cat sat", "dog ran fast", "cat", "dog sat"]
+    expected = np.stack([reference(t) for t in texts])
+
+    fp32 = onnx_encoder.OnnxEncoder(str(tmp_path), num_threads=1).encode(texts, batch_size=3)
+    assert np.allclose(fp32, expected, atol=1e-5)
+
+    int8 = onnx_encoder.OnnxEncoder(str(tmp_path), quantize=True).encode(texts, batch_size=3)
+    assert np.all(np.abs(int8 @ int8.T - expected @ expected.T) < 0.02)
+    assert list((tmp_path / "quantized").glob("*.int8.onnx"))
@@ -0,0 +1,43 @@
+import base64
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate import history
+from evalgate.report import render_markdown
+
+
+def _result(overall, acc):
+    return {"overall": overall, "gate": {"passed": True}, "scores": [{"name": "acc", "score": acc}]}
+
+
+def test_series_keeps_latest_run_per_commit(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "HISTORY_PATH", tmp_path / "history.db")
+    history.record(_result(0.9, 0.8), "c1")
+    history.record(_result(0.7, 0.6), "c2")
+    history.record(_result(0.8, 0.7), "c2")  # re-run of c2
+    for i in range(3, 10):
+        history.record(_result(0.9, i / 10), f"c{i}")
+    assert history.series("acc", limit=3) == [("c7", 0.7), ("c8", 0.8), ("c9", 0.9)]
+    assert history.series("acc")[:2] == [("c1", 0.8), ("c2", 0.7)]
+    assert history.series(history.OVERALL, limit=2) == [("c8", 0.9), ("c9", 0.9)]
+    assert history.series("missing") == []
+
+
+def test_plots_render_as_sparklines(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "HISTORY_PATH", tmp_path / "history.db")
+    history.record(_result(0.9, 0.5), "c1")
+    history.record(_result(0.9, 1.0), "c2")
+    entries = history.plots(["acc", "never_seen"])
+    assert len(entries) == 1
+    uri = entries[0]["sparkline"]
+    assert uri.startswith("data:image/svg+xml;base64,")
+    svg = base64.b64decode(uri.split(",", 1)[1]).decode()
+    assert svg.startswith("<svg") and "polyline" in svg
+    md = render_markdown({
+        "overall": 0.9, "scores": [], "failures": [],
+        "gate": {"min_overall_score": 0.5, "allow_regression": True, "passed": True},
+        "plots": entries,
+    })
+    assert "![acc: 0.50 → 1.00 over 2 runs](data:image/svg+xml;base64," in md
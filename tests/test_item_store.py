@@ -0,0 +1,90 @@
+import json
+import pathlib
+import sys
+import urllib.request
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate import item_store
+from evalgate.cli import report
+from evalgate.evaluators import required_fields as rf
+from evalgate.evaluators.base import ItemResult, collect_results
+
+
+def test_collect_results_rebuilds_records_only_for_legacy_evaluators():
+    records = collect_results(
+        "acc",
+        {"a": 1.0, "b": 0.0},
+        ["b: wrong label", "b: bad format", "acc: no outputs for c"],
+    )
+    assert ItemResult("a", 1.0, True, "", "acc") in records
+    assert ItemResult("b", 0.0, False, "wrong label; bad format", "acc") in records
+    assert ItemResult("acc", None, False, "no outputs for c", "acc") in records
+
+    results = []
+    rf.evaluate({"a": {"x": 1}}, {"a": {"expected": {"x": 0, "y": 0}}}, results=results)
+    records = collect_results("req", {"a[x]": 1.0, "a[y]": 0.0}, ["a: missing or empty field 'y'"], results)
+    assert records == [
+        ItemResult("a[x]", 1.0, True, "", "req"),
+        ItemResult("a[y]", 0.0, False, "missing or empty field", "req"),
+    ]
+
+
+def test_builtin_evaluators_emit_item_results():
+    from evalgate.config import EvaluatorCfg
+    from evalgate.evaluators import category_match, tool_usage
+
+    ev = EvaluatorCfg(name="cat", type="category", expected_field="label")
+    _, fails, extra = category_match.run(
+        None, ev, {"a": {"label": "x"}, "b": {"label": "y"}},
+        {"a": {"expected": {"label": "x"}}, "b": {"expected": {"label": "x"}}},
+    )
+    assert fails == ["b: expected label='x', got 'y'"]
+    assert extra["results"] == [
+        ItemResult("a", 1.0, True, ""),
+        ItemResult("b", 0.0, False, "expected label='x', got 'y'"),
+    ]
+
+    results = []
+    _, fails = tool_usage.evaluate(
+        {"a": {"tool_calls": [{"name": "search"}]}}, {"a": [{"name": "lookup"}]}, results=results
+    )
+    assert fails == ["a[0]: expected tool 'lookup' got 'search'"]
+    assert results == [ItemResult("a", 0.0, False, "call 0: expected tool 'lookup' got 'search'")]
+
+
+def test_sidecar_roundtrip(tmp_path):
+    path = item_store.sidecar_path(str(tmp_path / "results.json"))
+    assert path.name == "results.items.db"
+    rows = [ItemResult(f"fx{i}", i / 10, i % 2 == 0, "" if i % 2 == 0 else "low", "acc") for i in range(10)]
+    assert item_store.write(path, rows + [ItemResult("", None, False, "score 0.45 < min_score 0.8", "acc")]) == 11
+    failed = item_store.query(path, passed=False)
+    assert [r.item for r in failed] == ["fx1", "fx3", "fx5", "fx7", "fx9", ""]
+    assert item_store.query(path, item="fx4") == [rows[4]]
+    assert item_store.query(path, evaluator="other") == []
+    assert len(item_store.query(path, limit=3)) == 3
+
+
+def test_check_run_annotations_read_sidecar(tmp_path, monkeypatch):
+    item_store.write(tmp_path / "results.items.db", [
+        ItemResult("fx1[name]", 0.0, False, "missing or empty field", "req"),
+        ItemResult("fx2", 1.0, True, "", "req"),
+    ])
+    data = {
+        "overall": 0.5, "scores": [], "evaluator_errors": [], "items_path": "results.items.db",
+        "gate": {"passed": False, "min_overall_score": 0.9, "allow_regression": True},
+        "failures": ["fx1: missing or empty field 'name'"],
+    }
+    p = tmp_path / "results.json"
+    p.write_text(json.dumps(data))
+    monkeypatch.setenv("GITHUB_TOKEN", "t")
+    monkeypatch.setenv("GITHUB_SHA", "sha")
+    monkeypatch.setenv("GITHUB_REPOSITORY", "o/r")
+    captured = {}
+    monkeypatch.setattr(
+        urllib.request, "urlopen", lambda req: captured.update(payload=json.loads(req.data.decode()))
+    )
+    report(pr=False, summary=False, artifact=str(p), max_failures=20, check_run=True)
+    (ann,) = captured["payload"]["output"]["annotations"]
+    assert ann["path"] == "eval/fixtures/fx1.json"
+    assert ann["message"] == "missing or empty field"
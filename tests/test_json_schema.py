@@ -24,3 +24,23 @@ def test_json_schema_missing_field_violation():
     score, violations = js.evaluate(outputs, schema)
     assert score == 0.0
     assert violations
+
+
+def test_json_schema_validators_are_shared_across_evaluations():
+    schema = {"type": "object", "required": ["id"]}
+    validator = js._get_validator(schema)
+    assert js._get_validator({"required": ["id"], "type": "object"}) is validator
+    score, violations = js.evaluate({"a": {"id": 1}, "b": {"id": 2}, "c": {}}, schema)
+    assert js._get_validator(schema) is validator
+    assert violations == ["c:  -> 'id' is a required property"]
+
+
+def test_json_schema_process_pool_matches_serial(monkeypatch):
+    monkeypatch.setattr(js, "POOL_MIN_ITEMS", 10)
+    schema = {"type": "object", "properties": {"n": {"type": "integer", "maximum": 50}}}
+    outputs = {f"o{i:03}": {"n": i} for i in range(80)}
+    serial_items, pooled_items = {}, {}
+    serial = js.evaluate(outputs, schema, item_scores=serial_items)
+    pooled = js.evaluate(outputs, schema, item_scores=pooled_items, workers=2)
+    assert pooled == serial
+    assert list(pooled_items.items()) == list(serial_items.items())
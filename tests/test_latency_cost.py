@@ -27,3 +27,19 @@ def test_latency_cost_missing_meta_defaults_zero():
     assert fails == []
     assert p95 == 0.0
     assert avg == 0.0
+
+
+def test_percentile_budgets_score_worst_percentile():
+    fixtures = {f"f{i}": {"meta": {"latency_ms": 10 * i, "cost_usd": 0.001 * i}} for i in range(1, 101)}
+    budgets = {
+        "p95_latency_ms": 2000,
+        "max_cost_usd_per_item": 1.0,
+        "latency_ms": {"p50": 500, "p99": 800},  # p50 = 510 (2% over), p99 = 990 (23.75% over)
+        "cost_usd": {"p90": 0.1},
+    }
+    summary = {}
+    score, fails, p95, avg = lc.evaluate(fixtures, budgets, summary=summary)
+    assert summary["latency_ms"] == {"p95": 950.0, "p50": 510.0, "p99": 990.0}
+    assert round(summary["cost_usd"]["p90"], 6) == 0.09
+    assert round(score, 4) == round(0.5 * (1 - 190 / 800) + 0.5, 4)
+    assert fails == []
@@ -0,0 +1,70 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate import ledger
+from evalgate.config import Budgets, Config, EvaluatorCfg, Fixtures, Outputs
+from evalgate.evaluators import required_fields, rouge_bleu
+
+
+@pytest.fixture(autouse=True)
+def _isolated_ledger(tmp_path, monkeypatch):
+    monkeypatch.setattr(ledger, "LEDGER_PATH", tmp_path / "ledger.db")
+
+
+def _cfg(evaluators):
+    return Config(
+        budgets=Budgets(p95_latency_ms=1, max_cost_usd_per_item=0),
+        fixtures=Fixtures(path="x"),
+        outputs=Outputs(path="y"),
+        evaluators=evaluators,
+    )
+
+
+def _data(n, changed=()):
+    fixtures = {f"fx{i}": {"expected": {"text": f"the cat sat on mat {i}"}} for i in range(n)}
+    outputs = {f"fx{i}": {"text": f"the cat sat {i}" + (" again" if i in changed else "")} for i in range(n)}
+    return fixtures, outputs
+
+
+def test_incremental_matches_full_run_and_skips_unchanged():
+    seen = []
+
+    def counting(cfg, ev, outputs, fixtures):
+        seen.append(sorted(outputs))
+        return rouge_bleu.run(cfg, ev, outputs, fixtures)
+
+    ev = EvaluatorCfg(name="r", type="rouge_bleu", expected_field="text", metric="rouge1")
+    cfg = _cfg([ev])
+    fixtures, outputs = _data(6)
+    assert ledger.run_incremental(counting, cfg, ev, outputs, fixtures) == rouge_bleu.run(cfg, ev, outputs, fixtures)
+
+    fixtures, outputs = _data(6, changed={2, 4})
+    result = ledger.run_incremental(counting, cfg, ev, outputs, fixtures)
+    assert seen[-1] == ["fx2", "fx4"]
+    full = rouge_bleu.run(cfg, ev, outputs, fixtures)
+    assert result[1:] == full[1:]
+    assert result[0] == pytest.approx(full[0])
+
+    ledger.run_incremental(counting, cfg, ev, outputs, fixtures)
+    assert len(seen) == 2  # fully cached
+
+
+def test_incremental_attributes_subitems_and_failures():
+    ev = EvaluatorCfg(name="req", type="required_fields")
+    cfg = _cfg([ev])
+    fixtures = {"a": {"expected": {"x": 1, "y": 2}}, "b": {"expected": {"x": 1}}}
+    outputs = {"a": {"x": 1}, "b": {"x": 1}}
+    ledger.run_incremental(required_fields.run, cfg, ev, outputs, fixtures)
+    outputs["b"] = {"x": ""}
+    assert ledger.run_incremental(required_fields.run, cfg, ev, outputs, fixtures) == \
+        required_fields.run(cfg, ev, outputs, fixtures)
+
+
+def test_evaluator_key_tracks_scoring_settings():
+    base = EvaluatorCfg(name="r", type="rouge_bleu", expected_field="text", metric="rouge1")
+    assert ledger.evaluator_key(base) == ledger.evaluator_key(base.model_copy(update={"weight": 0.5, "name": "s"}))
+    assert ledger.evaluator_key(base) != ledger.evaluator_key(base.model_copy(update={"metric": "rouge2"}))
@@ -4,9 +4,19 @@ import pytest
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
+from evalgate import cache
 from evalgate.evaluators import llm_judge as lj
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(monkeypatch, tmp_path):
+    cache.close()
+    monkeypatch.setattr(cache, "CACHE_PATH", tmp_path / "cache.db")
+    monkeypatch.setattr(cache, "LEGACY_PATH", tmp_path / "cache.json")
+    yield
+    cache.close()
+
+
 def test_llm_judge_happy(monkeypatch, tmp_path):
     prompt = tmp_path / "prompt.txt"
     prompt.write_text("{input}\n{output}")
@@ -138,3 +148,177 @@ def test_llm_judge_per_turn_scoring(monkeypatch, tmp_path):
     assert score == pytest.approx((0.5 + 1.0) / 2)
     assert len(details) == 1 and "a[0]" in details[0]
     assert calls == ["assistant: hi", "assistant: bye"]
+
+
+def test_llm_judge_concurrency_keeps_order(monkeypatch, tmp_path):
+    import threading
+    import time
+
+    prompt = tmp_path / "p.txt"
+    prompt.write_text("{transcript}")
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_call(model, prompt, *_, **__):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        # later turns answer first so completion order differs from input order
+        time.sleep(0.05 if prompt.endswith("0") else 0.01)
+        with lock:
+            state["active"] -= 1
+        return "Score: 0.1"
+
+    monkeypatch.setattr(lj, "_call_local", fake_call)
+    outputs = {
+        n: {"transcript": [{"role": "user", "content": f"{n}{i}"} for i in range(3)]}
+        for n in ("a", "b")
+    }
+    score, details = lj.evaluate(
+        outputs,
+        {},
+        provider="local",
+        model="m",
+        prompt_path=str(prompt),
+        base_url="http://localhost",
+        transcript_field="transcript",
+        per_turn_scoring=True,
+        concurrency=4,
+    )
+    assert score == pytest.approx(0.1)
+    assert [d.split(":")[0] for d in details] == [
+        "a[0]", "a[1]", "a[2]", "b[0]", "b[1]", "b[2]"
+    ]
+    assert 1 < state["peak"] <= 4
+
+
+def test_llm_judge_local_stub_server(tmp_path):
+    pytest.importorskip("openai")
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            content = body["messages"][0]["content"]
+            reply = {
+                "id": "x",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [{
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": "Score: 0.2" if "bad" in content else "Score: 0.9"},
+                }],
+            }
+            data = json.dumps(reply).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    prompt = tmp_path / "p.txt"
+    prompt.write_text("{transcript}")
+    outputs = {
+        "a": {"transcript": [{"role": "user", "content": "good"}, {"role": "user", "content": "bad"}]},
+        "b": {"transcript": [{"role": "user", "content": "bad"}]},
+    }
+    try:
+        score, details = lj.evaluate(
+            outputs,
+            {},
+            provider="local",
+            model="stub",
+            prompt_path=str(prompt),
+            base_url=f"http://127.0.0.1:{server.server_port}/v1",
+            transcript_field="transcript",
+            per_turn_scoring=True,
+            concurrency=3,
+        )
+    finally:
+        server.shutdown()
+    assert score == pytest.approx((0.9 + 0.2 + 0.2) / 3)
+    assert [d.split(":")[0] for d in details] == ["a[1]", "b[0]"]
+
+
+def test_llm_judge_reuses_provider_client(monkeypatch, tmp_path):
+    from types import SimpleNamespace
+
+    httpx = pytest.importorskip("httpx")
+    created = []
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+            self.closed = False
+            reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Score: 0.9"))])
+            self.chat = SimpleNamespace(completions=SimpleNamespace(create=lambda **_: reply))
+
+        def close(self):
+            self.closed = True
+
+    fake_openai = SimpleNamespace(OpenAI=FakeClient)  # early openai 1.x: no DefaultHttpxClient
+    monkeypatch.setitem(sys.modules, "openai", fake_openai)
+    lj.close_clients()
+    prompt = tmp_path / "p.txt"
+    prompt.write_text("{output}")
+    outputs = {n: {"text": n} for n in ("a", "b", "c")}
+    score, _ = lj.evaluate(
+        outputs,
+        {},
+        provider="local",
+        model="m",
+        prompt_path=str(prompt),
+        base_url="http://localhost:1/v1",
+        per_turn_scoring=False,
+        timeout=5.0,
+        max_connections=4,
+        concurrency=2,
+    )
+    assert score == pytest.approx(0.9)
+    assert len(created) == 1
+    assert created[0]["timeout"] == 5.0
+    http_client = created[0]["http_client"]
+    assert isinstance(http_client, httpx.Client)
+    assert http_client.timeout.read == 5.0
+    http_client.close()
+    client = lj._get_client("local", "dummy", "http://localhost:1/v1", 5.0, 4)
+    lj.close_clients()
+    assert client.closed
+
+
+def test_llm_judge_cache_key_covers_params(monkeypatch, tmp_path):
+    prompt = tmp_path / "p.txt"
+    prompt.write_text("{transcript}")
+    calls = []
+
+    def fake_call(model, prompt, *_, **__):
+        calls.append(prompt)
+        return "Score: 1.0"
+
+    monkeypatch.setattr(lj, "_call_local", fake_call)
+    outputs = {"a": {"transcript": [{"role": "user", "content": "x"}, {"role": "user", "content": "y"}]}}
+    kwargs = dict(
+        provider="local",
+        model="m",
+        prompt_path=str(prompt),
+        base_url="http://localhost/v1",
+        transcript_field="transcript",
+        per_turn_scoring=True,
+    )
+    lj.evaluate(outputs, {}, **kwargs)
+    lj.evaluate(outputs, {}, **kwargs)
+    assert len(calls) == 2  # per-turn prompts are served from the cache
+    lj.evaluate(outputs, {}, temperature=0.7, **kwargs)
+    assert len(calls) == 4
+    lj.evaluate(outputs, {}, **{**kwargs, "base_url": "http://other/v1"})
+    assert len(calls) == 6
@@ -1,6 +1,8 @@
 import pathlib
 import sys
 
+import pytest
+
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
 from evalgate.evaluators import regex_match as rm
@@ -18,3 +20,51 @@ def test_regex_match_missing_pattern_skipped():
     score, fails = rm.evaluate({"a": "hi"}, {}, {})
     assert score == 0.0
     assert fails == []
+
+
+def test_regex_match_flags_and_shared_compilation():
+    rm._compiled.clear()
+    outputs = {"a": "Hello\nWorld", "b": "HELLO", "c": "nope"}
+    patterns = {"a": "^world", "b": "^world", "c": "^world"}
+    flags = rm.parse_flags(["i", "MULTILINE"])
+    score, fails = rm.evaluate(outputs, {}, patterns, flags=flags)
+    assert score == 1 / 3
+    assert list(rm._compiled) == [("^world", flags)]
+
+
+def test_regex_match_timeout_in_worker_process(monkeypatch):
+    monkeypatch.setattr(rm, "re2", None)
+    monkeypatch.setattr(rm, "regex", None)
+    outputs = {"slow": "a" * 40 + "b", "fast": "aaa"}
+    patterns = {"slow": r"(a|aa)+$", "fast": r"(a|aa)+$"}
+    items = {}
+    score, fails = rm.evaluate(outputs, {}, patterns, item_scores=items, timeout=0.5)
+    assert items == {"slow": 0.0, "fast": 1.0}
+    assert fails == ["slow: pattern '(a|aa)+$' timed out after 0.5s"]
+
+
+def test_regex_match_timeout_with_available_engine():
+    flags = rm.parse_flags(["ASCII", "IGNORECASE"])
+    outputs = {"slow": "A" * 40 + "b", "fast": "AAA"}
+    patterns = {"slow": r"(a|aa)+$", "fast": r"(a|aa)+$"}
+    items = {}
+    rm.evaluate(outputs, {}, patterns, item_scores=items, flags=flags, timeout=0.5)
+    assert items == {"slow": 0.0, "fast": 1.0}
+
+
+def test_timeout_keeps_re_semantics(monkeypatch):
+    outputs = {"eol": "foo\n", "digits": "١٢٣", "word": "un café noir", "plain": "abc"}
+    patterns = {"eol": r"foo$", "digits": r"^\d+$", "word": r"\bcafé\b", "plain": r"^\w+$"}
+    without, with_timeout = {}, {}
+    rm.evaluate(outputs, {}, patterns, item_scores=without)
+    rm.evaluate(outputs, {}, patterns, item_scores=with_timeout, timeout=1.0)
+    assert without == with_timeout == {"eol": 1.0, "digits": 1.0, "word": 1.0, "plain": 1.0}
+
+    monkeypatch.setattr(rm, "regex", None)  # worker-process fallback
+    in_worker = {}
+    rm.evaluate(outputs, {}, patterns, item_scores=in_worker, timeout=1.0)
+    assert in_worker == without
+
+    monkeypatch.setattr(rm, "re2", None)
+    with pytest.raises(ImportError, match="google-re2"):
+        rm.evaluate(outputs, {}, patterns, engine="re2")
@@ -3,6 +3,7 @@ import sys
 
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
+from evalgate.evaluators.base import ItemResult
 from evalgate.report import render_markdown
 
 
@@ -18,7 +19,7 @@ def test_render_markdown_max_failures_and_plots():
                 "min_score": 0.5,
             }
         ],
-        "failures": [f"f{i}" for i in range(6)],
+        "failures": [f"f{c}" for c in "abcdef"],
         "evaluator_errors": [],
         "latency": None,
         "cost": None,
@@ -33,3 +34,35 @@ def test_render_markdown_max_failures_and_plots():
     assert "| Metric | Δ vs baseline |" in md
     assert "[![trend](s.png)](p.png)" in md
     assert "- metric1: 0.90 (+0.10 vs main) → ✅ (min 0.50)" in md
+
+
+def test_render_markdown_groups_failures():
+    failures = [f"fx{i}: missing or empty field '{f}'" for i in range(3000) for f in ("name", "id")]
+    failures += ["fx7: similarity 0.41 below threshold 0.80", "acc: score 0.45 < min_score 0.8"]
+    result = {
+        "overall": 0.4,
+        "scores": [{"name": "acc", "score": 0.45, "passed": False, "min_score": 0.8}],
+        "failures": failures,
+        "gate": {"min_overall_score": 0.5, "allow_regression": True, "passed": False},
+    }
+    md = render_markdown(result, max_failures=20)
+    assert "**Failures (6002)**" in md
+    assert "- `missing or empty field <s>` × 6000" in md
+    assert "  - fx0: missing or empty field 'name'" in md
+    assert "  - fx1: missing or empty field 'name'" in md
+    assert "- fx7: similarity 0.41 below threshold 0.80" in md
+    assert "- acc: score 0.45 < min_score 0.8" in md
+    assert md.count("missing or empty field") == 4  # template plus three examples
+
+    md = render_markdown({**result, "failures": [
+        "case1: ROUGE1=0.1200", "case2: ROUGE1=0.3400", "case3: ROUGE2=0.5600",
+    ]})
+    assert "- `ROUGE1=<n>` × 2" in md
+    assert "- case3: ROUGE2=0.5600" in md
+
+    records = [
+        ItemResult(f"fx{i}[name]", 0.0, False, "missing or empty field", "req") for i in range(5)
+    ]
+    md = render_markdown({**result, "failures": []}, records=iter(records))
+    assert "**Failures (5)**" in md
+    assert "- req: `missing or empty field` × 5" in md
@@ -11,9 +11,16 @@ from evalgate.evaluators import rouge_bleu as rb
 def test_bleu_scoring():
     outputs = {"a": {"text": "hello world"}}
     fixtures = {"a": {"expected": {"text": "hello world"}}}
-    score, fails = rb.evaluate(outputs, fixtures, field="text", metric="bleu")
+    results = []
+    score, fails = rb.evaluate(outputs, fixtures, field="text", metric="bleu", results=results)
     assert round(score, 2) == 1.0
-    assert "BLEU" in fails[0]
+    assert fails == []
+    assert results[0].passed and results[0].message.startswith("BLEU=")
+
+    outputs["b"] = {"text": "goodbye"}
+    fixtures["b"] = {"expected": {"text": "hello world"}}
+    _, fails = rb.evaluate(outputs, fixtures, field="text", metric="bleu")
+    assert len(fails) == 1 and fails[0].startswith("b: BLEU=")
 
 
 def test_rouge_dependency_error(monkeypatch):
@@ -33,3 +40,91 @@ def test_rouge_bleu_missing_fields_skip():
     score, fails = rb.evaluate({}, {}, field="text", metric="bleu")
     assert score == 1.0
     assert fails == []
+
+
+def test_multi_metric_single_pass_matches_single_metrics():
+    import sacrebleu
+
+    refs = ["the cat sat on the mat", "a quick brown fox jumps", "hello there world"]
+    hyps = ["the cat sat on a mat", "the quick brown fox jumped", "hello world"]
+    outputs = {f"x{i}": {"t": h} for i, h in enumerate(hyps)}
+    fixtures = {f"x{i}": {"expected": {"t": r}} for i, r in enumerate(refs)}
+    summary, items, results = {}, {}, []
+    score, fails = rb.evaluate(outputs, fixtures, field="t", metrics=["rougeL", "bleu", "rouge1"],
+                               item_scores=items, summary=summary, results=results)
+
+    for m in ("rougeL", "bleu", "rouge1"):
+        single, _ = rb.evaluate(outputs, fixtures, field="t", metric=m)
+        assert summary[m.lower()] == pytest.approx(single)
+    assert score == pytest.approx(summary["rougel"])
+    assert summary["corpus_bleu"] == pytest.approx(sacrebleu.corpus_bleu(hyps, [refs]).score / 100)
+    assert results[0].item == "x0"
+    assert results[0].message.startswith("ROUGEL=") and "BLEU=" in results[0].message
+    assert set(items) == set(outputs)
+
+
+def test_multi_metric_merge_recomputes_corpus_bleu():
+    from evalgate.config import EvaluatorCfg
+
+    ev = EvaluatorCfg(name="t", type="rouge_bleu", expected_field="t", metrics=["bleu", "rouge2"])
+    refs = ["one two three four", "five six seven eight", "nine ten eleven"]
+    hyps = ["one two three", "five six eight seven", "nine ten eleven twelve"]
+    outputs = {f"x{i}": {"t": h} for i, h in enumerate(hyps)}
+    fixtures = {f"x{i}": {"expected": {"t": r}} for i, r in enumerate(refs)}
+    full = rb.run(None, ev, outputs, fixtures)
+    parts = [
+        dict(zip(("score", "failures", "extra"), rb.run(None, ev, {k: outputs[k]}, {k: fixtures[k]})))
+        for k in outputs
+    ]
+    merged = rb.merge(None, ev, parts)
+    assert merged[0] == pytest.approx(full[0])
+    assert merged[1] == full[1]
+    assert merged[2]["metrics"] == pytest.approx(full[2]["metrics"])
+
+
+def _random_texts(n, length, seed=0):
+    import random
+
+    rng = random.Random(seed)
+    words = ["running", "runs", "the", "cat", "cats", "a", "mat", "sat", "quickly", "Dog!", "42", "über"]
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(0, length))) for _ in range(n)]
+
+
+def test_fast_rouge_identical_to_rouge_score():
+    from rouge_score import rouge_scorer
+
+    refs, hyps = _random_texts(60, 300, seed=1), _random_texts(60, 300, seed=2)
+    outputs = {f"x{i}": {"t": h} for i, h in enumerate(hyps)}
+    fixtures = {f"x{i}": {"expected": {"t": r}} for i, r in enumerate(refs)}
+    scorer = rouge_scorer.RougeScorer(["rouge1", "rouge2", "rougeL"], use_stemmer=True)
+    expected = [scorer.score(r, h) for r, h in zip(refs, hyps)]
+    for metric, key in (("rouge1", "rouge1"), ("rouge2", "rouge2"), ("rougeL", "rougeL")):
+        items = {}
+        rb.evaluate(outputs, fixtures, field="t", metric=metric, item_scores=items)
+        assert [items[f"x{i}"] for i in range(60)] == [e[key].fmeasure for e in expected]
+
+
+def test_lcs_length_matches_dynamic_programming():
+    import random
+
+    rng = random.Random(3)
+    for _ in range(200):
+        a = [rng.choice("abcd") for _ in range(rng.randint(0, 70))]
+        b = [rng.choice("abcd") for _ in range(rng.randint(0, 70))]
+        table = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+        for i in range(1, len(a) + 1):
+            for j in range(1, len(b) + 1):
+                table[i][j] = table[i - 1][j - 1] + 1 if a[i - 1] == b[j - 1] else max(table[i - 1][j], table[i][j - 1])
+        assert rb.lcs_length(a, b) == table[-1][-1]
+
+
+def test_worker_processes_give_identical_results():
+    refs, hyps = _random_texts(40, 50, seed=4), _random_texts(40, 50, seed=5)
+    outputs = {f"x{i}": {"t": h} for i, h in enumerate(hyps)}
+    fixtures = {f"x{i}": {"expected": {"t": r}} for i, r in enumerate(refs)}
+    runs = []
+    for workers in (None, 2):
+        summary = {}
+        runs.append((rb.evaluate(outputs, fixtures, field="t", metrics=["rougeL", "bleu"],
+                                 summary=summary, workers=workers), summary))
+    assert runs[0] == runs[1]
@@ -0,0 +1,59 @@
+import pathlib
+import sys
+import time
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate.config import Config
+from evalgate.evaluators import category_match, rouge_bleu
+from evalgate.scheduler import run_evaluators
+
+
+def _cfg(evaluators):
+    return Config.model_validate({
+        "budgets": {"p95_latency_ms": 100, "max_cost_usd_per_item": 1.0},
+        "fixtures": {"path": "x"},
+        "outputs": {"path": "y"},
+        "evaluators": evaluators,
+    })
+
+
+def test_run_evaluators_parallel_matches_sequential():
+    cfg = _cfg([
+        {"name": "bleu", "type": "rouge_bleu", "expected_field": "text"},
+        {"name": "cat", "type": "category", "expected_field": "label"},
+        {"name": "rouge", "type": "rouge_bleu", "expected_field": "text", "metric": "rouge1"},
+    ])
+    jobs = list(zip(cfg.evaluators, [rouge_bleu.run, category_match.run, rouge_bleu.run]))
+    outputs = {"a": {"text": "the cat sat", "label": "x"}, "b": {"text": "a dog ran", "label": "y"}}
+    fixtures = {
+        "a": {"expected": {"text": "the cat sat down", "label": "x"}},
+        "b": {"expected": {"text": "the dog ran", "label": "x"}},
+    }
+    sequential = run_evaluators(cfg, jobs, outputs, fixtures, workers=1)
+    parallel = run_evaluators(cfg, jobs, outputs, fixtures, workers=3)
+    assert parallel == sequential
+
+
+def test_run_evaluators_keeps_order_and_errors():
+    cfg = _cfg([
+        {"name": "slow", "type": "regex", "pattern_field": "p"},
+        {"name": "broken", "type": "schema"},
+        {"name": "fast", "type": "regex", "pattern_field": "p"},
+    ])
+
+    def slow(*_):
+        time.sleep(0.05)
+        return 0.1, ["slow"], {}
+
+    def broken(*_):
+        raise ValueError("boom")
+
+    def fast(*_):
+        return 0.9, ["fast"], {}
+
+    jobs = list(zip(cfg.evaluators, [slow, broken, fast]))
+    outcomes = run_evaluators(cfg, jobs, {}, {}, workers=3)
+    assert outcomes[0] == ((0.1, ["slow"], {}), None)
+    assert outcomes[1][0] is None and str(outcomes[1][1]) == "boom"
+    assert outcomes[2] == ((0.9, ["fast"], {}), None)
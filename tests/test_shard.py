@@ -0,0 +1,79 @@
+import json
+import pathlib
+import sys
+
+import pytest
+import typer
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate.cli import merge, run
+from evalgate.shard import parse_shard, select_shard
+
+
+def test_parse_shard():
+    assert parse_shard("3/8") == (3, 8)
+    for bad in ("0/2", "3/2", "x", "1/0"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_select_shard_partitions_names():
+    names = [f"fx_{i:03}" for i in range(200)]
+    shards = [select_shard(names, i, 4) for i in range(1, 5)]
+    assert sorted(n for s in shards for n in s) == names
+    assert all(shards)
+    assert select_shard(names + ["new"], 2, 4)[:5] == shards[1][:5]
+
+
+def _suite(tmp_path):
+    (tmp_path / "fx").mkdir()
+    (tmp_path / "out").mkdir()
+    labels = ["a", "b", "c"]
+    for i in range(30):
+        exp = labels[i % 3]
+        got = exp if i % 4 else labels[(i + 1) % 3]
+        fixture = {"expected": {"label": exp}, "meta": {"latency_ms": 10 * i, "cost_usd": 0.001 * i}}
+        (tmp_path / "fx" / f"fx_{i:02}.json").write_text(json.dumps(fixture))
+        (tmp_path / "out" / f"fx_{i:02}.json").write_text(json.dumps({"label": got}))
+    cfg = {
+        "budgets": {"p95_latency_ms": 250, "max_cost_usd_per_item": 0.02},
+        "fixtures": {"path": str(tmp_path / "fx" / "*.json")},
+        "outputs": {"path": str(tmp_path / "out" / "*.json")},
+        "evaluators": [
+            {"name": "cat", "type": "category", "expected_field": "label"},
+            {"name": "cls", "type": "classification", "expected_field": "label"},
+            {"name": "budget", "type": "budgets"},
+        ],
+        "gate": {"min_overall_score": 0.0},
+    }
+    path = tmp_path / "cfg.yml"
+    path.write_text(json.dumps(cfg))
+    return str(path)
+
+
+def test_sharded_merge_matches_full_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = _suite(tmp_path)
+    opts = dict(config=config, clear_cache=False, jobs=1, incremental=False)
+    run(output=str(tmp_path / "full.json"), shard=None, **opts)
+    parts = []
+    for i in (1, 2, 3):
+        part = tmp_path / f"part{i}.json"
+        run(output=str(part), shard=f"{i}/3", **opts)
+        parts.append(str(part))
+    merge(partials=parts, config=config, output=str(tmp_path / "merged.json"))
+
+    full = json.loads((tmp_path / "full.json").read_text())
+    merged = json.loads((tmp_path / "merged.json").read_text())
+    assert sorted(merged["failures"]) == sorted(full["failures"])
+    assert merged["latency"] == full["latency"]
+    assert merged["cost"] == pytest.approx(full["cost"])
+    assert merged["tables"] == full["tables"]
+    for m, f in zip(merged["scores"], full["scores"]):
+        assert m["name"] == f["name"]
+        assert m["score"] == pytest.approx(f["score"])
+    assert merged["scores"][1]["metrics"] == full["scores"][1]["metrics"]
+
+    with pytest.raises(typer.Exit):
+        merge(partials=parts[:2], config=config, output=str(tmp_path / "bad.json"))
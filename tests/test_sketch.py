@@ -0,0 +1,57 @@
+import pathlib
+import random
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate.sketch import QuantileSketch
+
+
+def _exact(values, q):
+    xs = sorted(values)
+    return xs[int(round(q * (len(xs) - 1)))]
+
+
+def test_small_samples_are_exact_and_merge_exactly():
+    a, b = QuantileSketch(), QuantileSketch()
+    a.extend([80, 120, 0])
+    b.extend([300, 50])
+    a.merge(QuantileSketch.from_dict(b.to_dict()))
+    assert a.exact
+    assert a.quantile(0.5) == 80
+    assert a.quantile(0.95) == 300
+    assert a.mean == 110
+
+
+def test_exact_sketches_merging_past_limit_count_each_value_once():
+    a, b = QuantileSketch(), QuantileSketch()
+    a.extend([1000.0] * 1500)
+    b.extend([1.0] * 1500)
+    a.merge(QuantileSketch.from_dict(b.to_dict()))
+    assert not a.exact
+    assert a.count == 3000
+    assert sum(a.to_dict()["buckets"].values()) == 3000
+    assert a.quantile(0.4) == 1.0
+    for q in (0.6, 0.9):
+        assert abs(a.quantile(q) - 1000.0) <= 0.01 * 1000.0
+
+
+def test_large_samples_stay_within_relative_error_and_merge():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(5, 1.2) for _ in range(50_000)] + [0.0] * 100
+    whole = QuantileSketch()
+    whole.extend(values)
+    parts = [QuantileSketch() for _ in range(4)]
+    for i, v in enumerate(values):
+        parts[i % 4].add(v)
+    merged = QuantileSketch.from_dict(parts[0].to_dict())
+    for part in parts[1:]:
+        merged.merge(QuantileSketch.from_dict(part.to_dict()))
+    assert not whole.exact
+    assert len(whole.to_dict()["buckets"]) < 1000
+    for q in (0.5, 0.9, 0.95, 0.99, 0.999):
+        true = _exact(values, q)
+        assert abs(whole.quantile(q) - true) <= 0.01 * true
+        assert merged.quantile(q) == whole.quantile(q)
+    assert whole.quantile(0.0) == 0.0
+    assert whole.quantile(1.0) == max(values)
@@ -0,0 +1,76 @@
+import gzip
+import json
+import pathlib
+import sys
+
+import pytest
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate import sources, util
+from evalgate.config import Fixtures, Outputs
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def test_load_pairs_skips_unmatched_files(tmp_path, monkeypatch):
+    for n in ("a", "b", "c"):
+        _write(tmp_path / "fx" / f"{n}.json", {"n": n})
+    for n in ("b", "c", "d"):
+        _write(tmp_path / "out" / f"{n}.json", {"o": n})
+    read = []
+    original = util.read_json
+    monkeypatch.setattr(util, "read_json", lambda p: read.append(p) or original(p))
+
+    fixtures, outputs = sources.load_pairs(
+        Fixtures(path=str(tmp_path / "fx" / "*.json")),
+        Outputs(path=str(tmp_path / "out" / "*.json")),
+    )
+    assert fixtures == {"b": {"n": "b"}, "c": {"n": "c"}}
+    assert outputs == {"b": {"o": "b"}, "c": {"o": "c"}}
+    assert sorted(pathlib.Path(p).stem for p in read) == ["b", "b", "c", "c"]
+
+
+def test_load_pairs_joins_jsonl_corpora(tmp_path):
+    for n in ("a", "b", "c"):
+        _write(tmp_path / "fx" / f"{n}.json", {"expected": {"label": n}})
+    with gzip.open(tmp_path / "out.jsonl.gz", "wt", encoding="utf-8") as f:
+        for n in ("c", "x", "a", "b"):
+            f.write(json.dumps({"item": n, "label": n.upper()}) + "\n\n")
+    (tmp_path / "patch.ndjson").write_text(json.dumps({"item": "b", "label": "B2"}) + "\n")
+
+    fixtures, outputs = sources.load_pairs(
+        Fixtures(path=str(tmp_path / "fx" / "*.json")),
+        Outputs(path=str(tmp_path / "*.*json*"), key_field="item"),
+        select=lambda names: names[1:],
+    )
+    assert list(fixtures) == list(outputs) == ["b", "c"]
+    assert outputs == {"b": {"label": "B2"}, "c": {"label": "C"}}
+
+
+def test_jsonl_record_without_key_is_an_error(tmp_path):
+    (tmp_path / "fx.jsonl").write_text('{"id": "a"}\n{"name": "b"}\n')
+    with pytest.raises(ValueError, match="fx.jsonl:2"):
+        sources.scan(str(tmp_path / "fx.jsonl"), "id")
+
+
+def test_scan_reads_only_keys_and_load_parses_selected_records(tmp_path, monkeypatch):
+    lines = [json.dumps({"id": f"r{i}", "text": "x" * 50}) for i in range(5)]
+    lines.append(json.dumps({"text": "late key", "id": "r5"}))
+    (tmp_path / "corpus.jsonl").write_text("\n".join(lines) + "\n")
+    parsed = []
+    original = sources.loads_json
+    monkeypatch.setattr(sources, "loads_json", lambda b: parsed.append(b) or original(b))
+
+    index = sources.scan(str(tmp_path / "corpus.jsonl"), "id")
+    assert list(index) == [f"r{i}" for i in range(6)]
+    assert len(parsed) == 1  # only the record whose key is not its first member
+
+    parsed.clear()
+    records = sources.load(index, ["r3", "r5"], "id")
+    assert records == {"r3": {"text": "x" * 50}, "r5": {"text": "late key"}}
+    assert len(parsed) == 2
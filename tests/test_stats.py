@@ -0,0 +1,69 @@
+import json
+import pathlib
+import sys
+
+import numpy as np
+import pytest
+import typer
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate import cli, stats
+from evalgate.config import Config
+
+
+def test_score_ci_brackets_mean_for_binary_and_continuous_items():
+    rng = np.random.default_rng(3)
+    binary = {f"i{i}": float(v) for i, v in enumerate(rng.random(500) < 0.8)}
+    continuous = {f"i{i}": float(v) for i, v in enumerate(rng.random(500))}
+    for items in (binary, continuous):
+        mean = sum(items.values()) / len(items)
+        lo, hi = stats.score_ci(items)
+        assert lo < mean < hi
+        assert hi - lo < 0.12
+        assert stats.score_ci(items) == (lo, hi)  # deterministic
+    assert stats.score_ci({"only": 1.0}) is None
+
+
+def test_paired_delta_ci_is_tighter_than_unpaired():
+    rng = np.random.default_rng(4)
+    base = {f"i{i}": float(v) for i, v in enumerate(rng.random(400))}
+    current = {k: v - 0.01 + rng.normal(0, 0.005) for k, v in base.items()}
+    lo, hi = stats.delta_ci(current, base)
+    assert hi < 0  # consistent small drop is significant when paired
+    renamed = {f"x{k}": v for k, v in base.items()}
+    lo_u, hi_u = stats.delta_ci(current, renamed)
+    assert lo_u < 0 < hi_u
+
+
+def _gate(tmp_path, monkeypatch, significance):
+    current = {f"i{i}": float(i % 4 != 0) for i in range(20)}  # 0.75
+    baseline = {"scores": [{"name": "acc", "score": 0.8, "items": {f"i{i}": float(i % 5 != 0) for i in range(20)}}]}
+    monkeypatch.setattr(cli, "load_baseline", lambda ref, path: baseline)
+    cfg = Config.model_validate({
+        "budgets": {"p95_latency_ms": 1000, "max_cost_usd_per_item": 1},
+        "fixtures": {"path": "x"},
+        "outputs": {"path": "y"},
+        "evaluators": [{"name": "acc", "type": "category", "expected_field": "label"}],
+        "gate": {"min_overall_score": 0.5, "significance": significance},
+    })
+    out = tmp_path / "results.json"
+    records = [{"name": "acc", "score": 0.75, "failures": [], "extra": {"items": current}}]
+    try:
+        cli._gate(cfg, records, [], str(out))
+    except typer.Exit:
+        pass
+    return json.loads(out.read_text())
+
+
+def test_significance_gate_ignores_noisy_drop(tmp_path, monkeypatch):
+    strict = _gate(tmp_path, monkeypatch, significance=False)
+    assert strict["regression_ok"] is False
+    assert "ci" not in strict["scores"][0] and "delta_ci" not in strict["scores"][0]  # no bootstrap unless gating on it
+    lenient = _gate(tmp_path, monkeypatch, significance=True)
+    assert lenient["regression_ok"] is True and lenient["gate"]["passed"] is True
+    score = lenient["scores"][0]
+    assert score["delta"] == pytest.approx(-0.05)
+    assert score["delta_ci"][0] < 0 < score["delta_ci"][1]
+    assert score["ci"][0] < 0.75 < score["ci"][1]
+    assert len(score["items"]) == 20
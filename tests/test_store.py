@@ -0,0 +1,135 @@
+import json
+import pathlib
+import subprocess
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate import store
+from evalgate.report import render_markdown
+
+
+def _git(cwd, *args):
+    return subprocess.check_output(["git", *args], cwd=cwd, text=True).strip()
+
+
+def _repo(tmp_path):
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "ci@example.com")
+    _git(tmp_path, "config", "user.name", "ci")
+    results = {"scores": [{"name": "acc", "score": 0.5, "items": {"a": 1.0, "b": 0.0}}]}
+    (tmp_path / ".evalgate").mkdir()
+    (tmp_path / ".evalgate" / "results.json").write_text(json.dumps(results))
+    _git(tmp_path, "add", ".evalgate/results.json")
+    _git(tmp_path, "commit", "-q", "-m", "baseline")
+    return results
+
+
+def test_baseline_is_cached_by_commit(tmp_path, monkeypatch):
+    results = _repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    assert store.load_baseline("main", ".evalgate/results.json") == results
+    sha = _git(tmp_path, "rev-parse", "HEAD")
+    assert [p.name.split("-")[0] for p in store.CACHE_DIR.glob("*.json")] == [sha]
+
+    monkeypatch.setattr(store, "git_show", lambda ref_path: None)
+    index = store.index_scores(store.load_baseline("main", ".evalgate/results.json"))
+    assert index["acc"]["items"] == {"a": 1.0, "b": 0.0}
+    assert store.load_baseline("no-such-ref", ".evalgate/results.json") is None
+
+
+def test_item_flips_are_listed_in_report():
+    flips = store.item_flips({"a": 0.0, "b": 1.0, "c": 1.0, "new": 0.0}, {"a": 1.0, "b": 0.0, "c": 1.0})
+    assert flips == {"to_fail": ["a"], "to_pass": ["b"]}
+    result = {
+        "overall": 0.5,
+        "scores": [{"name": "acc", "score": 0.5, "delta": 0.0, "passed": True, "flips": flips}],
+        "failures": [],
+        "gate": {"min_overall_score": 0.5, "allow_regression": False, "passed": True},
+    }
+    md = render_markdown(result)
+    assert "- acc: 1 pass → fail, 1 fail → pass" in md
+    assert "  - ❌ a" in md
+
+
+def _clone_with_remote(tmp_path):
+    remote = tmp_path / "remote.git"
+    _git(tmp_path, "init", "-q", "--bare", "-b", "main", str(remote))
+    work = tmp_path / "work"
+    work.mkdir()
+    _repo(work)
+    (work / "app.py").write_text("print('v1')\n")
+    _git(work, "add", "app.py")
+    _git(work, "commit", "-q", "-m", "app")
+    _git(work, "remote", "add", "origin", str(remote))
+    _git(work, "push", "-q", "origin", "main")
+    _git(work, "fetch", "-q", "origin")
+    _git(work, "checkout", "-q", "-b", "feature")
+    return remote, work
+
+
+def test_commit_baseline_pushes_without_touching_worktree(tmp_path, monkeypatch):
+    remote, work = _clone_with_remote(tmp_path)
+    monkeypatch.chdir(work)
+    (work / "app.py").write_text("print('uncommitted')\n")
+    new = {"scores": [{"name": "acc", "score": 1.0}]}
+    (work / ".evalgate" / "results.json").write_text(json.dumps(new))
+    before = _git(work, "rev-parse", "HEAD")
+
+    sha = store.commit_baseline("origin/main", ".evalgate/results.json", "Update baseline")
+
+    assert _git(remote, "rev-parse", "main") == sha
+    assert json.loads(_git(remote, "show", "main:.evalgate/results.json")) == new
+    assert _git(remote, "show", "main:app.py") == "print('v1')"
+    assert _git(remote, "log", "--format=%s", "-1", "main") == "Update baseline"
+    assert _git(work, "rev-parse", "HEAD") == before
+    assert _git(work, "rev-parse", "--abbrev-ref", "HEAD") == "feature"
+    assert (work / "app.py").read_text() == "print('uncommitted')\n"
+
+
+def test_commit_baseline_to_local_branch(tmp_path, monkeypatch):
+    _repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    _git(tmp_path, "checkout", "-q", "-b", "feature")
+    (tmp_path / ".evalgate" / "results.json").write_text('{"scores": []}')
+    parent = _git(tmp_path, "rev-parse", "main")
+    sha = store.commit_baseline("main", ".evalgate/results.json", "baseline")
+    assert _git(tmp_path, "rev-parse", "main") == sha
+    assert _git(tmp_path, "rev-parse", "main^") == parent
+    assert _git(tmp_path, "show", "main:.evalgate/results.json") == '{"scores": []}'
+
+
+def test_baseline_update_refuses_failed_runs(tmp_path, monkeypatch):
+    import pytest
+    import typer
+    from evalgate import cli
+
+    _repo(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    config = tmp_path / "evalgate.yml"
+    config.write_text(
+        "budgets: {p95_latency_ms: 1000, max_cost_usd_per_item: 0.1}\n"
+        "fixtures: {path: 'fx/*.json'}\noutputs: {path: 'out/*.json'}\nevaluators: []\n"
+        "gate: {min_overall_score: 0.9}\nreport: {artifact_path: .evalgate/results.json}\n"
+        "baseline: {ref: main}\n"
+    )
+    results = {"overall": 0.5, "scores": [], "evaluator_errors": []}
+
+    def failing_run(**kwargs):
+        pathlib.Path(kwargs["output"]).write_text(json.dumps(results))
+        raise typer.Exit(1)
+
+    monkeypatch.setattr(cli, "run", failing_run)
+    committed = []
+    monkeypatch.setattr(cli, "commit_baseline", lambda *args: committed.append(args) or "0" * 40)
+
+    with pytest.raises(typer.Exit):
+        cli.baseline_update(config=str(config), message="m", allow_failing=False)
+    results["evaluator_errors"] = ["Evaluator 'acc' failed to run: boom"]
+    with pytest.raises(typer.Exit):
+        cli.baseline_update(config=str(config), message="m", allow_failing=True)
+    assert committed == []
+
+    results["evaluator_errors"] = []
+    cli.baseline_update(config=str(config), message="m", allow_failing=True)
+    assert committed == [("main", ".evalgate/results.json", "m")]
@@ -0,0 +1,21 @@
+import json
+import pathlib
+import sys
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate import util
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data) if not isinstance(data, str) else data, encoding="utf-8")
+    return str(path)
+
+
+def test_read_json_falls_back_for_non_standard_json(tmp_path):
+    path = _write(tmp_path / "x.json", '{"v": NaN, "big": 123456789012345678901234567890, "s": "é"}')
+    data = util.read_json(path)
+    assert data["big"] == 123456789012345678901234567890
+    assert data["v"] != data["v"]
+    assert data["s"] == "é"
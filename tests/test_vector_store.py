@@ -0,0 +1,56 @@
+import pathlib
+import sys
+
+import numpy as np
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from evalgate.evaluators import embedding_similarity as es
+from evalgate.vector_store import VectorStore
+
+
+def _encoder(calls):
+    def encode(texts):
+        calls.append(list(texts))
+        return np.array([[len(t), 1.0, 0.5] for t in texts], dtype=np.float32)
+    return encode
+
+
+def test_vector_store_encodes_only_unseen_texts(tmp_path):
+    calls = []
+    store = VectorStore("m", root=tmp_path)
+    first = store.get(["a", "bb"], _encoder(calls))
+    again = VectorStore("m", root=tmp_path).get(["bb", "ccc", "a"], _encoder(calls))
+    assert calls == [["a", "bb"], ["ccc"]]
+    assert np.array_equal(again[[2, 0]], first)
+    assert again[1].tolist() == [3.0, 1.0, 0.5]
+    assert len(VectorStore("other", root=tmp_path)) == 0
+
+
+def test_vector_store_ignores_torn_append(tmp_path):
+    store = VectorStore("m", root=tmp_path)
+    store.get(["a"], _encoder([]))
+    with open(store.dir / "vectors.bin", "ab") as f:
+        f.write(b"\0" * 7)  # rows written, keys never were
+    calls = []
+    reopened = VectorStore("m", root=tmp_path)
+    assert len(reopened) == 1
+    out = reopened.get(["a", "dd"], _encoder(calls))
+    assert calls == [["dd"]]
+    assert out.tolist() == [[1.0, 1.0, 0.5], [2.0, 1.0, 0.5]]
+
+
+def test_embedding_evaluator_skips_model_when_vectors_cached(tmp_path, monkeypatch):
+    class Model:
+        def encode(self, texts, batch_size=32, normalize_embeddings=True):
+            return [[1.0, 0.0] if t == "match" else [0.0, 1.0] for t in texts]
+
+    loads = []
+    monkeypatch.setattr(es, "_get_model", lambda name, *args: loads.append(name) or Model())
+    outputs = {"a": {"t": "match"}, "b": {"t": "other"}}
+    fixtures = {"a": {"expected": {"t": "match"}}, "b": {"expected": {"t": "match"}}}
+    kwargs = dict(field="t", model_name="m", threshold=0.5)
+    first = es.evaluate(outputs, fixtures, store=VectorStore("m", root=tmp_path), **kwargs)
+    loads.clear()
+    assert es.evaluate(outputs, fixtures, store=VectorStore("m", root=tmp_path), **kwargs) == first
+    assert loads == []